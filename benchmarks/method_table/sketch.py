@@ -0,0 +1,37 @@
+"""
+Method Table Benchmark
+
+Measures the per-call overhead of the hot drawing wrappers when every call
+looks up the method on the p5 JsProxy versus using the method table that the
+sketch resolves once at startup.
+"""
+import timeit
+
+from proceso import Sketch
+
+
+p5 = Sketch()
+p5.create_canvas(400, 400)
+
+CALLS = 10_000
+REPEATS = 5
+
+table = p5._p5js
+proxy = table._p5js
+
+cases = {
+    "circle": (lambda: proxy.circle(200, 200, 10), lambda: table.circle(200, 200, 10)),
+    "fill": (lambda: proxy.fill(255), lambda: table.fill(255)),
+    "vertex": (lambda: proxy.vertex(200, 200), lambda: table.vertex(200, 200)),
+    "translate": (lambda: proxy.translate(0, 0), lambda: table.translate(0, 0)),
+}
+
+print(f"{'method':<12}{'proxy (us)':>12}{'table (us)':>12}{'speedup':>10}")
+for name, (before, after) in cases.items():
+    if name == "vertex":
+        p5.begin_shape()
+    before_us = min(timeit.repeat(before, number=CALLS, repeat=REPEATS)) / CALLS * 1e6
+    after_us = min(timeit.repeat(after, number=CALLS, repeat=REPEATS)) / CALLS * 1e6
+    if name == "vertex":
+        p5.end_shape()
+    print(f"{name:<12}{before_us:>12.2f}{after_us:>12.2f}{before_us / after_us:>9.2f}x")
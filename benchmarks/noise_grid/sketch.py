@@ -0,0 +1,31 @@
+"""
+Noise Grid Benchmark
+
+Fills a 720x400 field of Perlin noise, once by calling noise() for every cell
+and once with a single call to noise_grid(), and reports the time per field.
+"""
+import timeit
+
+from proceso import Sketch
+
+
+p5 = Sketch()
+
+W = 720
+H = 400
+STEP = 0.01
+REPEATS = 3
+
+
+def field_loop():
+    return [[p5.noise(i * STEP, j * STEP) for i in range(W)] for j in range(H)]
+
+
+def field_grid():
+    return p5.noise_grid(0, 0, STEP, STEP, W, H)
+
+
+print(f"{'field':<10}{'ms per field':>14}")
+for name, field in [("loop", field_loop), ("grid", field_grid)]:
+    ms = min(timeit.repeat(field, number=1, repeat=REPEATS)) * 1e3
+    print(f"{name:<10}{ms:>14.2f}")
@@ -0,0 +1,200 @@
+"""
+Frame Benchmarks
+
+Runs each sketch in examples/ against proceso's headless backend and reports,
+per sketch, the wall time per frame, the number of calls to p5 per frame
+broken down by method, memory allocated per frame, and peak memory. Results
+are printed as JSON so that runs against different versions of proceso can be
+compared.
+
+    python benchmarks/run.py --frames 60 --output results.json
+    python benchmarks/run.py --sketch "flocking*"
+
+proceso must be importable, for example after running pip install -e . from
+the root of the repository.
+
+Timing and memory are measured in separate passes over the same number of
+frames because tracing memory allocations slows Python down considerably.
+"""
+import argparse
+import fnmatch
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from collections import Counter
+from importlib import metadata
+from pathlib import Path
+
+os.environ.setdefault("PROCESO_BACKEND", "headless")
+
+EXAMPLES = Path(__file__).resolve().parent.parent / "examples"
+
+# Scaled versions of examples: name -> (example, source replacements, frames).
+# frames caps the number of frames for variants that are too slow to run for
+# the full count.
+VARIANTS = {
+    "flocking_200": ("flocking", {"range(20)": "range(200)"}, 10),
+    "flocking_2000": ("flocking", {"range(20)": "range(2000)"}, 1),
+    "sync_100": ("sync", {"num_bugs = 10": "num_bugs = 100"}, None),
+    "flocking_200_python_vectors": (
+        "flocking",
+        {
+            "range(20)": "range(200)",
+            "Sketch(buffered=True)": 'Sketch(buffered=True, vectors="python")',
+        },
+        10,
+    ),
+}
+
+
+def find_sketches() -> dict[str, tuple[Path, dict[str, str], int | None]]:
+    sketches = {}
+    for path in sorted(EXAMPLES.glob("*/sketch.py")):
+        sketches[path.parent.name] = (path, {}, None)
+    for name, (example, replacements, frames) in VARIANTS.items():
+        sketches[name] = (EXAMPLES / example / "sketch.py", replacements, frames)
+    return sketches
+
+
+def load_sketch(path: Path, replacements: dict[str, str]):
+    """Runs a sketch's source and returns the headless p5 instance it created."""
+    from proceso.backend import headless
+
+    source = path.read_text()
+    for old, new in replacements.items():
+        if old not in source:
+            raise RuntimeError(f"{old!r} not found in {path}")
+        source = source.replace(old, new)
+
+    headless.instances.clear()
+    cwd = os.getcwd()
+    os.chdir(path.parent)
+    try:
+        namespace = {"__name__": "__main__", "__file__": str(path)}
+        exec(compile(source, str(path), "exec"), namespace)
+    finally:
+        os.chdir(cwd)
+    if len(headless.instances) != 1:
+        raise RuntimeError(f"Expected {path} to create one sketch")
+    return next(iter(headless.instances.values()))
+
+
+def per_frame(counter: Counter, frames: int) -> dict[str, float]:
+    return {name: count / frames for name, count in counter.most_common()}
+
+
+def run_sketch(path: Path, replacements: dict[str, str], frames: int) -> dict:
+    start = time.perf_counter()
+    p5js = load_sketch(path, replacements)
+    setup_ms = (time.perf_counter() - start) * 1000
+    setup_calls = +p5js.calls
+
+    if not callable(p5js.draw) or not p5js.isLooping():
+        frames = 0
+    result = {
+        "frames": frames,
+        "setup_ms": setup_ms,
+        "setup_calls": sum(setup_calls.values()),
+    }
+    if frames == 0:
+        return result
+
+    # Timing
+    before = p5js.calls.copy()
+    before_replayed = p5js.replayed.copy()
+    times = []
+    for _ in range(frames):
+        start = time.perf_counter()
+        p5js.redraw()
+        times.append((time.perf_counter() - start) * 1000)
+    calls = p5js.calls - before
+    del calls["redraw"]
+    replayed = p5js.replayed - before_replayed
+
+    # Memory
+    tracemalloc.start()
+    start_bytes, _ = tracemalloc.get_traced_memory()
+    tracemalloc.reset_peak()
+    before_snapshot = tracemalloc.take_snapshot()
+    for _ in range(frames):
+        p5js.redraw()
+    after_snapshot = tracemalloc.take_snapshot()
+    _, peak_bytes = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    diff = after_snapshot.compare_to(before_snapshot, "filename")
+
+    result.update(
+        {
+            "frame_ms": {
+                "mean": statistics.fmean(times),
+                "median": statistics.median(times),
+                "min": min(times),
+                "max": max(times),
+            },
+            "calls_per_frame": sum(calls.values()) / frames,
+            "calls_by_method": per_frame(calls, frames),
+            "replayed_per_frame": sum(replayed.values()) / frames,
+            "allocated_blocks_per_frame": sum(
+                stat.count_diff for stat in diff if stat.count_diff > 0
+            )
+            / frames,
+            "allocated_bytes_per_frame": sum(
+                stat.size_diff for stat in diff if stat.size_diff > 0
+            )
+            / frames,
+            "peak_bytes": peak_bytes - start_bytes,
+        }
+    )
+    return result
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument(
+        "--frames", type=int, default=60, help="frames to run per sketch"
+    )
+    parser.add_argument(
+        "--sketch",
+        action="append",
+        help="only run sketches whose name matches this pattern (repeatable)",
+    )
+    parser.add_argument("--output", help="write JSON to this file")
+    args = parser.parse_args(argv)
+
+    import proceso.backend
+
+    if proceso.backend.BACKEND != "headless":
+        parser.error("benchmarks must be run with the headless backend")
+    try:
+        version = metadata.version("proceso")
+    except metadata.PackageNotFoundError:
+        version = "unknown"
+
+    results = {
+        "proceso": version,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "sketches": {},
+    }
+    for name, (path, replacements, frames) in find_sketches().items():
+        if args.sketch and not any(
+            fnmatch.fnmatch(name, pattern) for pattern in args.sketch
+        ):
+            continue
+        print(f"Running {name}...", file=sys.stderr)
+        frames = min(args.frames, frames or args.frames)
+        results["sketches"][name] = run_sketch(path, replacements, frames)
+
+    output = json.dumps(results, indent=2)
+    if args.output:
+        Path(args.output).write_text(output + "\n")
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Slotted Vector Benchmark
+
+Compares common vector operations between the default numpy-backed vectors
+and the slotted vectors that Sketch(vectors="python") creates, which store
+2D and 3D values as plain Python floats.
+"""
+import timeit
+
+from proceso import Sketch
+
+
+numpy_p5 = Sketch("numpyCanvas")
+python_p5 = Sketch("pythonCanvas", vectors="python")
+
+CALLS = 10_000
+REPEATS = 5
+
+
+def make_cases(p5):
+    a2, b2 = p5.Vector(1.0, 2.0), p5.Vector(3.0, 4.0)
+    a3, b3 = p5.Vector(1.0, 2.0, 3.0), p5.Vector(3.0, 4.0, 5.0)
+    total = [p5.Vector(0.0, 0.0)]
+
+    def accumulate():
+        total[0] += b2
+
+    def limit():
+        a2.copy.set_limit(0.5)
+
+    return {
+        "Vector(x, y)": lambda: p5.Vector(1.5, 2.5),
+        "Vector(x, y, z)": lambda: p5.Vector(1.5, 2.5, 3.5),
+        "a + b (2D)": lambda: a2 + b2,
+        "a + b (3D)": lambda: a3 + b3,
+        "a += b (2D)": accumulate,
+        "a * k (2D)": lambda: a2 * 0.5,
+        "a.mag (2D)": lambda: a2.mag,
+        "a.dist(b) (2D)": lambda: a2.dist(b2),
+        "a.dot(b) (3D)": lambda: a3.dot(b3),
+        "a.cross(b) (3D)": lambda: a3.cross(b3),
+        "a.copy.set_limit()": limit,
+        "a.norm (3D)": lambda: a3.norm,
+        "a.yx (swizzle)": lambda: a2.yx,
+        "a.x (read)": lambda: a2.x,
+    }
+
+
+numpy_cases = make_cases(numpy_p5)
+python_cases = make_cases(python_p5)
+
+print(f"{'operation':<20}{'numpy (us)':>12}{'python (us)':>13}{'speedup':>10}")
+for name in numpy_cases:
+    before_us = (
+        min(timeit.repeat(numpy_cases[name], number=CALLS, repeat=REPEATS))
+        / CALLS
+        * 1e6
+    )
+    after_us = (
+        min(timeit.repeat(python_cases[name], number=CALLS, repeat=REPEATS))
+        / CALLS
+        * 1e6
+    )
+    print(f"{name:<20}{before_us:>12.2f}{after_us:>13.2f}{before_us / after_us:>9.2f}x")
@@ -0,0 +1,38 @@
+"""
+Spatial Index Benchmark
+
+Measures how long it takes to find every pair of points within a radius, as
+a flock does each frame, by comparing all points with each other and by
+building a HashGrid or KDTree and querying it.
+"""
+import timeit
+
+import numpy as np
+
+from proceso import Sketch
+
+
+p5 = Sketch()
+
+REPEATS = 3
+RADIUS = 25
+rng = np.random.default_rng(0)
+
+
+def brute_force(points):
+    diff = points[:, np.newaxis, :] - points[np.newaxis, :, :]
+    dist = np.sqrt(np.sum(diff**2, axis=-1))
+    np.fill_diagonal(dist, np.inf)
+    return np.nonzero(dist <= RADIUS)
+
+
+print(f"{'points':<8}{'all pairs (ms)':>16}{'HashGrid (ms)':>15}{'KDTree (ms)':>13}")
+for count in [200, 1_000, 4_000]:
+    points = rng.random((count, 2)) * [720, 400]
+    cases = [
+        lambda: brute_force(points),
+        lambda: p5.HashGrid(points, RADIUS).query_pairs(RADIUS),
+        lambda: p5.KDTree(points).query_pairs(RADIUS),
+    ]
+    times = [min(timeit.repeat(case, number=1, repeat=REPEATS)) * 1e3 for case in cases]
+    print(f"{count:<8}{times[0]:>16.2f}{times[1]:>15.2f}{times[2]:>13.2f}")
@@ -0,0 +1,54 @@
+"""
+System Variables Benchmark
+
+Measures the fixed per-frame cost of reading system variables with the
+"lazy" and "packed" strategies, compared with copying every variable from
+p5 one property at a time before each frame.
+"""
+import timeit
+
+from proceso import Sketch
+from proceso.sysvars import PACKED_SYSTEM_VARIABLES, SystemVariables
+
+
+lazy = Sketch("lazySketch")
+packed = Sketch("packedSketch", system_variables="packed")
+
+FRAMES = 1_000
+REPEATS = 5
+
+numeric = [name for name, _ in PACKED_SYSTEM_VARIABLES]
+everything = [
+    name
+    for name, value in vars(SystemVariables).items()
+    if hasattr(value, "js_name")
+]
+proxy = lazy._p5js._p5js
+
+
+def eager_frame():
+    for name in everything:
+        getattr(proxy, getattr(SystemVariables, name).js_name)
+
+
+def frame(sketch, names):
+    def run():
+        sketch._update_system_variables()
+        for name in names:
+            getattr(sketch, name)
+
+    return run
+
+
+cases = {
+    "eager, all variables": eager_frame,
+    "lazy, mouse_x and mouse_y": frame(lazy, ["mouse_x", "mouse_y"]),
+    "lazy, all numeric": frame(lazy, numeric),
+    "packed, mouse_x and mouse_y": frame(packed, ["mouse_x", "mouse_y"]),
+    "packed, all numeric": frame(packed, numeric),
+}
+
+print(f"{'strategy':<32}{'per frame (us)':>16}")
+for name, run in cases.items():
+    seconds = min(timeit.repeat(run, number=FRAMES, repeat=REPEATS))
+    print(f"{name:<32}{seconds / FRAMES * 1e6:>16.2f}")
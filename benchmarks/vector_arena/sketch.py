@@ -0,0 +1,50 @@
+"""
+Vector Arena Benchmark
+
+Simulates a frame that creates 1,000 temporary vectors, once by creating new
+vectors and once by taking them from a VectorArena that is reset each frame,
+and reports the time per frame and the peak memory used during a frame.
+"""
+import timeit
+import tracemalloc
+
+from proceso import Sketch
+
+
+p5 = Sketch()
+
+COUNT = 1_000
+FRAMES = 20
+REPEATS = 5
+
+velocity = p5.Vector(0.5, 0.25)
+arena = p5.Vector.arena(COUNT, 2)
+kept = []
+
+
+def frame_new():
+    kept.clear()
+    for i in range(COUNT):
+        v = p5.Vector(1.0, 2.0)
+        v.add_scaled(velocity, 0.5)
+        kept.append(v)
+
+
+def frame_arena():
+    arena.reset()
+    kept.clear()
+    for i in range(COUNT):
+        v = arena.new(1.0, 2.0)
+        v.add_scaled(velocity, 0.5)
+        kept.append(v)
+
+
+print(f"{'frame':<10}{'ms per frame':>14}{'peak memory (KiB)':>19}")
+for name, frame in [("new", frame_new), ("arena", frame_arena)]:
+    frame()
+    tracemalloc.start()
+    frame()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    ms = min(timeit.repeat(frame, number=FRAMES, repeat=REPEATS)) / FRAMES * 1e3
+    print(f"{name:<10}{ms:>14.2f}{peak / 1024:>19.1f}")
@@ -0,0 +1,48 @@
+"""
+Vector Construction Benchmark
+
+Measures the cost of creating vectors and of arithmetic that returns a new
+vector. Plain numbers and internal results take a fast path that skips
+validation; the "validated" column runs the same work through the general
+constructor for comparison.
+"""
+import timeit
+
+import numpy as np
+
+from proceso import Sketch
+
+
+p5 = Sketch()
+
+CALLS = 10_000
+REPEATS = 5
+
+a2, b2 = p5.Vector(1.0, 2.0), p5.Vector(3.0, 4.0)
+a3, b3 = p5.Vector(1.0, 2.0, 3.0), p5.Vector(3.0, 4.0, 5.0)
+x = np.float64(1.5)
+
+cases = {
+    "Vector2D(x, y)": (
+        lambda: p5.Vector2D(x, 2.5),
+        lambda: p5.Vector2D(1.5, 2.5),
+    ),
+    "Vector3D(x, y, z)": (
+        lambda: p5.Vector3D(x, 2.5, 3.5),
+        lambda: p5.Vector3D(1.5, 2.5, 3.5),
+    ),
+    "a + b (2D)": (
+        lambda: p5.Vector(a2.data + b2.data, copy=False),
+        lambda: a2 + b2,
+    ),
+    "a + b (3D)": (
+        lambda: p5.Vector(a3.data + b3.data, copy=False),
+        lambda: a3 + b3,
+    ),
+}
+
+print(f"{'operation':<20}{'validated (us)':>16}{'fast (us)':>12}{'speedup':>10}")
+for name, (before, after) in cases.items():
+    before_us = min(timeit.repeat(before, number=CALLS, repeat=REPEATS)) / CALLS * 1e6
+    after_us = min(timeit.repeat(after, number=CALLS, repeat=REPEATS)) / CALLS * 1e6
+    print(f"{name:<20}{before_us:>16.2f}{after_us:>12.2f}{before_us / after_us:>9.2f}x")
@@ -10,7 +10,7 @@ From natureofcode.com.
 from proceso import Sketch
 
 
-p5 = Sketch()
+p5 = Sketch(buffered=True)
 p5.describe("Twenty gray circles moving like a flock of birds on a gray background.")
 
 boids = []
@@ -10,7 +10,7 @@ Aatish Bhatia, inspired by Orbiters by Dave Whyte.
 from proceso import Sketch
 
 
-p5 = Sketch()
+p5 = Sketch(buffered=True)
 p5.describe("A grid of green spirals on a black background. The spirals change their motion based on the mouse position.")
 
 
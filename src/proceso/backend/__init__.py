@@ -0,0 +1,54 @@
+"""Connects sketches to p5.
+
+In the browser, proceso drives p5.js through Pyodide's js and pyodide modules.
+Everywhere else, such as a plain CPython interpreter, it falls back to a
+headless stand-in for p5 so that sketches can be run, tested, and benchmarked
+without a browser. Set the PROCESO_BACKEND environment variable to "browser"
+or "headless" to choose one explicitly.
+"""
+import os
+
+BACKEND = os.environ.get("PROCESO_BACKEND")
+if BACKEND is None:
+    try:
+        import js  # noqa: F401
+
+        BACKEND = "browser"
+    except ImportError:
+        BACKEND = "headless"
+
+if BACKEND == "browser":
+    from .browser import (
+        create_instance,
+        create_proxy,
+        release_buffers,
+        remove_instance,
+        set_canvas_id,
+        to_js,
+        to_js_buffer,
+    )
+elif BACKEND == "headless":
+    from .headless import (
+        create_instance,
+        create_proxy,
+        release_buffers,
+        remove_instance,
+        set_canvas_id,
+        to_js,
+        to_js_buffer,
+    )
+else:
+    raise RuntimeError(
+        f"PROCESO_BACKEND must be 'browser' or 'headless', not {BACKEND!r}"
+    )
+
+__all__ = [
+    "BACKEND",
+    "create_instance",
+    "create_proxy",
+    "release_buffers",
+    "remove_instance",
+    "set_canvas_id",
+    "to_js",
+    "to_js_buffer",
+]
@@ -0,0 +1,58 @@
+import js
+from pyodide.code import run_js
+from pyodide.ffi import create_proxy, to_js
+
+__all__ = [
+    "create_instance",
+    "create_proxy",
+    "release_buffers",
+    "remove_instance",
+    "set_canvas_id",
+    "to_js",
+    "to_js_buffer",
+]
+
+# Buffers handed to JavaScript by to_js_buffer() that haven't been released yet.
+_buffers = []
+
+
+def create_instance(id: str, extensions: str) -> object:
+    """Creates a p5 instance in instance mode and stores it as window[id]."""
+    run_js(extensions)
+    run_js(f"var {id} = " + "new p5(() => { });")
+    set_canvas_id(id)
+    return getattr(js.window, id)
+
+
+def remove_instance(id: str):
+    """Removes the p5 instance stored as window[id], if there is one."""
+    try:
+        old_sketch = getattr(js.window, id)
+        old_sketch.remove()
+    except AttributeError:
+        pass
+
+
+def set_canvas_id(id: str):
+    """Sets the id attribute of the instance's canvas element."""
+    run_js(f"{id}.canvas.setAttribute('id', '{id}');")
+
+
+def to_js_buffer(obj) -> object:
+    """Returns a typed array that shares memory with a numpy array or other buffer.
+
+    Nothing is copied, so the typed array sees later changes to obj. It stays
+    valid until release_buffers() is called, which sketches do at the end of
+    setup(), draw(), and each event function.
+    """
+    proxy = create_proxy(obj)
+    buffer = proxy.getBuffer()
+    proxy.destroy()
+    _buffers.append(buffer)
+    return buffer.data
+
+
+def release_buffers():
+    """Releases the buffers handed out by to_js_buffer()."""
+    while _buffers:
+        _buffers.pop().release()
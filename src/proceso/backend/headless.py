@@ -0,0 +1,731 @@
+import datetime
+import functools
+import math
+import time
+from array import array
+from collections import Counter
+from typing import Callable
+
+__all__ = [
+    "HeadlessElement",
+    "HeadlessP5",
+    "HeadlessProxy",
+    "create_instance",
+    "create_proxy",
+    "instances",
+    "release_buffers",
+    "remove_instance",
+    "set_canvas_id",
+    "to_js",
+    "to_js_buffer",
+]
+
+# Values of p5's constants, taken from p5.js 1.9.
+CONSTANTS = {
+    # GRAPHICS RENDERER
+    "P2D": "p2d",
+    "WEBGL": "webgl",
+    # TRIGONOMETRY
+    "HALF_PI": math.pi / 2,
+    "PI": math.pi,
+    "QUARTER_PI": math.pi / 4,
+    "TAU": math.tau,
+    "TWO_PI": math.tau,
+    "DEGREES": "degrees",
+    "RADIANS": "radians",
+    # SHAPE
+    "CORNER": "corner",
+    "CORNERS": "corners",
+    "RADIUS": "radius",
+    "RIGHT": "right",
+    "LEFT": "left",
+    "CENTER": "center",
+    "TOP": "top",
+    "BOTTOM": "bottom",
+    "BASELINE": "alphabetic",
+    "POINTS": 0x0000,
+    "LINES": 0x0001,
+    "LINE_STRIP": 0x0003,
+    "LINE_LOOP": 0x0002,
+    "TRIANGLES": 0x0004,
+    "TRIANGLE_FAN": 0x0006,
+    "TRIANGLE_STRIP": 0x0005,
+    "QUADS": "quads",
+    "QUAD_STRIP": "quad_strip",
+    "TESS": "tess",
+    "CLOSE": "close",
+    "OPEN": "open",
+    "CHORD": "chord",
+    "PIE": "pie",
+    "PROJECT": "square",
+    "SQUARE": "butt",
+    "ROUND": "round",
+    "BEVEL": "bevel",
+    "MITER": "miter",
+    # COLOR
+    "RGB": "rgb",
+    "HSB": "hsb",
+    "HSL": "hsl",
+    # DOM EXTENSION
+    "AUTO": "auto",
+    # INPUT
+    "ALT": 18,
+    "BACKSPACE": 8,
+    "CONTROL": 17,
+    "DELETE": 46,
+    "DOWN_ARROW": 40,
+    "ENTER": 13,
+    "ESCAPE": 27,
+    "LEFT_ARROW": 37,
+    "OPTION": 18,
+    "RETURN": 13,
+    "RIGHT_ARROW": 39,
+    "SHIFT": 16,
+    "TAB": 9,
+    "UP_ARROW": 38,
+    # RENDERING
+    "BLEND": "source-over",
+    "REMOVE": "destination-out",
+    "ADD": "lighter",
+    "DARKEST": "darken",
+    "LIGHTEST": "lighten",
+    "DIFFERENCE": "difference",
+    "SUBTRACT": "subtract",
+    "EXCLUSION": "exclusion",
+    "MULTIPLY": "multiply",
+    "SCREEN": "screen",
+    "REPLACE": "copy",
+    "OVERLAY": "overlay",
+    "HARD_LIGHT": "hard-light",
+    "SOFT_LIGHT": "soft-light",
+    "DODGE": "color-dodge",
+    "BURN": "color-burn",
+    # FILTERS
+    "THRESHOLD": "threshold",
+    "GRAY": "gray",
+    "OPAQUE": "opaque",
+    "INVERT": "invert",
+    "POSTERIZE": "posterize",
+    "DILATE": "dilate",
+    "ERODE": "erode",
+    "BLUR": "blur",
+    # TYPOGRAPHY
+    "NORMAL": "normal",
+    "ITALIC": "italic",
+    "BOLD": "bold",
+    "BOLDITALIC": "bold italic",
+    "CHAR": "CHAR",
+    "WORD": "WORD",
+    # VERTICES
+    "LINEAR": "linear",
+    "QUADRATIC": "quadratic",
+    "BEZIER": "bezier",
+    "CURVE": "curve",
+    # WEBGL DRAWMODES
+    "STROKE": "stroke",
+    "FILL": "fill",
+    "TEXTURE": "texture",
+    "IMMEDIATE": "immediate",
+    # WEBGL TEXTURE MODE
+    "IMAGE": "image",
+    # WEBGL TEXTURE WRAP AND FILTERING
+    "NEAREST": "nearest",
+    "REPEAT": "repeat",
+    "CLAMP": "clamp",
+    "MIRROR": "mirror",
+    # DEVICE-ORIENTATION
+    "LANDSCAPE": "landscape",
+    "PORTRAIT": "portrait",
+    # DEFAULTS
+    "GRID": "grid",
+    "AXES": "axes",
+    "LABEL": "label",
+    "FALLBACK": "fallback",
+    "CONTAIN": "contain",
+    "COVER": "cover",
+    # MEDIA
+    "VIDEO": "video",
+    "AUDIO": "audio",
+}
+
+
+def _counted(func: Callable) -> Callable:
+    """Counts calls to one of HeadlessP5's p5 methods."""
+    name = func.__name__
+
+    @functools.wraps(func)
+    def wrapper(self, *args):
+        if self._depth:
+            self.replayed[name] += 1
+        else:
+            self.calls[name] += 1
+        return func(self, *args)
+
+    return wrapper
+
+
+def _batch(func: Callable) -> Callable:
+    """Marks the p5 calls made by one of HeadlessP5's batch methods as
+    replayed rather than called from Python.
+    """
+
+    @functools.wraps(func)
+    def wrapper(self, *args):
+        self._depth += 1
+        try:
+            return func(self, *args)
+        finally:
+            self._depth -= 1
+
+    return wrapper
+
+
+class HeadlessElement:
+    """Stands in for the objects p5 returns, such as p5.Element, p5.Image,
+    p5.Color, and p5.Font.
+
+    Methods that HeadlessElement doesn't implement do nothing and return the
+    element so that calls can be chained.
+    """
+
+    def __init__(
+        self, kind: str, *args, width: int = 1, height: int = 1, value=None
+    ):
+        self.kind = kind
+        self.args = args
+        self.width = width
+        self.height = height
+        self._value = value
+
+    def __getattr__(self, name: str):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return lambda *args: self
+
+    def __repr__(self) -> str:
+        return f"HeadlessElement({self.kind!r})"
+
+    def value(self, *args):
+        if args:
+            self._value = args[0]
+            return self
+        return self._value
+
+    def size(self, width: int | None = None, height: int | None = None):
+        if width is None:
+            return {"width": self.width, "height": self.height}
+        self.width = width
+        if height is not None:
+            self.height = height
+        return self
+
+    def toString(self) -> str:
+        return f"{self.kind}({', '.join(map(str, self.args))})"
+
+
+class _Float64Array:
+    """Stands in for the typed array returned by _procesoSnapshot()."""
+
+    def __init__(self, data: array):
+        self.data = data
+
+    def to_bytes(self) -> bytes:
+        return self.data.tobytes()
+
+
+class HeadlessP5:
+    """Stands in for a p5 instance when there's no browser.
+
+    Arguments that are None are treated like undefined ones in JavaScript.
+    Drawing functions don't draw anything. Every call to a p5 method is
+    counted in calls, keyed by its JavaScript name, which makes the instance
+    useful for testing and benchmarking sketches. Calls made while replaying
+    a batch, such as the drawing commands in _procesoReplay(), are counted in
+    replayed instead, so calls only holds the calls that crossed over from
+    Python. Math, noise, time, canvas size, and frame count behave like they do
+    in p5.js. The draw loop doesn't run on its own; call redraw(n) to run
+    draw() n more times.
+
+    System variables such as mouseX are plain attributes that can be set to
+    simulate input.
+    """
+
+    def __init__(self):
+        self.calls = Counter()
+        self.replayed = Counter()
+        self._depth = 0
+        for name, value in CONSTANTS.items():
+            setattr(self, name, value)
+
+        # System variables
+        self.frameCount = 0
+        self.deltaTime = 0.0
+        self.focused = True
+        self.displayWidth = 1920
+        self.displayHeight = 1080
+        self.windowWidth = 1280
+        self.windowHeight = 720
+        self.width = 100
+        self.height = 100
+        self.deviceOrientation = None
+        self.accelerationX = 0.0
+        self.accelerationY = 0.0
+        self.accelerationZ = 0.0
+        self.pAccelerationX = 0.0
+        self.pAccelerationY = 0.0
+        self.pAccelerationZ = 0.0
+        self.rotationX = 0.0
+        self.rotationY = 0.0
+        self.rotationZ = 0.0
+        self.pRotationX = 0.0
+        self.pRotationY = 0.0
+        self.pRotationZ = 0.0
+        self.turnAxis = None
+        self.keyIsPressed = False
+        self.key = ""
+        self.keyCode = 0
+        self.movedX = 0.0
+        self.movedY = 0.0
+        self.mouseX = 0.0
+        self.mouseY = 0.0
+        self.pmouseX = 0.0
+        self.pmouseY = 0.0
+        self.winMouseX = 0.0
+        self.winMouseY = 0.0
+        self.pwinMouseX = 0.0
+        self.pwinMouseY = 0.0
+        self.mouseButton = 0
+        self.mouseIsPressed = False
+        self.touches = []
+        self.pixels = []
+
+        # Sketch functions, set by run_sketch()
+        self.preload = None
+        self.setup = None
+        self.draw = None
+
+        self._angle_mode = "radians"
+        self._looping = True
+        self._target_frame_rate = 60.0
+        self._millis_start = time.perf_counter()
+        self._noise = None
+
+    def __getattr__(self, name: str):
+        if name.startswith("_"):
+            raise AttributeError(name)
+
+        def method(*args):
+            if self._depth:
+                self.replayed[name] += 1
+            else:
+                self.calls[name] += 1
+            return HeadlessElement(name, *args)
+
+        method.__name__ = name
+        return method
+
+    # Structure
+
+    @_counted
+    def _start(self):
+        self._millis_start = time.perf_counter()
+        if callable(self.preload):
+            self.preload()
+        self._preloadDone = True
+        if callable(self.setup):
+            self.setup()
+        self._setupDone = True
+        self.redraw()
+
+    @_counted
+    def redraw(self, n: int | None = None):
+        for _ in range(n or 1):
+            self.frameCount += 1
+            self.deltaTime = 1000 / self._target_frame_rate
+            if callable(self.draw):
+                self.draw()
+            self.pmouseX = self.mouseX
+            self.pmouseY = self.mouseY
+            self.pwinMouseX = self.winMouseX
+            self.pwinMouseY = self.winMouseY
+
+    @_counted
+    def loop(self):
+        self._looping = True
+
+    @_counted
+    def noLoop(self):
+        self._looping = False
+
+    @_counted
+    def isLooping(self) -> bool:
+        return self._looping
+
+    @_counted
+    def remove(self):
+        self._looping = False
+
+    @_counted
+    def frameRate(self, fps: float | None = None):
+        if fps is None:
+            return self._target_frame_rate
+        self._target_frame_rate = fps
+
+    @_counted
+    def getTargetFrameRate(self) -> float:
+        return self._target_frame_rate
+
+    # Rendering
+
+    @_counted
+    def createCanvas(self, width: int, height: int, renderer: str | None = None):
+        self.width = width
+        self.height = height
+        return HeadlessElement("canvas", width=width, height=height)
+
+    @_counted
+    def resizeCanvas(self, width: int, height: int, no_redraw: bool | None = None):
+        self.width = width
+        self.height = height
+
+    @_counted
+    def createGraphics(self, width: int, height: int, renderer: str | None = None):
+        return HeadlessElement("graphics", width=width, height=height)
+
+    # DOM
+
+    @_counted
+    def createSlider(
+        self,
+        min: float,
+        max: float,
+        value: float | None = None,
+        step: float | None = None,
+    ):
+        if value is None:
+            value = (min + max) / 2
+        return HeadlessElement("slider", value=value)
+
+    @_counted
+    def createInput(self, value: str | None = None, type: str | None = None):
+        return HeadlessElement("input", value=value or "")
+
+    # Events
+
+    @_counted
+    def keyIsDown(self, code: int) -> bool:
+        return False
+
+    # Math
+
+    @_counted
+    def abs(self, n: float) -> float:
+        return abs(n)
+
+    @_counted
+    def constrain(self, n: float, low: float, high: float) -> float:
+        return max(min(n, high), low)
+
+    @_counted
+    def dist(self, *args: float) -> float:
+        if len(args) == 4:
+            x1, y1, x2, y2 = args
+            return math.hypot(x2 - x1, y2 - y1)
+        x1, y1, z1, x2, y2, z2 = args
+        return math.hypot(x2 - x1, y2 - y1, z2 - z1)
+
+    @_counted
+    def lerp(self, start: float, stop: float, amt: float) -> float:
+        return amt * (stop - start) + start
+
+    @_counted
+    def mag(self, x: float, y: float) -> float:
+        return math.hypot(x, y)
+
+    @_counted
+    def map(
+        self,
+        value: float,
+        start1: float,
+        stop1: float,
+        start2: float,
+        stop2: float,
+        within_bounds: bool | None = None,
+    ) -> float:
+        new_value = (value - start1) / (stop1 - start1) * (stop2 - start2) + start2
+        if not within_bounds:
+            return new_value
+        if start2 < stop2:
+            return max(min(new_value, stop2), start2)
+        return max(min(new_value, start2), stop2)
+
+    @_counted
+    def max(self, *args: float) -> float:
+        if len(args) == 1:
+            return max(args[0])
+        return max(args)
+
+    @_counted
+    def min(self, *args: float) -> float:
+        if len(args) == 1:
+            return min(args[0])
+        return min(args)
+
+    @_counted
+    def norm(self, value: float, start: float, stop: float) -> float:
+        return (value - start) / (stop - start)
+
+    @_counted
+    def round(self, n: float, decimals: int | None = None):
+        if not decimals:
+            return math.floor(n + 0.5)
+        multiplier = 10**decimals
+        return math.floor(n * multiplier + 0.5) / multiplier
+
+    @_counted
+    def fract(self, n: float) -> float:
+        return n - math.floor(n)
+
+    # Trigonometry
+
+    def _to_radians(self, angle: float) -> float:
+        if self._angle_mode == "degrees":
+            return math.radians(angle)
+        return angle
+
+    def _from_radians(self, angle: float) -> float:
+        if self._angle_mode == "degrees":
+            return math.degrees(angle)
+        return angle
+
+    @_counted
+    def angleMode(self, mode: str | None = None):
+        if mode is None:
+            return self._angle_mode
+        if mode in ("degrees", "radians"):
+            self._angle_mode = mode
+
+    @_counted
+    def sin(self, angle: float) -> float:
+        if not math.isfinite(angle):
+            return math.nan
+        return math.sin(self._to_radians(angle))
+
+    @_counted
+    def cos(self, angle: float) -> float:
+        if not math.isfinite(angle):
+            return math.nan
+        return math.cos(self._to_radians(angle))
+
+    @_counted
+    def tan(self, angle: float) -> float:
+        if not math.isfinite(angle):
+            return math.nan
+        return math.tan(self._to_radians(angle))
+
+    @_counted
+    def asin(self, value: float) -> float:
+        return self._from_radians(math.asin(value))
+
+    @_counted
+    def acos(self, value: float) -> float:
+        return self._from_radians(math.acos(value))
+
+    @_counted
+    def atan(self, value: float) -> float:
+        return self._from_radians(math.atan(value))
+
+    @_counted
+    def atan2(self, y: float, x: float) -> float:
+        return self._from_radians(math.atan2(y, x))
+
+    @_counted
+    def degrees(self, radians: float) -> float:
+        return math.degrees(radians)
+
+    @_counted
+    def radians(self, degrees: float) -> float:
+        return math.radians(degrees)
+
+    # Noise
+
+    def _perlin(self):
+        if self._noise is None:
+            # Imported here because proceso.math imports the backend.
+            from ..math.noise import PerlinNoise
+
+            self._noise = PerlinNoise()
+        return self._noise
+
+    @_counted
+    def noise(
+        self, x: float, y: float | None = None, z: float | None = None
+    ) -> float:
+        return self._perlin().noise(x, y, z)
+
+    @_counted
+    def noiseDetail(self, lod: int, falloff: float | None = None):
+        self._perlin().detail(lod, falloff)
+
+    @_counted
+    def noiseSeed(self, seed: float):
+        self._perlin().seed(seed)
+
+    # IO
+
+    @_counted
+    def millis(self) -> float:
+        return (time.perf_counter() - self._millis_start) * 1000
+
+    @_counted
+    def day(self) -> int:
+        return datetime.datetime.now().day
+
+    @_counted
+    def hour(self) -> int:
+        return datetime.datetime.now().hour
+
+    @_counted
+    def minute(self) -> int:
+        return datetime.datetime.now().minute
+
+    @_counted
+    def month(self) -> int:
+        return datetime.datetime.now().month
+
+    @_counted
+    def second(self) -> int:
+        return datetime.datetime.now().second
+
+    @_counted
+    def year(self) -> int:
+        return datetime.datetime.now().year
+
+    @_counted
+    def loadImage(self, path: str, *args):
+        return HeadlessElement("image", path)
+
+    @_counted
+    def loadFont(self, path: str, *args):
+        return HeadlessElement("font", path)
+
+    # proceso extensions
+
+    @_counted
+    @_batch
+    def _procesoReplay(self, ops: array, strings: list[str]):
+        from ..buffer import COMMANDS
+
+        i = 0
+        while i < len(ops):
+            name = COMMANDS[int(ops[i])]
+            argc = int(ops[i + 1])
+            smask = int(ops[i + 2])
+            umask = int(ops[i + 3])
+            i += 4
+            args = []
+            for j in range(argc):
+                if (smask >> j) & 1:
+                    args.append(strings[int(ops[i + j])])
+                elif (umask >> j) & 1:
+                    args.append(None)
+                else:
+                    args.append(ops[i + j])
+            i += argc
+            getattr(self, name)(*args)
+
+    @_counted
+    @_batch
+    def _procesoBulk(self, name: str, stride: int, data):
+        func = getattr(self, name)
+        data = list(data)
+        for i in range(0, len(data), stride):
+            func(*data[i : i + stride])
+
+    @_counted
+    @_batch
+    def _procesoVertices(
+        self, name: str, stride: int, group: int, data, contours: list[int]
+    ):
+        func = getattr(self, name)
+        data = list(data)
+        size = stride * group
+        count = len(data) // stride
+        next = 0
+        in_contour = False
+        for i in range(0, count, group):
+            if next < len(contours) and i >= contours[next]:
+                if in_contour:
+                    self.endContour()
+                self.beginContour()
+                in_contour = True
+                next += 1
+            offset = i * stride
+            func(*data[offset : offset + size])
+        if in_contour:
+            self.endContour()
+
+    @_counted
+    def _procesoSnapshot(self) -> _Float64Array:
+        from ..extensions import _SNAPSHOT_NAMES
+
+        return _Float64Array(
+            array("d", [getattr(self, name) for name in _SNAPSHOT_NAMES])
+        )
+
+
+class HeadlessProxy:
+    """Stands in for the proxies created by pyodide.ffi.create_proxy()."""
+
+    def __init__(self, func: Callable):
+        self._func = func
+
+    def __call__(self, *args):
+        if self._func is None:
+            raise RuntimeError("This proxy has already been destroyed")
+        return self._func(*args)
+
+    def destroy(self):
+        self._func = None
+
+
+# The headless equivalent of window[id] for each sketch.
+instances: dict[str, HeadlessP5] = {}
+
+
+def create_instance(id: str, extensions: str) -> HeadlessP5:
+    """Creates a headless p5 instance and stores it as instances[id].
+
+    The JavaScript extensions are ignored because HeadlessP5 implements them
+    in Python.
+    """
+    instances[id] = HeadlessP5()
+    return instances[id]
+
+
+def remove_instance(id: str):
+    """Removes the headless p5 instance stored as instances[id], if there is one."""
+    old_sketch = instances.pop(id, None)
+    if old_sketch is not None:
+        old_sketch.remove()
+
+
+def set_canvas_id(id: str):
+    """Does nothing, since headless instances don't have a canvas element."""
+
+
+def create_proxy(func: Callable) -> HeadlessProxy:
+    return HeadlessProxy(func)
+
+
+def to_js(obj):
+    return obj
+
+
+def to_js_buffer(obj):
+    """Returns the buffer itself, since headless instances read it directly."""
+    return obj
+
+
+def release_buffers():
+    """Does nothing, since to_js_buffer() doesn't hold on to any buffers."""
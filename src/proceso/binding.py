@@ -1,6 +1,13 @@
 from typing import Callable
 
+import numpy as np
+
+from .backend import create_instance, release_buffers
+from .buffer import CommandBuffer
 from .constants import Constants
+from .extensions import P5_EXTENSIONS
+from .methods import MethodTable
+from .proxies import ProxyRegistry, get_registry
 from .sysvars import SystemVariables
 from .utils import remove_sketch
 
@@ -8,21 +15,113 @@ from .utils import remove_sketch
 class BaseSketch(Constants, SystemVariables):
     id: str
     _p5js: object
+    _buffer: CommandBuffer | None
+    _proxies: ProxyRegistry
+
+    def __init__(
+        self,
+        id: str = "defaultCanvas0",
+        buffered: bool = False,
+        system_variables: str = "lazy",
+        vectors: str = "numpy",
+        vector_dtype: type | str = "float64",
+    ):
+        """Creates a new p5 instance for the sketch.
+
+        If buffered is True, drawing commands are recorded and sent to p5 in a
+        single batch at the end of setup(), draw(), and each event function
+        instead of one at a time.
+
+        system_variables controls how system variables such as mouse_x are read
+        from p5 each frame. "lazy" reads each variable the first time it's used,
+        which is cheapest for sketches that use only a few of them. "packed"
+        copies every numeric variable at the start of the frame with a single
+        call, which is cheaper for sketches that use many of them.
+
+        vectors controls how the sketch's Vector, Vector2D, and Vector3D store
+        their values. "numpy" uses a numpy array per vector. "python" uses
+        plain Python floats for 2D and 3D vectors, which is much faster for
+        sketches that do a lot of math with individual vectors.
 
-    def __init__(self, id: str = "defaultCanvas0"):
-        import js
-        from pyodide.code import run_js
+        vector_dtype sets the default dtype of numpy vectors, including Vector,
+        Vector.random(), Vector.from_heading(), VectorArray, and vector arenas.
+        "float32" halves their memory and matches the 32 bit floats that p5 and
+        WebGL use. It applies to vectors created while the sketch's functions
+        are running, so each sketch on the page can use its own dtype.
+        """
+        if system_variables not in ("lazy", "packed"):
+            raise RuntimeError(
+                f"system_variables must be 'lazy' or 'packed', not {system_variables!r}"
+            )
+        if vectors not in ("numpy", "python"):
+            raise RuntimeError(f"vectors must be 'numpy' or 'python', not {vectors!r}")
+        from .math.vector import Vector, _float_dtype
 
+        dtype = _float_dtype(vector_dtype)
+        if vectors == "python" and dtype is not _float_dtype("float64"):
+            raise RuntimeError("vector_dtype can only be changed for numpy vectors")
+        self._vector_dtype = Vector._default_dtype = dtype
+        Vector._angle_mode = "radians"
+        if vectors == "python":
+            from .math.slotted_vector import (
+                SlottedVector,
+                SlottedVector2D,
+                SlottedVector3D,
+            )
+
+            self.Vector = SlottedVector
+            self.Vector2D = SlottedVector2D
+            self.Vector3D = SlottedVector3D
+        self._angle_mode = "radians"
+        self._callbacks = set()
+        self._rng = Vector._rng = np.random.default_rng()
+        from .math.noise import PerlinNoise
+
+        self._noise = PerlinNoise()
         self.id = id
         remove_sketch(self.id)
-        create_sketch = f"var {self.id} = " + "new p5(() => { });"
-        run_js(create_sketch)
-        set_canvas_id = f"{self.id}.canvas.setAttribute('id', '{self.id}');"
-        run_js(set_canvas_id)
-        self._p5js = getattr(js.window, self.id)
+        p5js = create_instance(self.id, P5_EXTENSIONS)
+        self._proxies = get_registry(self.id)
+        self._bind_p5js(p5js, buffered)
+        self._packed_system_variables = system_variables == "packed"
         self._init_constants()
         self._update_system_variables()
-    
+
+    def _bind_p5js(self, p5js: object, buffered: bool):
+        """Points the sketch's wrappers at a (new) p5 instance.
+
+        The instance's methods are resolved once and cached, so this must be
+        called again whenever the p5 instance is replaced.
+        """
+        self._p5js = MethodTable(p5js)
+        self._buffer = None
+        if buffered:
+            self._buffer = CommandBuffer(self._p5js)
+            self._p5js = self._buffer
+
+    @property
+    def proxy_count(self) -> int:
+        """The number of JavaScript proxies the sketch is keeping alive."""
+        return len(self._proxies)
+
+    def _activate(self):
+        """Makes the sketch's settings current for the shared vector classes.
+
+        Vector classes are shared by every sketch on the page, so each sketch
+        sets its own vector dtype, angle mode, and random number generator on
+        them before running any of its functions.
+        """
+        from .math.vector import Vector
+
+        Vector._default_dtype = self._vector_dtype
+        Vector._angle_mode = self._angle_mode
+        Vector._rng = self._rng
+
+    def _flush_commands(self):
+        if self._buffer is not None:
+            self._buffer.flush()
+        release_buffers()
+
     def run_sketch(
         self,
         preload: Callable | None = None,
@@ -43,58 +142,98 @@ class BaseSketch(Constants, SystemVariables):
     ):
         """Runs a sketch in active mode."""
         import inspect
-        from pyodide.ffi import create_proxy
+
+        # Functions to attach to p5, by name.
+        callbacks = {}
 
         self._p5js._setupDone = False
         self._p5js._preloadDone = False
         self._p5js._millisStart = -1
         if callable(preload):
-            self._p5js.preload = create_proxy(preload)
+
+            def _preload(*args):
+                self._activate()
+                preload()
+
+            callbacks["preload"] = _preload
+
         if callable(setup):
-            self._p5js.setup = create_proxy(setup)
+
+            def _setup(*args):
+                self._activate()
+                setup()
+                self._flush_commands()
+
+            callbacks["setup"] = _setup
 
         if callable(draw):
 
             def _draw(*args):
+                self._activate()
                 self._update_system_variables()
                 draw()
+                self._flush_commands()
 
-            self._p5js.draw = create_proxy(_draw)
+            callbacks["draw"] = _draw
 
         def wrap_event_func(func: Callable):
             args = inspect.signature(func).parameters
             if len(args) == 0:
 
                 def wrapped_func(event):
+                    self._activate()
+                    self._update_input_variables()
                     func()
+                    self._flush_commands()
 
-                return create_proxy(wrapped_func)
             else:
-                return create_proxy(func)
+
+                def wrapped_func(event):
+                    self._activate()
+                    self._update_input_variables()
+                    result = func(event)
+                    self._flush_commands()
+                    return result
+
+            return wrapped_func
 
         if callable(key_pressed):
-            self._p5js.keyPressed = wrap_event_func(key_pressed)
+            callbacks["keyPressed"] = wrap_event_func(key_pressed)
         if callable(key_released):
-            self._p5js.keyReleased = wrap_event_func(key_released)
+            callbacks["keyReleased"] = wrap_event_func(key_released)
         if callable(key_typed):
-            self._p5js.keyTyped = wrap_event_func(key_typed)
+            callbacks["keyTyped"] = wrap_event_func(key_typed)
         if callable(mouse_moved):
-            self._p5js.mouseMoved = wrap_event_func(mouse_moved)
+            callbacks["mouseMoved"] = wrap_event_func(mouse_moved)
         if callable(mouse_dragged):
-            self._p5js.mouseDragged = wrap_event_func(mouse_dragged)
+            callbacks["mouseDragged"] = wrap_event_func(mouse_dragged)
         if callable(mouse_pressed):
-            self._p5js.mousePressed = wrap_event_func(mouse_pressed)
+            callbacks["mousePressed"] = wrap_event_func(mouse_pressed)
         if callable(mouse_released):
-            self._p5js.mouseReleased = wrap_event_func(mouse_released)
+            callbacks["mouseReleased"] = wrap_event_func(mouse_released)
         if callable(mouse_clicked):
-            self._p5js.mouseClicked = wrap_event_func(mouse_clicked)
+            callbacks["mouseClicked"] = wrap_event_func(mouse_clicked)
         if callable(double_clicked):
-            self._p5js.doubleClicked = wrap_event_func(double_clicked)
+            callbacks["doubleClicked"] = wrap_event_func(double_clicked)
         if callable(mouse_wheel):
-            self._p5js.mouseWheel = create_proxy(mouse_wheel)
+            callbacks["mouseWheel"] = wrap_event_func(mouse_wheel)
         if callable(request_pointer_lock):
-            self._p5js.requestPointerLock = create_proxy(request_pointer_lock)
+            callbacks["requestPointerLock"] = request_pointer_lock
         if callable(exit_pointer_lock):
-            self._p5js.exitPointerLock = create_proxy(exit_pointer_lock)
+            callbacks["exitPointerLock"] = exit_pointer_lock
+
+        # Replace the callbacks from a previous call to run_sketch() and clear the
+        # ones that aren't given again, so p5 never calls a destroyed proxy.
+        for name in self._callbacks - callbacks.keys():
+            if name in ("requestPointerLock", "exitPointerLock"):
+                # Restore p5's own method.
+                delattr(self._p5js, name)
+            else:
+                setattr(self._p5js, name, None)
+            self._proxies.destroy(f"sketch.{name}")
+        for name, func in callbacks.items():
+            self._proxies.destroy(f"sketch.{name}")
+            setattr(self._p5js, name, self._proxies.create(func, f"sketch.{name}"))
+        self._callbacks = set(callbacks)
 
         self._p5js._start()
@@ -0,0 +1,230 @@
+from array import array
+
+from .backend import to_js
+
+# p5 methods that only change drawing state or draw to the canvas. Calls to
+# these are recorded and replayed in order; anything else flushes first.
+COMMANDS = (
+    # Shape
+    "arc",
+    "ellipse",
+    "circle",
+    "line",
+    "point",
+    "quad",
+    "rect",
+    "square",
+    "triangle",
+    "ellipseMode",
+    "noSmooth",
+    "rectMode",
+    "smooth",
+    "strokeCap",
+    "strokeJoin",
+    "strokeWeight",
+    "bezier",
+    "bezierDetail",
+    "curve",
+    "curveDetail",
+    "curveTightness",
+    "beginContour",
+    "beginShape",
+    "bezierVertex",
+    "curveVertex",
+    "endContour",
+    "endShape",
+    "quadraticVertex",
+    "vertex",
+    "normal",
+    "plane",
+    "box",
+    "sphere",
+    "cylinder",
+    "cone",
+    "ellipsoid",
+    "torus",
+    # Color
+    "background",
+    "clear",
+    "colorMode",
+    "fill",
+    "noFill",
+    "stroke",
+    "noStroke",
+    "erase",
+    "noErase",
+    # Transform
+    "applyMatrix",
+    "resetMatrix",
+    "rotate",
+    "rotateX",
+    "rotateY",
+    "rotateZ",
+    "scale",
+    "shearX",
+    "shearY",
+    "translate",
+    # Structure
+    "push",
+    "pop",
+)
+
+# p5 members that don't depend on recorded drawing state, so reading them
+# doesn't require the buffer to be flushed first.
+PASSTHROUGH = frozenset(
+    (
+        # Math
+        "abs",
+        "constrain",
+        "dist",
+        "lerp",
+        "mag",
+        "map",
+        "max",
+        "min",
+        "norm",
+        "round",
+        "fract",
+        "noise",
+        "sin",
+        "cos",
+        "tan",
+        "asin",
+        "acos",
+        "atan",
+        "atan2",
+        "degrees",
+        "radians",
+        # IO
+        "day",
+        "hour",
+        "minute",
+        "millis",
+        "month",
+        "second",
+        "year",
+        # System variables
+        "frameCount",
+        "deltaTime",
+        "focused",
+        "displayWidth",
+        "displayHeight",
+        "windowWidth",
+        "windowHeight",
+        "width",
+        "height",
+        "deviceOrientation",
+        "accelerationX",
+        "accelerationY",
+        "accelerationZ",
+        "pAccelerationX",
+        "pAccelerationY",
+        "pAccelerationZ",
+        "rotationX",
+        "rotationY",
+        "rotationZ",
+        "pRotationX",
+        "pRotationY",
+        "pRotationZ",
+        "turnAxis",
+        "keyIsPressed",
+        "key",
+        "keyCode",
+        "keyIsDown",
+        "movedX",
+        "movedY",
+        "mouseX",
+        "mouseY",
+        "pmouseX",
+        "pmouseY",
+        "winMouseX",
+        "winMouseY",
+        "pwinMouseX",
+        "pwinMouseY",
+        "mouseButton",
+        "mouseIsPressed",
+        "touches",
+        "pixels",
+        "_procesoSnapshot",
+    )
+)
+
+
+class CommandBuffer:
+    """Stands in for a p5 instance and records drawing commands.
+
+    Each command is stored in a flat array of doubles as an opcode, an
+    argument count, a mask of string arguments, a mask of undefined arguments,
+    and the arguments themselves. flush() hands the whole array to p5 and
+    replays it with one call. Members that aren't drawing commands are read
+    from the p5 instance after flushing so that calls stay in order.
+    """
+
+    def __init__(self, p5js: object):
+        object.__setattr__(self, "_p5js", p5js)
+        object.__setattr__(self, "_ops", array("d"))
+        object.__setattr__(self, "_strings", [])
+        for opcode, name in enumerate(COMMANDS):
+            object.__setattr__(self, name, self._recorder(opcode, name))
+
+    def __getattr__(self, name: str):
+        if name not in PASSTHROUGH:
+            self.flush()
+        return getattr(self._p5js, name)
+
+    def __setattr__(self, name: str, value):
+        setattr(self._p5js, name, value)
+
+    def __delattr__(self, name: str):
+        delattr(self._p5js, name)
+
+    def __len__(self) -> int:
+        """Returns the number of values currently in the buffer."""
+        return len(self._ops)
+
+    def _recorder(self, opcode: int, name: str):
+        ops = self._ops
+        strings = self._strings
+
+        def record(*args):
+            argc = len(args)
+            while argc and args[argc - 1] is None:
+                argc -= 1
+            start = len(ops)
+            try:
+                ops.extend((opcode, argc, 0, 0))
+                ops.extend(args[:argc])
+                return
+            except TypeError:
+                del ops[start:]
+
+            smask = 0
+            umask = 0
+            values = []
+            for i, arg in enumerate(args[:argc]):
+                if arg is None:
+                    umask |= 1 << i
+                    values.append(0.0)
+                elif isinstance(arg, str):
+                    smask |= 1 << i
+                    values.append(len(strings))
+                    strings.append(arg)
+                elif isinstance(arg, (int, float)):
+                    values.append(arg)
+                else:
+                    # JavaScript objects can't be recorded, so call p5 directly.
+                    self.flush()
+                    getattr(self._p5js, name)(*args)
+                    return
+            ops.extend((opcode, argc, smask, umask))
+            ops.extend(values)
+
+        return record
+
+    def flush(self):
+        """Replays all recorded commands with a single call to p5."""
+        if not self._ops:
+            return
+        self._p5js._procesoReplay(to_js(self._ops), to_js(self._strings))
+        del self._ops[:]
+        self._strings.clear()
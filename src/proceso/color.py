@@ -1,4 +1,4 @@
-from pyodide.ffi import to_js
+from .backend import to_js
 
 from .binding import BaseSketch
 
@@ -6,11 +6,14 @@ from .events import Events
 from .images import Images
 from .io import IO
 from .math import (
+    HashGrid as _HashGrid,
+    KDTree as _KDTree,
     Math,
     Vector as _Vector,
     Vector2D as _Vector2D,
     Vector3D as _Vector3D,
     Vector4D as _Vector4D,
+    VectorArray as _VectorArray,
 )
 from .rendering import Rendering
 from .shape import Shape
@@ -40,3 +43,6 @@ class Sketch(
     Vector2D = _Vector2D
     Vector3D = _Vector3D
     Vector4D = _Vector4D
+    VectorArray = _VectorArray
+    HashGrid = _HashGrid
+    KDTree = _KDTree
@@ -1,5 +1,5 @@
 from typing import Callable
-from pyodide.ffi import create_proxy, to_js
+from .backend import to_js
 
 from .binding import BaseSketch
 
@@ -148,7 +148,7 @@ class DOM(BaseSketch):
         """Creates an <input></input> element in the DOM of type 'file'.
         This allows users to select local files for use in a sketch.
         """
-        return self._p5js.createFileInput(create_proxy(callback), multiple)
+        return self._p5js.createFileInput(self._proxies.create(callback), multiple)
 
     def create_video(self, src: str, callback: Callable | None = None) -> object:
         """Creates an HTML5 <video> element in the DOM for simple playback of
@@ -161,7 +161,7 @@ class DOM(BaseSketch):
         information about supported formats.
         """
         if callback:
-            return self._p5js.createVideo(src, create_proxy(callback))
+            return self._p5js.createVideo(src, self._proxies.create(callback))
         return self._p5js.createVideo(src)
 
     def create_audio(
@@ -176,7 +176,7 @@ class DOM(BaseSketch):
         about supported formats.
         """
         if callback:
-            return self._p5js.createAudio(to_js(src), create_proxy(callback))
+            return self._p5js.createAudio(to_js(src), self._proxies.create(callback))
         return self._p5js.createAudio(to_js(src))
 
     def create_capture(self, type: str, callback: Callable | None = None) -> object:
@@ -187,7 +187,7 @@ class DOM(BaseSketch):
         Security note: A new browser security specification requires that getUserMedia, which is behind createCapture(), only works when you're running the code locally, or on HTTPS. Learn more here and here.
         """
         if callback:
-            return self._p5js.createCapture(type, create_proxy(callback))
+            return self._p5js.createCapture(type, self._proxies.create(callback))
         return self._p5js.createCapture(type)
 
     def create_element(self, tag: str, content: str | None = None) -> object:
@@ -0,0 +1,89 @@
+from .buffer import COMMANDS
+from .sysvars import PACKED_SYSTEM_VARIABLES, SystemVariables
+
+_SNAPSHOT_NAMES = [
+    getattr(SystemVariables, name).js_name for name, _ in PACKED_SYSTEM_VARIABLES
+]
+
+# JavaScript helpers installed on p5.prototype. Each one lets Python hand p5 a
+# batch of work with a single call instead of one call per drawing command.
+P5_EXTENSIONS = (
+    f"p5.prototype._procesoCommands = {list(COMMANDS)!r};\n"
+    f"p5.prototype._procesoSnapshotNames = {_SNAPSHOT_NAMES!r};\n"
+    + """
+p5.prototype._procesoReplay = function (ops, strings) {
+  const names = this._procesoCommands;
+  const args = [];
+  let i = 0;
+  while (i < ops.length) {
+    const name = names[ops[i]];
+    const argc = ops[i + 1];
+    const smask = ops[i + 2];
+    const umask = ops[i + 3];
+    i += 4;
+    args.length = argc;
+    for (let j = 0; j < argc; j++) {
+      if ((smask >> j) & 1) {
+        args[j] = strings[ops[i + j]];
+      } else if ((umask >> j) & 1) {
+        args[j] = undefined;
+      } else {
+        args[j] = ops[i + j];
+      }
+    }
+    i += argc;
+    this[name].apply(this, args);
+  }
+};
+
+p5.prototype._procesoBulk = function (name, stride, data) {
+  const fn = this[name];
+  const args = new Array(stride);
+  for (let i = 0; i < data.length; i += stride) {
+    for (let j = 0; j < stride; j++) {
+      args[j] = data[i + j];
+    }
+    fn.apply(this, args);
+  }
+};
+
+p5.prototype._procesoVertices = function (name, stride, group, data, contours) {
+  const fn = this[name];
+  const size = stride * group;
+  const args = new Array(size);
+  const count = data.length / stride;
+  let next = 0;
+  let inContour = false;
+  for (let i = 0; i < count; i += group) {
+    if (next < contours.length && i >= contours[next]) {
+      if (inContour) {
+        this.endContour();
+      }
+      this.beginContour();
+      inContour = true;
+      next++;
+    }
+    const offset = i * stride;
+    for (let j = 0; j < size; j++) {
+      args[j] = data[offset + j];
+    }
+    fn.apply(this, args);
+  }
+  if (inContour) {
+    this.endContour();
+  }
+};
+
+p5.prototype._procesoSnapshot = function () {
+  const names = this._procesoSnapshotNames;
+  if (this._procesoSnapshotData === undefined) {
+    this._procesoSnapshotData = new Float64Array(names.length);
+  }
+  const data = this._procesoSnapshotData;
+  for (let i = 0; i < names.length; i++) {
+    data[i] = this[names[i]];
+  }
+  return data;
+};
+"""
+)
@@ -1,6 +1,13 @@
 from .calculation import Calculation
 from .noise import Noise
 from .random import Random
+from .rotation import rotate_vectors, rotation_matrix
+from .slotted_vector import (
+    SlottedVector,
+    SlottedVector2D,
+    SlottedVector3D,
+)
+from .spatial import HashGrid, KDTree
 from .trigonometry import Trigonometry
 from .vector import (
     Vector,
@@ -8,6 +15,8 @@ from .vector import (
     Vector3D,
     Vector4D,
 )
+from .vector_arena import VectorArena
+from .vector_array import VectorArray
 
 
 class Math(Calculation, Noise, Random, Trigonometry):
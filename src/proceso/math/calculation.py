@@ -8,7 +8,7 @@ class Calculation(BaseSketch):
         """Calculates the absolute value (magnitude) of a number.
         The absolute value of a number is always positive.
         """
-        return self._p5js.abs(n)
+        return abs(n)
 
     def ceil(self, n: float) -> int:
         """Calculates the closest int value that is greater than or equal to the
@@ -19,13 +19,17 @@ class Calculation(BaseSketch):
 
     def constrain(self, n: float, low: float, high: float) -> float:
         """Constrains a value between a minimum and maximum value."""
-        return self._p5js.constrain(n, low, high)
+        return max(min(n, high), low)
 
     def dist(self, x1: float, y1: float, x2: float, y2: float, *args) -> float:
         """Calculates the distance between two points, in either two or three
         dimensions.
         """
-        return self._p5js.dist(x1, y1, x2, y2, *args)
+        if not args:
+            return math.hypot(x2 - x1, y2 - y1)
+        # In 3D, the arguments are x1, y1, z1, x2, y2, z2.
+        z1, x2, y2, z2 = x2, y2, *args
+        return math.hypot(x2 - x1, y2 - y1, z2 - z1)
 
     def exp(self, n: float) -> float:
         """Returns Euler's number e (2.71828...) raised to the power of the n
@@ -51,7 +55,7 @@ class Calculation(BaseSketch):
         function is convenient for creating motion along a straight path and for
         drawing dotted lines.
         """
-        return self._p5js.lerp(start, stop, amt)
+        return amt * (stop - start) + start
 
     def log(self, n: float) -> float:
         """Calculates the natural logarithm (the base-e logarithm) of a number.
@@ -67,7 +71,7 @@ class Calculation(BaseSketch):
         vector can be thought of as the distance from the coordinate 0,0 to its
         x,y value. Therefore, mag() is a shortcut for writing dist(0, 0, x, y).
         """
-        return self._p5js.mag(a, b)
+        return math.hypot(a, b)
 
     def remap(
         self,
@@ -84,25 +88,34 @@ class Calculation(BaseSketch):
         the range of 0 to 100 into a value that ranges from the left edge of the
         window (0) to the right edge (width).
         """
-        return self._p5js.map(value, start1, stop1, start2, stop2, within_bounds)
+        new_value = _divide(value - start1, stop1 - start1) * (stop2 - start2) + start2
+        if not within_bounds:
+            return new_value
+        if start2 < stop2:
+            return max(min(new_value, stop2), start2)
+        return max(min(new_value, start2), stop2)
 
     def max(self, n: float | list[float], n1: float | None = None) -> float:
         """Determines the largest value in a sequence of numbers, and then
         returns that value.
         max() accepts any number of float parameters, or a list of any length.
         """
-        if n1:
-            return self._p5js.max(n, n1)
-        return self._p5js.max(n)
+        if n1 is not None:
+            return max(n, n1)
+        elif isinstance(n, (int, float)):
+            return n
+        return max(n, default=-math.inf)
 
     def min(self, n: float | list[float], n1: float | None = None) -> float:
         """Determines the smallest value in a sequence of numbers, and then
         returns that value.
         min() accepts any number of float parameters, or a list of any length.
         """
-        if n1:
-            return self._p5js.min(n, n1)
-        return self._p5js.min(n)
+        if n1 is not None:
+            return min(n, n1)
+        elif isinstance(n, (int, float)):
+            return n
+        return min(n, default=math.inf)
 
     def norm(self, value: float, start: float, stop: float) -> float:
         """Normalizes a number from another range into a value between 0 and 1.
@@ -110,7 +123,7 @@ class Calculation(BaseSketch):
         not clamped to 0 and 1, because out-of-range values are often intentional
         and useful. (See the example above.)
         """
-        return self._p5js.norm(value, start, stop)
+        return _divide(value - start, stop - start)
 
     def pow(self, n: float, e: float) -> float:
         """Facilitates exponential expressions.
@@ -125,7 +138,10 @@ class Calculation(BaseSketch):
         """Calculates the integer closest to the n parameter.
         For example, round(133.8) returns the value 134.
         """
-        return self._p5js.round(n, decimals)
+        if not decimals:
+            return _round_half_up(n)
+        multiplier = 10**decimals
+        return _round_half_up(n * multiplier) / multiplier
 
     def sq(self, n: float) -> float:
         """Squares a number (multiplies a number by itself).
@@ -143,4 +159,39 @@ class Calculation(BaseSketch):
 
     def fract(self, n: float) -> float:
         """Calculates the fractional part of a number."""
-        return self._p5js.fract(n)
+        if math.isnan(n) or math.isinf(n):
+            return n
+        sign = 0
+        if n < 0:
+            n = -n
+            sign = 1
+        # Like p5, read the fractional part from the number's shortest decimal
+        # representation so that fract(1.1) is 0.1 rather than 0.10000000000000009.
+        # Unlike JavaScript, Python writes whole numbers with a trailing ".0".
+        text = repr(float(n))
+        if "." in text and "e" not in text and not text.endswith(".0"):
+            return abs(sign - float("0" + text[text.index(".") :]))
+        elif n < 1:
+            return abs(sign - n)
+        return 0
+
+
+def _divide(a: float, b: float) -> float:
+    """Divides like JavaScript, which returns infinity or NaN instead of raising an
+    error when dividing by zero.
+    """
+    if b:
+        return a / b
+    elif a == 0 or math.isnan(a):
+        return math.nan
+    return math.copysign(math.inf, a) * math.copysign(1, b)
+
+
+def _round_half_up(n: float) -> int:
+    """Rounds like JavaScript's Math.round(), where halves round up."""
+    if not math.isfinite(n):
+        return n
+    result = math.floor(n)
+    if n - result >= 0.5:
+        result += 1
+    return result
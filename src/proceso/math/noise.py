@@ -1,8 +1,191 @@
+import math
+import random
+
+import numpy as np
+
 from ..binding import BaseSketch
 
+# Perlin noise, ported from p5.js.
+PERLIN_YWRAPB = 4
+PERLIN_YWRAP = 1 << PERLIN_YWRAPB
+PERLIN_ZWRAPB = 8
+PERLIN_ZWRAP = 1 << PERLIN_ZWRAPB
+PERLIN_SIZE = 4095
+
+
+class PerlinNoise:
+    """Python port of the Perlin noise behind p5.js's noise().
+
+    Notes
+    -----
+
+    Python port of the Perlin noise behind p5.js's noise(). It uses the same table
+    of random values, octaves, and falloff as p5.js, and noise_seed() fills the
+    table with the same linear congruential generator, so a seeded sketch gets the
+    same noise values as the equivalent p5.js sketch without calling into
+    JavaScript for every sample.
+    """
+
+    def __init__(self):
+        self._perlin = None
+        self._perlin_array = None
+        self.octaves = 4
+        self.falloff = 0.5
+
+    def _table(self) -> list[float]:
+        if self._perlin is None:
+            # p5.js fills an unseeded table with Math.random(), which random_seed()
+            # doesn't affect, so use a generator of our own.
+            rng = random.Random()
+            self._perlin = [rng.random() for _ in range(PERLIN_SIZE + 1)]
+        return self._perlin
 
-class Noise(BaseSketch):
     def noise(self, x: float, y: float | None = None, z: float | None = None) -> float:
+        """Returns the noise value at the given coordinates."""
+        perlin = self._perlin or self._table()
+        cos = math.cos
+        pi = math.pi
+        size = PERLIN_SIZE
+        falloff = self.falloff
+        x, y, z = abs(x), abs(y or 0), abs(z or 0)
+        if not math.isfinite(x + y + z):
+            return math.nan
+        xi, yi, zi = math.floor(x), math.floor(y), math.floor(z)
+        xf, yf, zf = x - xi, y - yi, z - zi
+        r = 0.0
+        ampl = 0.5
+        for _ in range(self.octaves):
+            of = xi + (yi << PERLIN_YWRAPB) + (zi << PERLIN_ZWRAPB)
+            rxf = 0.5 * (1.0 - cos(xf * pi))
+            ryf = 0.5 * (1.0 - cos(yf * pi))
+
+            n1 = perlin[of & size]
+            n1 += rxf * (perlin[(of + 1) & size] - n1)
+            n2 = perlin[(of + PERLIN_YWRAP) & size]
+            n2 += rxf * (perlin[(of + PERLIN_YWRAP + 1) & size] - n2)
+            n1 += ryf * (n2 - n1)
+
+            of += PERLIN_ZWRAP
+            n2 = perlin[of & size]
+            n2 += rxf * (perlin[(of + 1) & size] - n2)
+            n3 = perlin[(of + PERLIN_YWRAP) & size]
+            n3 += rxf * (perlin[(of + PERLIN_YWRAP + 1) & size] - n3)
+            n2 += ryf * (n3 - n2)
+
+            n1 += 0.5 * (1.0 - cos(zf * pi)) * (n2 - n1)
+            r += n1 * ampl
+            ampl *= falloff
+            xi <<= 1
+            xf *= 2
+            yi <<= 1
+            yf *= 2
+            zi <<= 1
+            zf *= 2
+            if xf >= 1.0:
+                xi += 1
+                xf -= 1
+            if yf >= 1.0:
+                yi += 1
+                yf -= 1
+            if zf >= 1.0:
+                zi += 1
+                zf -= 1
+        return r
+
+    def noise_array(self, x, y=None, z=None) -> np.ndarray[np.floating]:
+        """Returns the noise values at arrays of coordinates.
+
+        The coordinates are broadcast against each other, and each octave only
+        computes the smoothing of a coordinate for its own shape, so a row of
+        x values and a column of y values do as little work as possible.
+        """
+        if self._perlin_array is None:
+            # Repeat the start of the table at the end so that neighboring values
+            # can be looked up without wrapping each index.
+            table = np.array(self._perlin or self._table())
+            self._perlin_array = np.concatenate(
+                (table, table[: PERLIN_ZWRAP + PERLIN_YWRAP + 1])
+            )
+        perlin = self._perlin_array
+        coords = []
+        for value in (x, y, z):
+            value = np.abs(np.asarray(0.0 if value is None else value, dtype=np.float64))
+            floor = np.floor(value)
+            coords.append((floor.astype(np.int64), value - floor))
+        (xi, xf), (yi, yf), (zi, zf) = coords
+        r = 0.0
+        ampl = 0.5
+        for _ in range(self.octaves):
+            of = (xi + (yi << PERLIN_YWRAPB) + (zi << PERLIN_ZWRAPB)) & PERLIN_SIZE
+            rxf = 0.5 * (1.0 - np.cos(xf * np.pi))
+            ryf = 0.5 * (1.0 - np.cos(yf * np.pi))
+
+            n1 = perlin[of]
+            n1 += rxf * (perlin[of + 1] - n1)
+            n2 = perlin[of + PERLIN_YWRAP]
+            n2 += rxf * (perlin[of + (PERLIN_YWRAP + 1)] - n2)
+            n1 += ryf * (n2 - n1)
+
+            of += PERLIN_ZWRAP
+            n2 = perlin[of]
+            n2 += rxf * (perlin[of + 1] - n2)
+            n3 = perlin[of + PERLIN_YWRAP]
+            n3 += rxf * (perlin[of + (PERLIN_YWRAP + 1)] - n3)
+            n2 += ryf * (n3 - n2)
+
+            n1 += 0.5 * (1.0 - np.cos(zf * np.pi)) * (n2 - n1)
+            r += n1 * ampl
+            ampl *= self.falloff
+            xi, xf = _next_octave(xi, xf)
+            yi, yf = _next_octave(yi, yf)
+            zi, zf = _next_octave(zi, zf)
+        return r
+
+    def grid(
+        self, x0: float, y0: float, dx: float, dy: float, w: int, h: int, z=0.0
+    ) -> np.ndarray[np.floating]:
+        """Returns an (h, w) array of noise values on an evenly spaced grid."""
+        xs = x0 + dx * np.arange(w)
+        ys = y0 + dy * np.arange(h)[:, np.newaxis]
+        return self.noise_array(xs, ys, z)
+
+    def detail(self, lod: int, falloff: float | None = None):
+        """Sets the number of octaves and the falloff, ignoring values that aren't positive."""
+        if lod > 0:
+            self.octaves = math.ceil(lod)
+        if falloff is not None and falloff > 0:
+            self.falloff = falloff
+
+    def seed(self, seed: float):
+        """Fills the table of random values the same way as p5.js's noiseSeed()."""
+        # Same linear congruential generator as p5.js.
+        m = 4294967296
+        a = 1664525
+        c = 1013904223
+        z = int(seed) % m
+        perlin = []
+        for _ in range(PERLIN_SIZE + 1):
+            z = (a * z + c) % m
+            perlin.append(z / m)
+        self._perlin = perlin
+        self._perlin_array = None
+
+
+def _next_octave(i: np.ndarray, f: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Doubles a noise coordinate's integer and fractional parts for the next octave."""
+    i = i << 1
+    f = f * 2
+    carry = f >= 1.0
+    return i + carry, f - carry
+
+
+class Noise(BaseSketch):
+    def noise(
+        self,
+        x: float | np.ndarray,
+        y: float | np.ndarray | None = None,
+        z: float | np.ndarray | None = None,
+    ) -> float | np.ndarray[np.floating]:
         """Returns the Perlin noise value at specified coordinates.
         Perlin noise is a random sequence generator producing a more naturally
         ordered, harmonic succession of numbers compared to the standard random()
@@ -31,8 +214,65 @@ class Noise(BaseSketch):
         loop). As a general rule the smaller the difference between coordinates,
         the smoother the resulting noise sequence will be. Steps of 0.005-0.03
         work best for most applications, but this will differ depending on use.
+
+        The coordinates can also be numpy arrays, in which case they are broadcast
+        against each other and an array of noise values is returned, computed all
+        at once.
+        """
+        if (
+            isinstance(x, np.ndarray)
+            or isinstance(y, np.ndarray)
+            or isinstance(z, np.ndarray)
+        ):
+            return self._noise.noise_array(x, y, z)
+        return self._noise.noise(x, y, z)
+
+    def noise_grid(
+        self,
+        x0: float,
+        y0: float,
+        dx: float,
+        dy: float,
+        w: int,
+        h: int,
+        z: float | np.ndarray = 0.0,
+    ) -> np.ndarray[np.floating]:
+        """Returns Perlin noise values on a grid as a 2D numpy array.
+
+        Parameters
+        ----------
+
+        x0: float
+            x coordinate of the first column
+
+        y0: float
+            y coordinate of the first row
+
+        dx: float
+            step between the x coordinates of neighboring columns
+
+        dy: float
+            step between the y coordinates of neighboring rows
+
+        w: int
+            number of columns
+
+        h: int
+            number of rows
+
+        z: float | np.ndarray = 0.0
+            z coordinate of the grid, such as the time for an animated field
+
+        Notes
+        -----
+
+        Returns Perlin noise values on a grid as a 2D numpy array. The array has
+        ``h`` rows and ``w`` columns, and the value in row ``j`` and column ``i`` is
+        ``noise(x0 + i * dx, y0 + j * dy, z)``. The whole grid is computed at once,
+        which is much faster than calling ``noise()`` for every cell, for example to
+        fill a flow field or a terrain every frame.
         """
-        return self._p5js.noise(x, y, z)
+        return self._noise.grid(x0, y0, dx, dy, w, h, z)
 
     def noise_detail(self, lod: float, falloff: float):
         """Adjusts the character and level of detail produced by the Perlin noise
@@ -51,12 +291,13 @@ class Noise(BaseSketch):
         signal created by the noise() function can be adapted to fit very
         specific needs and characteristics.
         """
-        self._p5js.noiseDetail(lod, falloff)
+        self._noise.detail(lod, falloff)
 
     def noise_seed(self, seed: float):
         """Sets the seed value for noise().
         By default, noise() produces different results each time the program is
         run. Set the seed parameter to a constant to return the same
-        pseudo-random numbers each time the software is run.
+        pseudo-random numbers each time the software is run. Noise is computed in
+        Python, and a given seed produces the same values as in p5.js.
         """
-        self._p5js.noiseSeed(seed)
+        self._noise.seed(seed)
@@ -1,35 +1,76 @@
-import random as rnd
+from collections.abc import Sequence
+
+import numpy as np
+
+from .vector import Vector
+
+
+def _seed_value(seed: float) -> int:
+    """Turns a seed into an int for numpy, keeping every float seed distinct."""
+    return int(np.array(seed, dtype=np.float64).view(np.uint64))
 
 
 class Random:
+    _rng: np.random.Generator
+
     def random_seed(self, seed: float):
         """Sets the seed value for random().
 
         By default, random() produces different results each time the program is
         run. Set the seed parameter to a constant to return the same
         pseudo-random numbers each time the software is run.
+
+        Each sketch has its own random number generator, so seeding one sketch
+        doesn't affect the random numbers of other sketches on the page. The seed
+        also applies to random_gaussian(), random_choice(), shuffle(), and
+        Vector.random().
         """
-        rnd.seed(seed)
+        self._rng = Vector._rng = np.random.default_rng(_seed_value(seed))
 
-    def random(self, min: float, max: float | None = None) -> float:
+    def random(
+        self,
+        min: float | Sequence | None = None,
+        max: float | None = None,
+        *,
+        size: int | tuple[int, ...] | None = None,
+    ) -> float | np.ndarray[np.floating]:
         """Return a random floating-point number.
 
-        Takes either 1 or 2 arguments.
+        Takes either 0, 1 or 2 arguments.
+
+        If no argument is given, returns a random number from 0 up to (but not
+        including) 1.
 
         If one argument is given and it is a number, returns a random number from
-        0 up to (but not including) the number.
+        0 up to (but not including) the number. If it is a list, returns a random
+        element from it, like random_choice().
 
         If two arguments are given, returns a random number from the first
         argument up to (but not including) the second argument.
+
+        If size is given, returns a numpy array of that shape filled with random
+        numbers instead, for example random(0, width, size=(1000, 2)) for the
+        positions of 1000 particles.
         """
-        if max:
-            return rnd.uniform(min, max)
+        if max is not None:
+            low, high = min, max
+        elif min is None:
+            low, high = 0.0, 1.0
+        elif isinstance(min, (Sequence, np.ndarray)):
+            return self.random_choice(min, size=size)
         else:
-            return rnd.uniform(0, min)
+            low, high = 0.0, min
+        if size is None:
+            return low + (high - low) * self._rng.random()
+        return low + (high - low) * self._rng.random(size)
 
     def random_gaussian(
-        self, mean: float | None = None, sd: float | None = None
-    ) -> float:
+        self,
+        mean: float | None = None,
+        sd: float | None = None,
+        *,
+        size: int | tuple[int, ...] | None = None,
+    ) -> float | np.ndarray[np.floating]:
         """Returns a random number fitting a Gaussian, or normal, distribution.
         There is theoretically no minimum or maximum value that random_gaussian()
         might return. Rather, there is just a very low probability that values far
@@ -39,5 +80,47 @@ class Random:
         If one arg, that arg is the mean and the standard deviation is 1.
         If two args, the first arg is the mean and the second is the standard
         deviation.
+
+        If size is given, returns a numpy array of that shape filled with random
+        numbers instead.
+        """
+        mean = 0.0 if mean is None else mean
+        sd = 1.0 if sd is None else sd
+        if size is None:
+            return mean + sd * self._rng.standard_normal()
+        return mean + sd * self._rng.standard_normal(size)
+
+    def random_choice(
+        self,
+        choices: Sequence | np.ndarray,
+        size: int | None = None,
+        replace: bool = True,
+    ) -> object | list | np.ndarray:
+        """Returns a random element from a list.
+
+        If size is given, returns a list of that many random elements instead, or a
+        numpy array if choices is a numpy array. Elements can be chosen more than
+        once unless replace is False.
+        """
+        if len(choices) == 0:
+            raise RuntimeError("Cannot choose from an empty list")
+        if isinstance(choices, np.ndarray):
+            return self._rng.choice(choices, size, replace=replace)
+        if size is None:
+            return choices[int(self._rng.integers(len(choices)))]
+        indices = self._rng.choice(len(choices), size, replace=replace)
+        return [choices[i] for i in indices.tolist()]
+
+    def shuffle(
+        self, values: Sequence | np.ndarray, modify: bool = False
+    ) -> list | np.ndarray:
+        """Shuffles the elements of a list or numpy array.
+
+        Returns a shuffled copy of values, or shuffles values itself and returns it
+        if modify is True. Numpy arrays are shuffled along their first axis, so the
+        rows of an (N, 2) array of points stay together.
         """
-        return rnd.gauss(mean, sd)
+        if not modify:
+            values = values.copy() if isinstance(values, np.ndarray) else list(values)
+        self._rng.shuffle(values)
+        return values
@@ -0,0 +1,134 @@
+from __future__ import annotations
+from collections.abc import Iterable
+from functools import lru_cache
+
+import numpy as np
+
+from .vector import Vector
+from .vector_array import VectorArray
+
+_AXES = {1: 0, "x": 0, 2: 1, "y": 1, 3: 2, "z": 2}
+
+
+def _axis_key(axis) -> tuple[float, ...] | int | None:
+    """Turns an axis into something hashable for the matrix cache."""
+    if axis is None:
+        return None
+    elif isinstance(axis, (int, np.integer, str)):
+        if axis not in _AXES:
+            raise RuntimeError(
+                "axis must be 1, 2, or 3, one of 'x', 'y', and 'z', or a 3D vector"
+            )
+        return _AXES[axis]
+    elif isinstance(axis, Vector):
+        axis = axis._data
+    values = tuple(float(value) for value in axis)
+    if len(values) != 3:
+        raise RuntimeError("Can only rotate around another 3D Vector")
+    if not any(values):
+        raise RuntimeError("Cannot rotate around a vector of zeros")
+    return values
+
+
+@lru_cache(maxsize=256)
+def _cached_matrix(angle: float, axis: tuple[float, ...] | int | None) -> np.ndarray:
+    sin, cos = np.sin(angle), np.cos(angle)
+    if axis is None:
+        rot = np.array([[cos, -sin], [sin, cos]])
+    elif axis == 0:
+        rot = np.array([[1, 0, 0], [0, cos, -sin], [0, sin, cos]])
+    elif axis == 1:
+        rot = np.array([[cos, 0, sin], [0, 1, 0], [-sin, 0, cos]])
+    elif axis == 2:
+        rot = np.array([[cos, -sin, 0], [sin, cos, 0], [0, 0, 1]])
+    else:
+        u = np.array(axis) / np.sqrt(np.sum(np.square(axis)))
+        cross = np.array([[0, -u[2], u[1]], [u[2], 0, -u[0]], [-u[1], u[0], 0]])
+        rot = cos * np.eye(3) + sin * cross + (1 - cos) * np.outer(u, u)
+    rot.flags.writeable = False
+    return rot
+
+
+def rotation_matrix(
+    angle: float, axis: int | str | Vector | Iterable | None = None
+) -> np.ndarray[np.floating]:
+    """Get the matrix for a rotation.
+
+    Parameters
+    ----------
+
+    angle: float
+        angle of rotation, measured in radians
+
+    axis: int | str | Vector | Iterable | None = None
+        axis to rotate around, or None for a 2D rotation
+
+    Notes
+    -----
+
+    Get the matrix for a rotation. Without an ``axis`` this is a ``(2, 2)`` matrix
+    that rotates 2D vectors counter-clockwise. Otherwise it's a ``(3, 3)`` matrix
+    that rotates 3D vectors around the x, y, or z axis, given as 1, 2, or 3 or as
+    ``'x'``, ``'y'``, or ``'z'``, or around an arbitrary 3D vector, following the
+    right-hand rule.
+
+    Recently used matrices are cached, so rotating by the same angles again, for
+    example every frame, doesn't recompute any trigonometry. The returned matrix is
+    shared with the cache and can't be changed.
+    """
+    return _cached_matrix(float(angle), _axis_key(axis))
+
+
+def rotate_vectors(
+    vectors: VectorArray | np.ndarray,
+    angle: float,
+    axis: int | str | Vector | Iterable | None = None,
+    *,
+    out: VectorArray | np.ndarray | None = None,
+) -> VectorArray | np.ndarray[np.floating]:
+    """Rotate many vectors by the same rotation at once.
+
+    Parameters
+    ----------
+
+    angle: float
+        angle of rotation, measured in radians
+
+    axis: int | str | Vector | Iterable | None = None
+        axis to rotate 3D vectors around, or None for 2D vectors
+
+    out: VectorArray | np.ndarray | None = None
+        vectors or numpy array to store the result in
+
+    vectors: VectorArray | np.ndarray
+        ``(N, 2)`` or ``(N, 3)`` vectors to rotate
+
+    Notes
+    -----
+
+    Rotate many vectors by the same rotation at once. The rotation is described
+    the same way as in ``rotation_matrix()`` and applied to every vector with a
+    single matrix multiplication. Returns new vectors of the same type as
+    ``vectors`` unless ``out`` is given, which can be ``vectors`` itself to rotate
+    them in place.
+    """
+    rot = rotation_matrix(angle, axis)
+    data = vectors._data if isinstance(vectors, VectorArray) else np.asarray(vectors)
+    if data.ndim != 2 or data.shape[1] != rot.shape[0]:
+        raise RuntimeError(
+            f"Cannot rotate vectors with shape {data.shape} using a {rot.shape[0]}D rotation"
+        )
+    if out is None:
+        result = data @ rot.T
+        if isinstance(vectors, VectorArray):
+            return VectorArray(result.astype(data.dtype, copy=False), copy=False)
+        return result
+    out_data = out._data if isinstance(out, VectorArray) else out
+    try:
+        np.matmul(data, rot.T.astype(out_data.dtype, copy=False), out=out_data)
+    except ValueError as e:
+        raise RuntimeError(
+            "Unable to store the rotated vectors in out, probably because of a size mismatch. The error message is: "
+            + str(e)
+        ) from None
+    return out
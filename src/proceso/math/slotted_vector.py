@@ -0,0 +1,1160 @@
+from __future__ import annotations
+import itertools
+import math
+import operator
+import warnings
+from abc import abstractmethod
+from collections.abc import Iterable, Sequence
+
+import numpy as np
+
+from .vector import Vector, _js_buffer
+
+_NUMBERS = (int, float, np.integer, np.floating)
+
+
+def _values(args: tuple, dim: int | None) -> list[float]:
+    """Flattens constructor arguments into a list of floats."""
+    if len(args) == 0:
+        return [0.0] * (Vector._DEFAULT_DIM if dim is None else dim)
+    values = []
+    for i, arg in enumerate(args):
+        if isinstance(arg, _NUMBERS):
+            values.append(float(arg))
+        elif isinstance(arg, Iterable):
+            values.extend(float(value) for value in arg)
+        else:
+            raise RuntimeError(
+                f"Argument {i} has type {type(arg).__name__} and cannot be used used in a Vector"
+            )
+    if not 2 <= len(values) <= 4:
+        raise RuntimeError(f"Cannot create a Vector with {len(values)} values")
+    if dim is not None and len(values) != dim:
+        raise RuntimeError(
+            f"dim parameter is {dim} but Vector values imply dimension of {len(values)}"
+        )
+    return values
+
+
+def _check_dtype(dtype):
+    if dtype is not None and np.dtype(dtype) != np.float64:
+        raise RuntimeError(
+            "Slotted vectors always store 64 bit floats. Use a numpy-backed Vector for other dtypes."
+        )
+
+
+def _vector(values: list[float]) -> SlottedVector | Vector:
+    """Creates a slotted vector, or a numpy-backed vector for 4D values."""
+    if len(values) == 2:
+        return SlottedVector2D._make(*values)
+    elif len(values) == 3:
+        return SlottedVector3D._make(*values)
+    return Vector._from_data(np.array(values, dtype=np.float64))
+
+
+class SlottedVector(Sequence):
+    """Class to describe a 2D or 3D vector using plain Python floats.
+
+    Notes
+    -----
+
+    Class to describe a 2D or 3D vector using plain Python floats. Slotted
+    vectors have the same methods, properties, and swizzles as ``Vector``, but
+    store their values in ``__slots__`` instead of a numpy array. Creating one
+    and doing math with it avoids numpy's overhead, which dominates for small
+    vectors, especially in the browser.
+
+    Use ``Sketch(vectors="python")`` to make ``Sketch.Vector``,
+    ``Sketch.Vector2D``, and ``Sketch.Vector3D`` create slotted vectors. 4D
+    vectors are always backed by numpy.
+
+    Slotted vectors work with numpy through ``__array__``. Their ``data``
+    property returns a new numpy array each time, so changing that array
+    doesn't change the vector. Division by zero raises ``ZeroDivisionError``
+    instead of producing infinite values.
+    """
+
+    __slots__ = ()
+
+    def __new__(cls, *args, dim: int = None, dtype: type = None, copy: bool = True):
+        if (
+            dim is None
+            and dtype is None
+            and len(args) == 2
+            and (type(args[0]) is float or type(args[0]) is int)
+            and (type(args[1]) is float or type(args[1]) is int)
+        ):
+            return SlottedVector2D._make(float(args[0]), float(args[1]))
+        _check_dtype(dtype)
+        return _vector(_values(args, dim))
+
+    @classmethod
+    @abstractmethod
+    def _make(cls, *values: float) -> SlottedVector:
+        """Creates a vector from its components without any checks."""
+
+    @abstractmethod
+    def _components(self) -> tuple[float, ...]:
+        """Returns the vector's components."""
+
+    @abstractmethod
+    def _set_components(self, values: Iterable[float]):
+        """Sets the vector's components."""
+
+    def _other(self, other, name: str) -> tuple[float, ...] | None:
+        """Returns the components of other if it's a vector, otherwise None."""
+        if type(other) is type(self):
+            return other._components()
+        elif isinstance(other, SlottedVector):
+            values = other._components()
+        elif isinstance(other, Vector):
+            values = other._data.tolist()
+        elif isinstance(other, np.ndarray) and other.ndim == 1 and 2 <= other.size <= 4:
+            values = other.tolist()
+        else:
+            return None
+        if len(values) != len(self):
+            raise RuntimeError(
+                f"Cannot perform {name} on a {len(self)}D Vector and a {len(values)}D Vector. The dimensions must be the same."
+            )
+        return values
+
+    def _run_op(self, op, other, opname, swap=False, inplace=False, allow2vectors=False):
+        values = self._components()
+        if isinstance(other, _NUMBERS):
+            if swap:
+                result = [op(other, value) for value in values]
+            else:
+                result = [op(value, other) for value in values]
+        elif isinstance(other, (SlottedVector, Vector)) or (
+            isinstance(other, np.ndarray) and other.shape == (len(values),)
+        ):
+            if isinstance(other, (SlottedVector, Vector)) and not allow2vectors:
+                raise RuntimeError(
+                    f"Cannot perform {opname} operation on two Vectors. If you want to do {opname} on the Vector's data elementwise, use the `.data` attribute to access the Vector's data as a numpy array."
+                )
+            other = self._other(other, opname)
+            if swap:
+                result = [op(b, a) for a, b in zip(values, other)]
+            else:
+                result = [op(a, b) for a, b in zip(values, other)]
+        else:
+            try:
+                data = np.array(values)
+                result = op(other, data) if swap else op(data, other)
+            except ValueError as e:
+                raise RuntimeError(
+                    f"Unable to perform {opname} on a Vector and a {type(other).__name__} object, probably because of a size mismatch. The error message is: "
+                    + str(e)
+                ) from None
+            if result.ndim != 1 or not 2 <= result.size <= 4:
+                return result
+            result = result.tolist()
+        if inplace:
+            self._set_components(result)
+            return self
+        return _vector(result)
+
+    def __add__(self, other):
+        return self._run_op(operator.add, other, "addition", allow2vectors=True)
+
+    def __iadd__(self, other):
+        return self._run_op(
+            operator.add, other, "addition", inplace=True, allow2vectors=True
+        )
+
+    def __radd__(self, other):
+        return self._run_op(
+            operator.add, other, "addition", swap=True, allow2vectors=True
+        )
+
+    def __sub__(self, other):
+        return self._run_op(operator.sub, other, "subtraction", allow2vectors=True)
+
+    def __isub__(self, other):
+        return self._run_op(
+            operator.sub, other, "subtraction", inplace=True, allow2vectors=True
+        )
+
+    def __rsub__(self, other):
+        return self._run_op(
+            operator.sub, other, "subtraction", swap=True, allow2vectors=True
+        )
+
+    def __mul__(self, other):
+        return self._run_op(operator.mul, other, "multiplication")
+
+    def __imul__(self, other):
+        return self._run_op(operator.mul, other, "multiplication", inplace=True)
+
+    def __rmul__(self, other):
+        return self._run_op(operator.mul, other, "multiplication", swap=True)
+
+    def __truediv__(self, other):
+        return self._run_op(operator.truediv, other, "division")
+
+    def __itruediv__(self, other):
+        return self._run_op(operator.truediv, other, "division", inplace=True)
+
+    def __rtruediv__(self, other):
+        return self._run_op(operator.truediv, other, "division", swap=True)
+
+    def __floordiv__(self, other):
+        return self._run_op(operator.floordiv, other, "integer division")
+
+    def __ifloordiv__(self, other):
+        return self._run_op(
+            operator.floordiv, other, "integer division", inplace=True
+        )
+
+    def __rfloordiv__(self, other):
+        return self._run_op(operator.floordiv, other, "integer division", swap=True)
+
+    def __mod__(self, other):
+        return self._run_op(operator.mod, other, "modular division")
+
+    def __imod__(self, other):
+        return self._run_op(operator.mod, other, "modular division", inplace=True)
+
+    def __rmod__(self, other):
+        return self._run_op(operator.mod, other, "modular division", swap=True)
+
+    def __divmod__(self, other):
+        return self.__floordiv__(other), self.__mod__(other)
+
+    def __rdivmod__(self, other):
+        return self.__rfloordiv__(other), self.__rmod__(other)
+
+    def __pow__(self, other):
+        return self._run_op(operator.pow, other, "power")
+
+    def __ipow__(self, other):
+        return self._run_op(operator.pow, other, "power", inplace=True)
+
+    def __matmul__(self, other):
+        return self._run_op(operator.matmul, other, "matrix multiplication")
+
+    def __rmatmul__(self, other):
+        return self._run_op(operator.matmul, other, "matrix multiplication", swap=True)
+
+    def __pos__(self):
+        return self
+
+    def __neg__(self):
+        return self._make(*[-value for value in self._components()])
+
+    def __abs__(self):
+        return self._make(*[abs(value) for value in self._components()])
+
+    def __round__(self):
+        return self._make(*[float(round(value)) for value in self._components()])
+
+    def __bool__(self):
+        return any(value != 0.0 for value in self._components())
+
+    def __eq__(self, other):
+        return (
+            isinstance(other, type(self))
+            and self._components() == other._components()
+        )
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    __hash__ = None
+
+    def __getitem__(self, key):
+        if isinstance(key, (int, np.integer)):
+            return self._components()[key]
+        return np.array(self._components())[key]
+
+    def __setitem__(self, key, val):
+        values = np.array(self._components())
+        values[key] = val
+        self._set_components(values.tolist())
+
+    def __len__(self):
+        return len(self._components())
+
+    def __iter__(self):
+        return iter(self._components())
+
+    def __array__(self, dtype=None, copy=None):
+        return np.array(self._components(), dtype=dtype or np.float64)
+
+    def __str__(self):
+        return f"Vector{len(self)}D({', '.join(map(str, self._components()))})"
+
+    def __repr__(self):
+        return f"Vector{len(self)}D({', '.join(map(repr, self._components()))})"
+
+    # *** BEGIN METHODS ***
+
+    def astype(self, dtype) -> Vector:
+        """Create a new numpy-backed Vector instance with a specified numpy dtype."""
+        return Vector(self._components(), dtype=dtype)
+
+    def tolist(self) -> list[float]:
+        """Return the vector's values as a list."""
+        return list(self._components())
+
+    def to_js_buffer(self) -> object:
+        """Copy the vector's values into a ``Float64Array`` for JavaScript.
+
+        Notes
+        -----
+
+        Copy the vector's values into a ``Float64Array`` for JavaScript. Python
+        floats aren't stored in a buffer, so unlike ``Vector.to_js_buffer()`` this
+        always copies them, and later changes to the vector aren't seen by
+        JavaScript.
+        """
+        return _js_buffer(np.array(self._components()))
+
+    def _get_data(self) -> np.ndarray[np.floating]:
+        return np.array(self._components())
+
+    def _get_copy(self) -> SlottedVector:
+        return self._make(*self._components())
+
+    def _get_dim(self) -> int:
+        return len(self._components())
+
+    def _get_dtype(self) -> type:
+        return np.dtype(np.float64)
+
+    data: np.ndarray[np.floating] = property(
+        _get_data,
+        doc="""A new numpy array with the vector's data values.""",
+    )
+    copy = property(
+        _get_copy,
+        doc="""Create an identical copy of this Vector instance.""",
+    )
+    dim: int = property(
+        _get_dim,
+        doc="""The vector's dimension. This will be either 2 or 3.""",
+    )
+    dtype: type = property(
+        _get_dtype,
+        doc="""Vector data type. This is always ``np.float64``.""",
+    )
+
+    def _store(self, out, values: list[float]):
+        """Writes values into out, for methods with an out parameter."""
+        if isinstance(out, SlottedVector):
+            if len(out) != len(values):
+                raise RuntimeError(
+                    f"Unable to store a {len(values)}D result in a {len(out)}D Vector"
+                )
+            out._set_components(values)
+        elif isinstance(out, (Vector, np.ndarray)):
+            try:
+                (out._data if isinstance(out, Vector) else out)[...] = values
+            except ValueError as e:
+                raise RuntimeError(
+                    "Unable to store the result in out, probably because of a size mismatch. The error message is: "
+                    + str(e)
+                ) from None
+        else:
+            raise RuntimeError(
+                f"out must be a Vector or a numpy array, not {type(out).__name__}"
+            )
+        return out
+
+    def lerp(
+        self,
+        other: SlottedVector | Vector | np.ndarray,
+        amt: float | np.ndarray,
+        *,
+        out: SlottedVector | Vector | np.ndarray | None = None,
+    ) -> SlottedVector | np.ndarray[np.floating]:
+        """Calculates a vector between two vectors at a specific increment.
+
+        Parameters
+        ----------
+
+        amt: float | np.ndarray
+            float between 0.0 and 1.0
+
+        other: SlottedVector | Vector | np.ndarray
+            other vector to interpolate between
+
+        out: SlottedVector | Vector | np.ndarray | None = None
+            vector or numpy array to store the result in
+
+        Notes
+        -----
+
+        Calculates a vector between two vectors at a specific increment. See
+        ``Vector.lerp()``.
+        """
+        values = self._other(other, "lerp of")
+        if values is not None and isinstance(amt, _NUMBERS):
+            result = [a + (b - a) * amt for a, b in zip(self._components(), values)]
+            if out is None:
+                return self._make(*result)
+            return self._store(out, result)
+        result = Vector._from_data(self._get_data()).lerp(
+            other._get_data() if isinstance(other, SlottedVector) else other, amt
+        )
+        if out is None:
+            return result
+        return self._store(out, np.asarray(result).tolist())
+
+    def add_scaled(
+        self, other: SlottedVector | Vector | np.ndarray, k: float
+    ) -> SlottedVector:
+        """Add another vector multiplied by a number to this vector.
+
+        Parameters
+        ----------
+
+        k: float
+            number to multiply the other vector by
+
+        other: SlottedVector | Vector | np.ndarray
+            vector to add
+
+        Notes
+        -----
+
+        Add another vector multiplied by a number to this vector. See
+        ``Vector.add_scaled()``.
+        """
+        values = self._other(other, "addition")
+        if values is None:
+            raise RuntimeError(
+                f"Cannot add a {type(other).__name__} object to a Vector with add_scaled"
+            )
+        self._set_components(
+            [a + b * k for a, b in zip(self._components(), values)]
+        )
+        return self
+
+    def dist(
+        self, other: SlottedVector | Vector | np.ndarray
+    ) -> float | np.ndarray[np.floating]:
+        """Calculate the distance between two vectors.
+
+        Parameters
+        ----------
+
+        other: SlottedVector | Vector | np.ndarray
+            vector to calculate the distance from
+
+        Notes
+        -----
+
+        Calculate the distance between two vectors.
+        """
+        values = self._other(other, "distance between")
+        if values is not None:
+            return math.dist(self._components(), values)
+        return Vector._from_data(self._get_data()).dist(other)
+
+    def dot(
+        self, other: SlottedVector | Vector | np.ndarray
+    ) -> float | np.ndarray[np.floating]:
+        """Calculate the dot product between two vectors.
+
+        Parameters
+        ----------
+
+        other: SlottedVector | Vector | np.ndarray
+            vector to calculate the dot product with
+
+        Notes
+        -----
+
+        Calculate the dot product between two vectors.
+        """
+        values = self._other(other, "dot product for")
+        if values is not None:
+            return sum([a * b for a, b in zip(self._components(), values)])
+        return Vector._from_data(self._get_data()).dot(other)
+
+    def angle_between(
+        self, other: SlottedVector | Vector | np.ndarray
+    ) -> float | np.ndarray[np.floating]:
+        """Measure the angle between two vectors.
+
+        Parameters
+        ----------
+
+        other: SlottedVector | Vector | np.ndarray
+            vector to measure angle between
+
+        Notes
+        -----
+
+        Measure the angle between two vectors.
+        """
+        values = self._other(other, "angle between")
+        if values is not None:
+            mags = math.hypot(*self._components()) * math.hypot(*values)
+            cos = sum(a * b for a, b in zip(self._components(), values)) / mags
+            return math.acos(max(-1.0, min(1.0, cos)))
+        return Vector._from_data(self._get_data()).angle_between(other)
+
+    def cross(
+        self,
+        other: SlottedVector | Vector | np.ndarray,
+        *,
+        out: SlottedVector | Vector | np.ndarray | None = None,
+    ) -> float | SlottedVector | np.ndarray[np.floating]:
+        """Calculate the vector cross product of two 3D vectors.
+
+        Parameters
+        ----------
+
+        other: SlottedVector | Vector | np.ndarray
+            2D or 3D vector to calculate the cross product with
+
+        out: SlottedVector | Vector | np.ndarray | None = None
+            vector or numpy array to store the result in
+
+        Notes
+        -----
+
+        Calculate the vector cross product of two 3D vectors. If one of the vectors is a
+        2D vector, its z-value is assumed to be zero and the vector cross product is
+        calculated normally. If both vectors are 2D vectors, the returned value will be
+        the wedge product.
+        """
+        if out is not None:
+            result = self.cross(other)
+            if isinstance(result, float):
+                raise RuntimeError(
+                    "The cross product of two 2D vectors is a number and cannot be stored in out"
+                )
+            return self._store(out, list(result))
+        if isinstance(other, (SlottedVector, Vector)) or (
+            isinstance(other, np.ndarray) and other.ndim == 1
+        ):
+            values = list(other)
+            if len(values) == 4:
+                raise RuntimeError("Cannot calculate the cross product with a 4D Vector")
+            a = self._components()
+            if len(a) == 2 and len(values) == 2:
+                return a[0] * values[1] - a[1] * values[0]
+            ax, ay, az = (*a, 0.0)[:3]
+            bx, by, bz = (*values, 0.0)[:3]
+            return SlottedVector3D._make(
+                ay * bz - az * by, az * bx - ax * bz, ax * by - ay * bx
+            )
+        return Vector._from_data(self._get_data()).cross(other)
+
+    def _get_mag(self) -> float:
+        return math.hypot(*self._components())
+
+    def set_mag(self, mag: float) -> SlottedVector:
+        """Set the vector's magnitude.
+
+        Notes
+        -----
+
+        Set the vector's magnitude. Setting this property to a non-negative number will
+        adjust the vector's magnitude to that value.
+        """
+        if mag == 0:
+            self._set_components([0.0] * len(self))
+        else:
+            self.normalize()
+            self._set_components([value * mag for value in self._components()])
+        return self
+
+    def _get_mag_sq(self) -> float:
+        return sum(value * value for value in self._components())
+
+    def set_mag_sq(self, mag_sq: float) -> SlottedVector:
+        """Set the square of the vector's magnitude.
+
+        Notes
+        -----
+
+        Set the square of the vector's magnitude. Negative values will result in an
+        error.
+        """
+        if mag_sq < 0:
+            raise RuntimeError("Cannot set squared magnitude to a negative number")
+        return self.set_mag(mag_sq**0.5)
+
+    def normalize(self) -> SlottedVector:
+        """Normalize the vector by setting the vector's magnitude to 1.0.
+
+        Notes
+        -----
+
+        Normalize the vector by setting the vector's magnitude to 1.0. This method
+        cannot be used on a vector of zeros, because a vector of zeros cannot be
+        normalized.
+        """
+        mag = self._get_mag()
+        if mag > 0:
+            self._set_components([value / mag for value in self._components()])
+            return self
+        else:
+            warnings.warn(
+                "Using normalize on a zero vector has no effect", stacklevel=2
+            )
+
+    def _get_norm(self) -> SlottedVector:
+        return self._get_copy().normalize()
+
+    mag: float = property(
+        _get_mag,
+        set_mag,
+        doc="""The vector's magnitude.""",
+    )
+    mag_sq: float = property(
+        _get_mag_sq,
+        set_mag_sq,
+        doc="""The square of the vector's magnitude.""",
+    )
+    norm: SlottedVector = property(
+        _get_norm,
+        doc="""Normalized copy of the vector.""",
+    )
+
+    def set_limit(self, max_mag: float) -> SlottedVector:
+        """Constrain the vector's magnitude to a specified value.
+
+        Parameters
+        ----------
+
+        max_mag: float
+            maximum vector magnitude
+
+        Notes
+        -----
+
+        Constrain the vector's magnitude to a specified value. If the vector's magnitude
+        is already less than or equal to ``max_mag``, this method will have no effect.
+        If the vector's magnitude is larger, it will be set to ``max_mag``. The
+        ``max_mag`` parameter cannot be a negative number.
+        """
+        if max_mag < 0:
+            raise RuntimeError("Cannot set limit to a negative number")
+        mag_sq = self._get_mag_sq()
+        if mag_sq > max_mag * max_mag:
+            scale = max_mag / mag_sq**0.5
+            self._set_components([value * scale for value in self._components()])
+        return self
+
+    def _get_heading(self) -> float | tuple[float]:
+        return Vector._from_data(self._get_data())._get_heading()
+
+    def set_heading(self, *heading) -> SlottedVector:
+        """Align vector with the specified heading.
+
+        Parameters
+        ----------
+
+        heading
+            heading values in the sketch's angle mode
+
+        Notes
+        -----
+
+        Align vector with the specified heading. See ``Vector.set_heading()``.
+        """
+        data = Vector._from_data(self._get_data()).set_heading(*heading)._data
+        self._set_components(data.tolist())
+        return self
+
+    heading: tuple[float] = property(
+        _get_heading,
+        set_heading,
+        doc="""The vector's heading, measured in the sketch's angle mode. See
+        ``Vector.heading``.""",
+    )
+
+    @classmethod
+    def from_heading(cls, *heading, dtype: type = None) -> SlottedVector:
+        """Class method to create a new vector with a given heading.
+
+        Parameters
+        ----------
+
+        heading
+            heading values in the sketch's angle mode
+
+        Notes
+        -----
+
+        Class method to create a new vector with a given heading, measured in the
+        sketch's angle mode.
+        See ``Vector.from_heading()``.
+        """
+        _check_dtype(dtype)
+        return _vector(Vector.from_heading(*heading).tolist())
+
+    @classmethod
+    def random(cls, dim: int, *, dtype: type = None) -> SlottedVector:
+        """Create a new vector with random values.
+
+        Parameters
+        ----------
+
+        dim: int
+            dimension of the random vector to create
+
+        Notes
+        -----
+
+        Create a new vector with random values. The new vector will have a magnitude of
+        1 and a heading that is uniformly distributed across all possible headings for a
+        vector with the given dimension.
+        """
+        _check_dtype(dtype)
+        if dim == 2:
+            angle = Vector._rng.random() * math.tau
+            return SlottedVector2D._make(math.cos(angle), math.sin(angle))
+        elif dim == 3:
+            values = Vector._rng.standard_normal(3).tolist()
+            mag = math.hypot(*values)
+            return SlottedVector3D._make(*[value / mag for value in values])
+        return Vector.random(dim)
+
+    @classmethod
+    def arena(cls, capacity: int, dim: int, *, dtype: type = None):
+        """Create a pool of reusable vectors that share one numpy array.
+
+        Parameters
+        ----------
+
+        capacity: int
+            most vectors the arena can hand out before it's reset
+
+        dim: int
+            dimension of the vectors
+
+        dtype: type = None
+            dtype of the vectors
+
+        Notes
+        -----
+
+        Create a pool of reusable vectors that share one numpy array. The arena's
+        vectors are numpy-backed. See ``Vector.arena()``.
+        """
+        return Vector.arena(capacity, dim, dtype=dtype)
+
+    # *** END METHODS ***
+
+
+class SlottedVector2D(SlottedVector):
+    """Class to describe a 2D vector using plain Python floats.
+
+    See ``SlottedVector``.
+    """
+
+    __slots__ = ("x", "y")
+
+    def __new__(cls, *args, dtype: type = None):
+        if (
+            len(args) == 2
+            and (type(args[0]) is float or type(args[0]) is int)
+            and (type(args[1]) is float or type(args[1]) is int)
+            and dtype is None
+        ):
+            return cls._make(float(args[0]), float(args[1]))
+        _check_dtype(dtype)
+        return cls._make(*_values(args, 2))
+
+    @classmethod
+    def _make(cls, x: float, y: float) -> SlottedVector2D:
+        v = object.__new__(SlottedVector2D)
+        v.x = x
+        v.y = y
+        return v
+
+    def _components(self) -> tuple[float, float]:
+        return (self.x, self.y)
+
+    def _set_components(self, values: Iterable[float]):
+        self.x, self.y = values
+
+    def __len__(self):
+        return 2
+
+    def __add__(self, other):
+        if type(other) is SlottedVector2D:
+            return SlottedVector2D._make(self.x + other.x, self.y + other.y)
+        return super().__add__(other)
+
+    def __iadd__(self, other):
+        if type(other) is SlottedVector2D:
+            self.x += other.x
+            self.y += other.y
+            return self
+        return super().__iadd__(other)
+
+    def __sub__(self, other):
+        if type(other) is SlottedVector2D:
+            return SlottedVector2D._make(self.x - other.x, self.y - other.y)
+        return super().__sub__(other)
+
+    def __isub__(self, other):
+        if type(other) is SlottedVector2D:
+            self.x -= other.x
+            self.y -= other.y
+            return self
+        return super().__isub__(other)
+
+    def __mul__(self, other):
+        if type(other) is float or type(other) is int:
+            return SlottedVector2D._make(self.x * other, self.y * other)
+        return super().__mul__(other)
+
+    __rmul__ = __mul__
+
+    def __imul__(self, other):
+        if type(other) is float or type(other) is int:
+            self.x *= other
+            self.y *= other
+            return self
+        return super().__imul__(other)
+
+    def __truediv__(self, other):
+        if type(other) is float or type(other) is int:
+            return SlottedVector2D._make(self.x / other, self.y / other)
+        return super().__truediv__(other)
+
+    def __itruediv__(self, other):
+        if type(other) is float or type(other) is int:
+            self.x /= other
+            self.y /= other
+            return self
+        return super().__itruediv__(other)
+
+    def _get_mag(self) -> float:
+        return math.hypot(self.x, self.y)
+
+    def _get_mag_sq(self) -> float:
+        return self.x * self.x + self.y * self.y
+
+    mag: float = property(_get_mag, SlottedVector.set_mag, doc=SlottedVector.mag.__doc__)
+    mag_sq: float = property(
+        _get_mag_sq, SlottedVector.set_mag_sq, doc=SlottedVector.mag_sq.__doc__
+    )
+
+    def add_scaled(self, other, k):
+        if type(other) is SlottedVector2D:
+            self.x += other.x * k
+            self.y += other.y * k
+            return self
+        return super().add_scaled(other, k)
+
+    add_scaled.__doc__ = SlottedVector.add_scaled.__doc__
+
+    def dist(self, other):
+        if type(other) is SlottedVector2D:
+            return math.hypot(self.x - other.x, self.y - other.y)
+        return super().dist(other)
+
+    dist.__doc__ = SlottedVector.dist.__doc__
+
+    def normalize(self) -> SlottedVector2D:
+        mag = math.hypot(self.x, self.y)
+        if mag > 0:
+            self.x /= mag
+            self.y /= mag
+            return self
+        else:
+            warnings.warn(
+                "Using normalize on a zero vector has no effect", stacklevel=2
+            )
+
+    normalize.__doc__ = SlottedVector.normalize.__doc__
+
+    def set_limit(self, max_mag: float) -> SlottedVector2D:
+        if max_mag < 0:
+            raise RuntimeError("Cannot set limit to a negative number")
+        mag_sq = self.x * self.x + self.y * self.y
+        if mag_sq > max_mag * max_mag:
+            scale = max_mag / mag_sq**0.5
+            self.x *= scale
+            self.y *= scale
+        return self
+
+    set_limit.__doc__ = SlottedVector.set_limit.__doc__
+
+    def rotate(self, angle: float) -> SlottedVector2D:
+        """Rotate vector by a specified angle.
+
+        Parameters
+        ----------
+
+        angle: float
+            angle of rotation, measured in radians
+
+        Notes
+        -----
+
+        Rotate vector by a specified angle. A 2D vector will be rotated in the
+        counter-clockwise direction for positive ``angle`` values and in the clockwise
+        direction for negative ``angle`` values.
+        """
+        sin_angle = math.sin(angle)
+        cos_angle = math.cos(angle)
+        self.x, self.y = (
+            cos_angle * self.x - sin_angle * self.y,
+            sin_angle * self.x + cos_angle * self.y,
+        )
+        return self
+
+    @classmethod
+    def random(cls, dim: int = 2, *, dtype: type = None) -> SlottedVector2D:
+        return super().random(dim, dtype=dtype)
+
+    random.__func__.__doc__ = SlottedVector.random.__doc__
+
+
+class SlottedVector3D(SlottedVector):
+    """Class to describe a 3D vector using plain Python floats.
+
+    See ``SlottedVector``.
+    """
+
+    __slots__ = ("x", "y", "z")
+
+    def __new__(cls, *args, dtype: type = None):
+        if (
+            len(args) == 3
+            and all(type(arg) is float or type(arg) is int for arg in args)
+            and dtype is None
+        ):
+            return cls._make(float(args[0]), float(args[1]), float(args[2]))
+        _check_dtype(dtype)
+        return cls._make(*_values(args, 3))
+
+    @classmethod
+    def _make(cls, x: float, y: float, z: float) -> SlottedVector3D:
+        v = object.__new__(SlottedVector3D)
+        v.x = x
+        v.y = y
+        v.z = z
+        return v
+
+    def _components(self) -> tuple[float, float, float]:
+        return (self.x, self.y, self.z)
+
+    def _set_components(self, values: Iterable[float]):
+        self.x, self.y, self.z = values
+
+    def __len__(self):
+        return 3
+
+    def __add__(self, other):
+        if type(other) is SlottedVector3D:
+            return SlottedVector3D._make(
+                self.x + other.x, self.y + other.y, self.z + other.z
+            )
+        return super().__add__(other)
+
+    def __iadd__(self, other):
+        if type(other) is SlottedVector3D:
+            self.x += other.x
+            self.y += other.y
+            self.z += other.z
+            return self
+        return super().__iadd__(other)
+
+    def __sub__(self, other):
+        if type(other) is SlottedVector3D:
+            return SlottedVector3D._make(
+                self.x - other.x, self.y - other.y, self.z - other.z
+            )
+        return super().__sub__(other)
+
+    def __isub__(self, other):
+        if type(other) is SlottedVector3D:
+            self.x -= other.x
+            self.y -= other.y
+            self.z -= other.z
+            return self
+        return super().__isub__(other)
+
+    def __mul__(self, other):
+        if type(other) is float or type(other) is int:
+            return SlottedVector3D._make(self.x * other, self.y * other, self.z * other)
+        return super().__mul__(other)
+
+    __rmul__ = __mul__
+
+    def __imul__(self, other):
+        if type(other) is float or type(other) is int:
+            self.x *= other
+            self.y *= other
+            self.z *= other
+            return self
+        return super().__imul__(other)
+
+    def __truediv__(self, other):
+        if type(other) is float or type(other) is int:
+            return SlottedVector3D._make(self.x / other, self.y / other, self.z / other)
+        return super().__truediv__(other)
+
+    def __itruediv__(self, other):
+        if type(other) is float or type(other) is int:
+            self.x /= other
+            self.y /= other
+            self.z /= other
+            return self
+        return super().__itruediv__(other)
+
+    def _get_mag(self) -> float:
+        return math.hypot(self.x, self.y, self.z)
+
+    def _get_mag_sq(self) -> float:
+        return self.x * self.x + self.y * self.y + self.z * self.z
+
+    mag: float = property(_get_mag, SlottedVector.set_mag, doc=SlottedVector.mag.__doc__)
+    mag_sq: float = property(
+        _get_mag_sq, SlottedVector.set_mag_sq, doc=SlottedVector.mag_sq.__doc__
+    )
+
+    def add_scaled(self, other, k):
+        if type(other) is SlottedVector3D:
+            self.x += other.x * k
+            self.y += other.y * k
+            self.z += other.z * k
+            return self
+        return super().add_scaled(other, k)
+
+    add_scaled.__doc__ = SlottedVector.add_scaled.__doc__
+
+    def dist(self, other):
+        if type(other) is SlottedVector3D:
+            return math.hypot(self.x - other.x, self.y - other.y, self.z - other.z)
+        return super().dist(other)
+
+    dist.__doc__ = SlottedVector.dist.__doc__
+
+    def rotate(self, angle: float, dim: int | str) -> SlottedVector3D:
+        """Rotate vector by a specified angle.
+
+        Parameters
+        ----------
+
+        angle: float
+            angle of rotation, measured in radians
+
+        dim: int | str
+            dimension to rotate around
+
+        Notes
+        -----
+
+        Rotate vector by a specified angle around the x, y, or z axis. The dimension can
+        be specified with the values 1, 2, or 3, or by using the strings ``'x'``,
+        ``'y'``, or ``'z'``. The rotation will follow the right-hand rule.
+        """
+        sin_angle = math.sin(angle)
+        cos_angle = math.cos(angle)
+        x, y, z = self.x, self.y, self.z
+        if dim in [1, "x"]:
+            self.y = cos_angle * y - sin_angle * z
+            self.z = sin_angle * y + cos_angle * z
+        elif dim in [2, "y"]:
+            self.x = cos_angle * x + sin_angle * z
+            self.z = -sin_angle * x + cos_angle * z
+        elif dim in [3, "z"]:
+            self.x = cos_angle * x - sin_angle * y
+            self.y = sin_angle * x + cos_angle * y
+        else:
+            raise RuntimeError(
+                "dim parameter must be 1, 2, or 3, or one of 'x', 'y', and 'z'"
+            )
+        return self
+
+    def rotate_around(self, angle: float, v: SlottedVector3D | Vector) -> SlottedVector3D:
+        """Rotate around an arbitrary 3D vector.
+
+        Parameters
+        ----------
+
+        angle: float
+            angle of rotation, measured in radians
+
+        v: SlottedVector3D | Vector
+            3D vector to rotate vector around
+
+        Notes
+        -----
+
+        Rotate around an arbitrary 3D vector. The ``v`` vector does not need to be
+        aligned to any axis or normalized, but it must be a 3D vector and it cannot be
+        a vector of zeros. The rotation will follow the right-hand rule.
+        """
+        if not isinstance(v, (SlottedVector3D, Vector)) or len(v) != 3:
+            raise RuntimeError("Can only rotate around another 3D Vector")
+        ux, uy, uz = (float(value) for value in v)
+        mag = math.hypot(ux, uy, uz)
+        if mag == 0:
+            raise RuntimeError("Cannot rotate around a vector of zeros")
+        ux, uy, uz = ux / mag, uy / mag, uz / mag
+        sin, cos = math.sin(angle), math.cos(angle)
+        ncosp1 = 1 - cos
+        x, y, z = self.x, self.y, self.z
+        self.x = (
+            (cos + ux * ux * ncosp1) * x
+            + (ux * uy * ncosp1 - uz * sin) * y
+            + (ux * uz * ncosp1 + uy * sin) * z
+        )
+        self.y = (
+            (uy * ux * ncosp1 + uz * sin) * x
+            + (cos + uy * uy * ncosp1) * y
+            + (uy * uz * ncosp1 - ux * sin) * z
+        )
+        self.z = (
+            (uz * ux * ncosp1 - uy * sin) * x
+            + (uz * uy * ncosp1 + ux * sin) * y
+            + (cos + uz * uz * ncosp1) * z
+        )
+        return self
+
+    @classmethod
+    def random(cls, dim: int = 3, *, dtype: type = None) -> SlottedVector3D:
+        return super().random(dim, dtype=dtype)
+
+    random.__func__.__doc__ = SlottedVector.random.__doc__
+
+
+def _swizzle_property(name: str) -> property:
+    indices = ["xyzw".index(c) for c in name]
+    repeats = len(set(indices)) != len(indices)
+
+    def getter(self):
+        values = self._components()
+        return _vector([values[i] for i in indices])
+
+    def setter(self, val):
+        if repeats:
+            raise RuntimeError(
+                "Invalid swizzle: repeats are not allowed in assignments"
+            )
+        if not isinstance(val, Iterable):
+            val = [val] * len(indices)
+        elif len(val) == 1:
+            val = list(val) * len(indices)
+        elif len(val) != len(indices):
+            raise RuntimeError(
+                f"Mismatch: value length of {len(val)} cannot be assigned to swizzle of length {len(name)}"
+            )
+        values = list(self._components())
+        for i, value in zip(indices, val):
+            values[i] = float(value)
+        self._set_components(values)
+
+    return property(getter, setter)
+
+
+# Swizzles such as v.xy and v.zyx are generated once as properties.
+for _cls, _letters in ((SlottedVector2D, "xy"), (SlottedVector3D, "xyz")):
+    for _size in range(2, 5):
+        for _name in itertools.product(_letters, repeat=_size):
+            setattr(_cls, "".join(_name), _swizzle_property("".join(_name)))
+del _cls, _letters, _size, _name
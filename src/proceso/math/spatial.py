@@ -0,0 +1,404 @@
+from __future__ import annotations
+from abc import ABC, abstractmethod
+from collections.abc import Iterable
+
+import numpy as np
+
+from .vector import Vector
+from .vector_array import VectorArray
+
+
+def _as_points(points: Iterable) -> np.ndarray:
+    """Converts an (N, 2) or (N, 3) array or a list of vectors to an array."""
+    if isinstance(points, VectorArray):
+        data = points._data
+    elif isinstance(points, np.ndarray):
+        data = points
+    else:
+        data = [p._data if isinstance(p, Vector) else p for p in points]
+    data = np.asarray(data, dtype=np.float_)
+    if data.ndim != 2 or data.shape[1] not in (2, 3):
+        raise RuntimeError(
+            f"Cannot use points with shape {data.shape}, expected (N, 2) or (N, 3)"
+        )
+    return data
+
+
+def _expand(
+    q: np.ndarray, starts: np.ndarray, ends: np.ndarray, order: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """Turns ranges of the sorted point order into (query, point) pairs."""
+    counts = ends - starts
+    offsets = np.repeat(starts - (np.cumsum(counts) - counts), counts)
+    return np.repeat(q, counts), order[np.arange(counts.sum()) + offsets]
+
+
+class _SpatialIndex(ABC):
+    """Queries shared by HashGrid and KDTree.
+
+    Subclasses implement _candidates() and _initial_radius().
+    """
+
+    def __init__(self, points: Iterable):
+        self._points = _as_points(points)
+        if len(self._points) == 0:
+            raise RuntimeError("Cannot build a spatial index without any points")
+
+    def __len__(self):
+        return len(self._points)
+
+    def _get_data(self) -> np.ndarray[np.floating]:
+        return self._points
+
+    def _get_dim(self) -> int:
+        return self._points.shape[1]
+
+    data: np.ndarray[np.floating] = property(
+        _get_data,
+        doc="""The indexed points as an ``(N, dim)`` numpy array.""",
+    )
+    dim: int = property(
+        _get_dim,
+        doc="""The dimension of the indexed points. This will be either 2 or 3.""",
+    )
+
+    @abstractmethod
+    def _candidates(
+        self, centers: np.ndarray, radius: float
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Returns (query, point) index pairs that include every point within
+        radius of each query point."""
+
+    @abstractmethod
+    def _initial_radius(self, k: int) -> float:
+        """Returns the first search radius that query_knn() tries for k
+        neighbors."""
+
+    def _queries(self, points) -> tuple[np.ndarray, bool]:
+        """Returns query points as an (M, dim) array and whether there was one."""
+        if isinstance(points, Vector):
+            points = points._data
+        single = np.ndim(points) == 1 or not isinstance(
+            points, (np.ndarray, VectorArray, list, tuple)
+        )
+        centers = _as_points([points] if single else points)
+        if centers.shape[1] != self.dim:
+            raise RuntimeError(
+                f"Cannot query {self.dim}D points with {centers.shape[1]}D points"
+            )
+        return centers, single
+
+    def _within(
+        self, centers: np.ndarray, radius: float
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        q, idx = self._candidates(centers, radius)
+        d2 = np.sum((self._points[idx] - centers[q]) ** 2, axis=1)
+        keep = d2 <= radius * radius
+        q, idx, d2 = q[keep], idx[keep], d2[keep]
+        order = np.lexsort((idx, d2, q))
+        return q[order], idx[order], d2[order]
+
+    def query_radius(
+        self,
+        points: Vector | VectorArray | Iterable,
+        radius: float,
+        *,
+        return_distance: bool = False,
+    ) -> list[np.ndarray] | np.ndarray | tuple:
+        """Find the indexed points within a radius of each query point.
+
+        Parameters
+        ----------
+
+        points: Vector | VectorArray | Iterable
+            one query point, or an ``(M, dim)`` array or list of query points
+
+        radius: float
+            search radius
+
+        return_distance: bool = False
+            also return the distance to each neighbor
+
+        Notes
+        -----
+
+        Find the indexed points within a radius of each query point. Returns a list
+        with one numpy array of point indices per query point, sorted from nearest to
+        farthest. If ``points`` is a single point, returns one array instead of a
+        list. If ``return_distance`` is ``True``, returns a tuple of indices and the
+        matching distances.
+        """
+        if radius < 0:
+            raise RuntimeError("radius cannot be a negative number")
+        centers, single = self._queries(points)
+        q, idx, d2 = self._within(centers, radius)
+        splits = np.cumsum(np.bincount(q, minlength=len(centers)))[:-1]
+        indices = np.split(idx, splits)
+        if return_distance:
+            distances = np.split(np.sqrt(d2), splits)
+            if single:
+                return indices[0], distances[0]
+            return indices, distances
+        return indices[0] if single else indices
+
+    def query_knn(
+        self,
+        points: Vector | VectorArray | Iterable,
+        k: int,
+        *,
+        return_distance: bool = False,
+    ) -> np.ndarray | tuple[np.ndarray, np.ndarray]:
+        """Find the k nearest indexed points to each query point.
+
+        Parameters
+        ----------
+
+        k: int
+            number of neighbors to find
+
+        points: Vector | VectorArray | Iterable
+            one query point, or an ``(M, dim)`` array or list of query points
+
+        return_distance: bool = False
+            also return the distance to each neighbor
+
+        Notes
+        -----
+
+        Find the ``k`` nearest indexed points to each query point. Returns an ``(M,
+        k)`` array of point indices, sorted from nearest to farthest, or an array of
+        length ``k`` if ``points`` is a single point. If ``return_distance`` is
+        ``True``, returns a tuple of indices and the matching distances.
+
+        An indexed point queried against its own index finds itself first. Ask for ``k
+        + 1`` neighbors and skip the first column to leave it out.
+        """
+        if not 1 <= k <= len(self):
+            raise RuntimeError(
+                f"k must be between 1 and the number of points ({len(self)}), not {k}"
+            )
+        centers, single = self._queries(points)
+        indices = np.empty((len(centers), k), dtype=np.intp)
+        distances = np.empty((len(centers), k))
+        todo = np.arange(len(centers))
+        radius = self._initial_radius(k)
+        # Search within a growing radius until each query has found k points.
+        while len(todo):
+            q, idx, d2 = self._within(centers[todo], radius)
+            counts = np.bincount(q, minlength=len(todo))
+            done = np.flatnonzero(counts >= k)
+            take = (np.cumsum(counts) - counts)[done, np.newaxis] + np.arange(k)
+            indices[todo[done]] = idx[take]
+            distances[todo[done]] = np.sqrt(d2[take])
+            todo = todo[counts < k]
+            radius *= 2
+        if single:
+            indices, distances = indices[0], distances[0]
+        return (indices, distances) if return_distance else indices
+
+    def query_pairs(
+        self, radius: float, *, return_distance: bool = False
+    ) -> tuple[np.ndarray, ...]:
+        """Find every pair of indexed points within a radius of each other.
+
+        Parameters
+        ----------
+
+        radius: float
+            search radius
+
+        return_distance: bool = False
+            also return the distance between each pair
+
+        Notes
+        -----
+
+        Find every pair of indexed points within a radius of each other. Returns two
+        arrays ``i`` and ``j`` such that point ``j[n]`` is a neighbor of point
+        ``i[n]``. Each pair appears in both orders and points are not paired with
+        themselves. If ``return_distance`` is ``True``, a third array with the
+        distances is returned too.
+
+        The arrays work well with numpy for steering many agents at once. For example,
+        ``np.add.at(total, i, velocities[j])`` sums the velocities of each agent's
+        neighbors and ``np.bincount(i, minlength=len(index))`` counts them.
+        """
+        if radius < 0:
+            raise RuntimeError("radius cannot be a negative number")
+        q, idx, d2 = self._within(self._points, radius)
+        keep = q != idx
+        if return_distance:
+            return q[keep], idx[keep], np.sqrt(d2[keep])
+        return q[keep], idx[keep]
+
+
+class HashGrid(_SpatialIndex):
+    """Uniform grid for finding nearby 2D or 3D points.
+
+    Parameters
+    ----------
+
+    cell_size: float
+        width of each grid cell
+
+    points: VectorArray | Iterable
+        ``(N, 2)`` or ``(N, 3)`` array, or list of vectors
+
+    Notes
+    -----
+
+    Uniform grid for finding nearby 2D or 3D points. The points are sorted into
+    square (or cube) cells of width ``cell_size`` once, so that each query only
+    needs to look at the points in nearby cells instead of every point. Queries are
+    answered for many query points at once with numpy.
+
+    A grid works best when the points are spread fairly evenly and ``cell_size`` is
+    close to the radius used in queries. The grid doesn't follow the points when
+    they move, so sketches with moving points should build a new grid each frame,
+    which is fast.
+    """
+
+    def __init__(self, points: VectorArray | Iterable, cell_size: float):
+        super().__init__(points)
+        if cell_size <= 0:
+            raise RuntimeError("cell_size must be a positive number")
+        self._cell_size = float(cell_size)
+        cells = np.floor(self._points / self._cell_size).astype(np.int64)
+        self._origin = cells.min(axis=0)
+        cells -= self._origin
+        self._shape = tuple(cells.max(axis=0) + 1)
+        try:
+            keys = np.ravel_multi_index(cells.T, self._shape)
+        except ValueError:
+            raise RuntimeError(
+                "cell_size is too small for how far apart the points are"
+            ) from None
+        self._order = np.argsort(keys, kind="stable")
+        self._keys = keys[self._order]
+
+    def _get_cell_size(self) -> float:
+        return self._cell_size
+
+    cell_size: float = property(
+        _get_cell_size,
+        doc="""The width of each grid cell.""",
+    )
+
+    def _initial_radius(self, k: int) -> float:
+        return self._cell_size
+
+    def _candidates(
+        self, centers: np.ndarray, radius: float
+    ) -> tuple[np.ndarray, np.ndarray]:
+        reach = int(np.ceil(radius / self._cell_size))
+        cells = np.floor(centers / self._cell_size).astype(np.int64) - self._origin
+        # Only visit the cells within reach that lie inside the grid, so sparse
+        # grids and large radii don't enumerate cells that can't hold points.
+        shape = np.array(self._shape)
+        lo = np.maximum(cells - reach, 0)
+        hi = np.minimum(cells + reach, shape - 1)
+        sizes = np.maximum(hi - lo + 1, 0)
+        counts = np.prod(sizes, axis=1)
+        # Checking every point is cheaper than visiting more cells than points.
+        brute = counts > len(self._points)
+        counts[brute] = 0
+        q = np.repeat(np.arange(len(centers)), counts)
+        local = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        neighbors = np.empty((len(q), self.dim), dtype=np.int64)
+        for axis in range(self.dim - 1, -1, -1):
+            size = sizes[q, axis]
+            neighbors[:, axis] = lo[q, axis] + local % size
+            local //= size
+        keys = np.ravel_multi_index(neighbors.T, self._shape)
+        starts = np.searchsorted(self._keys, keys, side="left")
+        ends = np.searchsorted(self._keys, keys, side="right")
+        q, idx = _expand(q, starts, ends, self._order)
+        if brute.any():
+            everyone = np.arange(len(self._points))
+            brute_q = np.flatnonzero(brute)
+            q = np.concatenate((q, np.repeat(brute_q, len(everyone))))
+            idx = np.concatenate((idx, np.tile(everyone, len(brute_q))))
+        return q, idx
+
+
+class KDTree(_SpatialIndex):
+    """k-d tree for finding nearby 2D or 3D points.
+
+    Parameters
+    ----------
+
+    leaf_size: int = 16
+        most points stored in each leaf of the tree
+
+    points: VectorArray | Iterable
+        ``(N, 2)`` or ``(N, 3)`` array, or list of vectors
+
+    Notes
+    -----
+
+    k-d tree for finding nearby 2D or 3D points. The tree repeatedly splits the
+    points in half along their widest dimension, so that each query can skip
+    groups of points that are too far away. Queries walk the tree for many query
+    points at once with numpy.
+
+    Unlike ``HashGrid``, a k-d tree doesn't need a cell size and works well when the
+    points are clustered or spread unevenly.
+    """
+
+    def __init__(self, points: VectorArray | Iterable, leaf_size: int = 16):
+        super().__init__(points)
+        if leaf_size < 1:
+            raise RuntimeError("leaf_size must be at least 1")
+        self._order = np.arange(len(self._points))
+        lo, hi, children, starts, ends = [], [], [], [], []
+
+        def build(start: int, end: int) -> int:
+            node = len(children)
+            idx = self._order[start:end]
+            pts = self._points[idx]
+            lo.append(pts.min(axis=0))
+            hi.append(pts.max(axis=0))
+            children.append([-1, -1])
+            starts.append(start)
+            ends.append(end)
+            if end - start > leaf_size:
+                axis = np.argmax(hi[node] - lo[node])
+                mid = (start + end) // 2
+                split = np.argpartition(pts[:, axis], mid - start)
+                self._order[start:end] = idx[split]
+                children[node] = [build(start, mid), build(mid, end)]
+            return node
+
+        build(0, len(self._points))
+        self._lo = np.array(lo)
+        self._hi = np.array(hi)
+        self._children = np.array(children, dtype=np.intp)
+        self._starts = np.array(starts, dtype=np.intp)
+        self._ends = np.array(ends, dtype=np.intp)
+
+    def _initial_radius(self, k: int) -> float:
+        extent = self._hi[0] - self._lo[0]
+        extent[extent == 0] = 1.0
+        return float(np.prod(extent) * k / len(self)) ** (1 / self.dim)
+
+    def _candidates(
+        self, centers: np.ndarray, radius: float
+    ) -> tuple[np.ndarray, np.ndarray]:
+        q = np.arange(len(centers))
+        nodes = np.zeros(len(centers), dtype=np.intp)
+        leaf_q, leaf_nodes = [], []
+        # Walk the tree one level at a time for every query point at once.
+        while len(q):
+            c = centers[q]
+            gap = np.maximum(self._lo[nodes] - c, 0) + np.maximum(c - self._hi[nodes], 0)
+            near = np.sum(gap**2, axis=1) <= radius * radius
+            q, nodes = q[near], nodes[near]
+            leaf = self._children[nodes, 0] < 0
+            leaf_q.append(q[leaf])
+            leaf_nodes.append(nodes[leaf])
+            q = np.repeat(q[~leaf], 2)
+            nodes = self._children[nodes[~leaf]].ravel()
+        nodes = np.concatenate(leaf_nodes)
+        return _expand(
+            np.concatenate(leaf_q), self._starts[nodes], self._ends[nodes], self._order
+        )
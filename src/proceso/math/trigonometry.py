@@ -1,14 +1,29 @@
+import math
+
 from ..binding import BaseSketch
+from .vector import Vector
 
 
 class Trigonometry(BaseSketch):
+    def _to_radians(self, angle: float) -> float:
+        if self._angle_mode == "degrees":
+            return math.radians(angle)
+        return angle
+
+    def _from_radians(self, angle: float) -> float:
+        if self._angle_mode == "degrees":
+            return math.degrees(angle)
+        return angle
+
     def acos(self, value: float) -> float:
         """The inverse of cos(), returns the arc cosine of a value.
         This function expects the values in the range of -1 to 1 and values are
         returned in the range 0 to PI (3.1415927) if the angle_mode() is RADIANS
         or 0 to 180 if the angle_mode() is DEGREES.
         """
-        return self._p5js.acos(value)
+        if not -1 <= value <= 1:
+            return math.nan
+        return self._from_radians(math.acos(value))
 
     def asin(self, value: float) -> float:
         """The inverse of sin(), returns the arc sine of a value.
@@ -16,7 +31,9 @@ class Trigonometry(BaseSketch):
         returned in the range -PI/2 to PI/2 if the angle_mode is RADIANS or -90 to
         90 if the angle mode is DEGREES.
         """
-        return self._p5js.asin(value)
+        if not -1 <= value <= 1:
+            return math.nan
+        return self._from_radians(math.asin(value))
 
     def atan(self, value: float) -> float:
         """The inverse of tan(), returns the arc tangent of a value.
@@ -24,7 +41,7 @@ class Trigonometry(BaseSketch):
         (exclusive) and values are returned in the range -PI/2 to PI/2 if the
         angle_mode is RADIANS or -90 to 90 if the angle_mode is DEGREES.
         """
-        return self._p5js.atan(value)
+        return self._from_radians(math.atan(value))
 
     def atan2(self, y, x) -> float:
         """Calculates the angle (in radians) from a specified point to the
@@ -38,28 +55,35 @@ class Trigonometry(BaseSketch):
         x-coordinate is the second parameter, due to the structure of calculating
         the tangent.
         """
-        return self._p5js.atan2(y, x)
+        return self._from_radians(math.atan2(y, x))
 
     def cos(self, value: float) -> float:
         """Calculates the cosine of an angle.
         This function takes into account the current angle_mode. Values are
-        returned in the range -1 to 1.
+        returned in the range -1 to 1, or NaN if the angle is infinite or NaN.
         """
-        return self._p5js.cos(value)
+        if not math.isfinite(value):
+            return math.nan
+        return math.cos(self._to_radians(value))
 
     def sin(self, value: float) -> float:
         """Calculates the sine of an angle.
         This function takes into account the current angle_mode. Values are
-        returned in the range -1 to 1.
+        returned in the range -1 to 1, or NaN if the angle is infinite or NaN.
         """
-        return self._p5js.sin(value)
+        if not math.isfinite(value):
+            return math.nan
+        return math.sin(self._to_radians(value))
 
     def tan(self, value: float) -> float:
         """Calculates the tangent of an angle.
         This function takes into account the current angle_mode. Values are
-        returned in the range of all real numbers.
+        returned in the range of all real numbers, or NaN if the angle is
+        infinite or NaN.
         """
-        return self._p5js.tan(value)
+        if not math.isfinite(value):
+            return math.nan
+        return math.tan(self._to_radians(value))
 
     def degrees(self, radians: float) -> float:
         """Converts a radian measurement to its corresponding value in degrees.
@@ -68,7 +92,7 @@ class Trigonometry(BaseSketch):
         90° = PI/2 = 1.5707964. This function does not take into account the
         current angle_mode.
         """
-        return self._p5js.degrees(radians)
+        return math.degrees(radians)
 
     def radians(self, degrees: float) -> float:
         """Converts a degree measurement to its corresponding value in radians.
@@ -77,14 +101,21 @@ class Trigonometry(BaseSketch):
         90° = PI/2 = 1.5707964. This function does not take into account the
         current angle_mode.
         """
-        return self._p5js.radians(degrees)
+        return math.radians(degrees)
 
     def angle_mode(self, mode: str | None = None) -> None | str:
         """Sets the current mode of p5 to the given mode.
         Default mode is RADIANS.
 
         Calling angle_mode() with no arguments returns current angle_mode.
+
+        The mode is also kept in Python, so reading it, converting angles in
+        sin(), atan2(), and the other trigonometry functions, and measuring
+        Vector headings never need to ask p5.
         """
         if not mode:
-            return self._p5js.angleMode()
+            return self._angle_mode
+        if mode in ("degrees", "radians"):
+            self._angle_mode = mode
+            Vector._angle_mode = mode
         self._p5js.angleMode(mode)
@@ -18,6 +18,7 @@
 #
 # *****************************************************************************
 from __future__ import annotations
+import itertools
 import operator
 from collections.abc import Sequence, Iterable
 import re
@@ -25,6 +26,8 @@ import warnings
 
 import numpy as np
 
+from ..backend import to_js_buffer
+
 
 class Vector(Sequence):
     """Class to describe a 2D, 3D, or 4D vector.
@@ -57,10 +60,11 @@ class Vector(Sequence):
 
     Internally, Vector stores the vector values in a numpy array. By default, the
     data type (dtype) of that numpy array is the default float size for your
-    computer, which is typically a 64 bit float, or ``np.float64``. To create a
-    vector with a different float size, pass your desired numpy float dtype to the
-    ``dtype`` parameter, like ``v3 = py5.Vector(1 / 3, 1 / 7,
-    dtype=np.float16)``.
+    computer, which is typically a 64 bit float, or ``np.float64``. A sketch can
+    change the default for its vectors with the ``vector_dtype`` parameter of
+    ``Sketch``. To create a vector with a different float size, pass your desired
+    numpy float dtype to the ``dtype`` parameter, like ``v3 = py5.Vector(1 / 3,
+    1 / 7, dtype=np.float16)``.
 
     When creating a new Vector, the initial vector values need not be discrete
     values. You can provide a list of numbers, a numpy array, or another Vector.
@@ -76,14 +80,30 @@ class Vector(Sequence):
     """
 
     _DEFAULT_DIM = 3
+    # The vector_dtype of the running sketch, set by the sketch
+    _default_dtype: type = np.float_
+    _angle_mode: str = "radians"
+    # The random number generator of the running sketch, set by the sketch
+    _rng: np.random.Generator = np.random.default_rng()
+    # Maps swizzle names to indices, filled in per dimension by _swizzle_table()
+    _swizzles: dict[str, int | tuple[list[int], bool]] = {}
 
     def __new__(cls, *args, dim: int = None, dtype: type = None, copy: bool = True):
+        # Fast path for the most common case, Vector(x, y) with plain numbers.
+        if (
+            2 <= len(args) <= 4
+            and (dim is None or dim == len(args))
+            and (dtype is None or dtype is Vector._default_dtype)
+            and all(type(arg) is float or type(arg) is int for arg in args)
+        ):
+            return Vector._from_data(np.array(args, dtype=Vector._default_dtype))
+
         kwarg_dim = dim
         kwarg_dtype = dtype
 
         used_default_dim = len(args) == 0 and dim is None
         dim = Vector._DEFAULT_DIM if dim is None else dim
-        dtype = np.float_ if dtype is None else dtype
+        dtype = Vector._default_dtype if dtype is None else dtype
 
         if not isinstance(dtype, (type, np.dtype)) or not np.issubdtype(
             dtype, np.floating
@@ -184,29 +204,39 @@ class Vector(Sequence):
 
         return v
 
+    @staticmethod
+    def _from_data(data: np.ndarray) -> Vector:
+        """Creates a Vector that stores data without validating or copying it.
+
+        data must be a one-dimensional numpy array with a floating dtype and 2,
+        3, or 4 values.
+        """
+        v = object.__new__(_VECTOR_CLASSES[data.size])
+        object.__setattr__(v, "_data", data)
+        object.__setattr__(v, "_used_default_dim", False)
+        return v
+
     def __getattr__(self, name):
-        if hasattr(self, "_data") and not (set(name) - set("xyzw"[: self._data.size])):
-            if 2 <= len(name) <= 4:
-                return Vector(
-                    self._data[["xyzw".index(c) for c in name]],
-                    dtype=self._data.dtype,
-                    copy=True,
-                )
-            else:
-                raise RuntimeError(
-                    "Invalid swizzle: length must be between 2 and 4 characters"
-                )
+        swizzles = type(self)._swizzles
+        swizzle = swizzles.get(name)
+        if swizzle is not None and not isinstance(swizzle, int):
+            return Vector._from_data(self._data[swizzle[0]])
+        elif len(name) > 4 and set(name) <= swizzles.keys():
+            raise RuntimeError(
+                "Invalid swizzle: length must be between 2 and 4 characters"
+            )
         else:
             raise AttributeError(f"'Vector' object has no attribute '{name}'")
 
     def __setattr__(self, name, val):
-        if name.startswith("_") or not (
-            hasattr(self, "_data") and not (set(name) - set("xyzw"[: self._data.size]))
-        ):
+        swizzle = self._swizzles.get(name)
+        if swizzle is None:
             super().__setattr__(name, val)
-        elif len(name) == len(set(name)):
+        elif isinstance(swizzle, int):
+            self._data[swizzle] = val
+        elif swizzle[1]:
             if not isinstance(val, Iterable) or len(val) in [1, len(name)]:
-                self._data[["xyzw".index(c) for c in name]] = val
+                self._data[swizzle[0]] = val
             else:
                 raise RuntimeError(
                     f"Mismatch: value length of {len(val)} cannot be assigned to swizzle of length {len(name)}"
@@ -262,7 +292,7 @@ class Vector(Sequence):
                 return self
             else:
                 a, b = (other, self) if swap else (self, other)
-                return Vector(op(a._data, b._data), dim=a._data.size, copy=False)
+                return Vector._from_data(op(a._data, b._data))
         else:
             try:
                 if inplace:
@@ -271,11 +301,11 @@ class Vector(Sequence):
                 else:
                     a, b = (other, self._data) if swap else (self._data, other)
                     result = op(a, b)
-                    return (
-                        Vector(result, copy=False)
-                        if result.ndim == 1 and 2 <= result.size <= 4
-                        else result
-                    )
+                    if result.ndim == 1 and 2 <= result.size <= 4:
+                        if result.dtype.kind == "f":
+                            return Vector._from_data(result)
+                        return Vector(result, copy=False)
+                    return result
             except ValueError as e:
                 other_type = (
                     "numpy array"
@@ -378,13 +408,13 @@ class Vector(Sequence):
         return self
 
     def __neg__(self):
-        return Vector(-self._data, copy=False)
+        return Vector._from_data(-self._data)
 
     def __abs__(self):
-        return Vector(np.abs(self._data), copy=False)
+        return Vector._from_data(np.abs(self._data))
 
     def __round__(self):
-        return Vector(np.round(self._data), copy=False)
+        return Vector._from_data(np.round(self._data))
 
     def __bool__(self):
         return any(self._data != 0.0)
@@ -426,6 +456,24 @@ class Vector(Sequence):
         """
         return self._data.tolist()
 
+    def to_js_buffer(self) -> object:
+        """Share the vector's values with JavaScript without copying them.
+
+        Notes
+        -----
+
+        Share the vector's values with JavaScript without copying them. Returns a
+        ``Float32Array`` or ``Float64Array``, depending on the vector's dtype, that
+        views the same memory as the vector, so changes to the vector show up in
+        JavaScript. The typed array can be passed to any JavaScript function, but it
+        is only valid until the end of the current ``setup()``, ``draw()``, or event
+        function, so don't keep it around. Only ``np.float32`` and ``np.float64``
+        vectors can be shared.
+
+        Outside of the browser, the vector's numpy array is returned instead.
+        """
+        return _js_buffer(self._data)
+
     def _get_x(self) -> float:
         """The vector's x dimension value.
 
@@ -484,7 +532,7 @@ class Vector(Sequence):
 
         Create an identical copy of this Vector instance.
         """
-        return Vector(self._data, dtype=self._data.dtype, copy=True)
+        return Vector._from_data(self._data.copy())
 
     def _get_dim(self) -> int:
         """The vector's dimension.
@@ -586,7 +634,7 @@ class Vector(Sequence):
                 if result.ndim == 0:
                     return float(result)
                 if maybe_vector and result.ndim == 1 and 2 <= result.size <= 4:
-                    return Vector(result, copy=False)
+                    return Vector._from_data(result)
                 else:
                     return result
             except ValueError as e:
@@ -600,7 +648,11 @@ class Vector(Sequence):
             )
 
     def lerp(
-        self, other: Vector | np.ndarray, amt: float | np.ndarray
+        self,
+        other: Vector | np.ndarray,
+        amt: float | np.ndarray,
+        *,
+        out: Vector | np.ndarray | None = None,
     ) -> Vector | np.ndarray[np.floating]:
         """Calculates a vector between two vectors at a specific increment.
 
@@ -613,6 +665,9 @@ class Vector(Sequence):
         other: Vector | np.ndarray
             other vector to interpolate between
 
+        out: Vector | np.ndarray | None = None
+            vector or numpy array to store the result in
+
         Notes
         -----
 
@@ -623,12 +678,75 @@ class Vector(Sequence):
         greater than 1.0 or less than 0.0, the interpolated vector will be outside of
         the range specified by the two vectors.
 
+        By default the result is a new vector. Use the ``out`` parameter to write the
+        result into an existing vector or numpy array instead, which can be this vector
+        or ``other``. No new memory is allocated in that case, which helps sketches that
+        update many vectors every frame.
+
         This method is similar to ``lerp()`` and ``lerp_color()``, but for vectors
         instead of numbers or colors.
         """
-        return self._run_calc(
-            other, lambda s, o: s + (o - s) * amt, "lerp of", maybe_vector=True
-        )
+        if out is None:
+            return self._run_calc(
+                other, lambda s, o: s + (o - s) * amt, "lerp of", maybe_vector=True
+            )
+        if isinstance(other, Vector):
+            if self._data.size != other._data.size:
+                raise RuntimeError(
+                    "Vector dimensions must be the same to calculate the lerp of two Vectors."
+                    + self._check_used_default_dim(other)
+                )
+            other = other._data
+        try:
+            _lerp_into(
+                self._data,
+                np.asarray(other),
+                amt,
+                _out_data(out),
+                _scratch_like(self._data),
+            )
+        except ValueError as e:
+            raise RuntimeError(
+                "Unable to store the lerp of a Vector in out, probably because of a size mismatch. The error message is: "
+                + str(e)
+            ) from None
+        return out
+
+    def add_scaled(self, other: Vector | np.ndarray, k: float) -> Vector:
+        """Add another vector multiplied by a number to this vector.
+
+        Parameters
+        ----------
+
+        k: float
+            number to multiply the other vector by
+
+        other: Vector | np.ndarray
+            vector to add
+
+        Notes
+        -----
+
+        Add another vector multiplied by a number to this vector. The vector is changed
+        in place and returned. ``v.add_scaled(other, k)`` gives the same result as ``v
+        += other * k`` without creating a new vector for ``other * k``, which makes it
+        handy for updating positions and velocities every frame.
+        """
+        if isinstance(other, Vector):
+            if self._data.size != other._data.size:
+                raise RuntimeError(
+                    f"Cannot perform addition operation on a {self._data.size}D Vector and a {other._data.size}D Vector. The dimensions must be the same."
+                    + self._check_used_default_dim(other)
+                )
+            other = other._data
+        try:
+            self._data += np.multiply(other, k)
+        except ValueError as e:
+            raise RuntimeError(
+                "Unable to perform addition on a Vector and a numpy array, probably because of a size mismatch. The error message is: "
+                + str(e)
+            ) from None
+        return self
 
     def dist(self, other: Vector | np.ndarray) -> float | np.ndarray[np.floating]:
         """Calculate the distance between two vectors.
@@ -696,7 +814,7 @@ class Vector(Sequence):
         )
 
     def cross(
-        self, other: Vector | np.ndarray
+        self, other: Vector | np.ndarray, *, out: Vector | np.ndarray | None = None
     ) -> float | Vector | np.ndarray[np.floating]:
         """Calculate the vector cross product of two 3D vectors.
 
@@ -706,6 +824,9 @@ class Vector(Sequence):
         other: Vector | np.ndarray
             2D or 3D vector to calculate the cross product with
 
+        out: Vector | np.ndarray | None = None
+            vector or numpy array to store the result in
+
         Notes
         -----
 
@@ -713,6 +834,9 @@ class Vector(Sequence):
         2D vector, its z-value is assumed to be zero and the vector cross product is
         calculated normally. If both vectors are 2D vectors, the returned value will be
         the wedge product.
+
+        Use the ``out`` parameter to write a vector result into an existing vector or
+        numpy array instead of a new one.
         """
         if self._data.size == 4 or isinstance(other, Vector4D):
             raise RuntimeError("Cannot calculate the cross product with a 4D Vector")
@@ -720,15 +844,23 @@ class Vector(Sequence):
             maybe_vector = isinstance(other, Vector3D)
             if isinstance(other, Vector):
                 other = other._data
-            return self._run_calc(
+            result = self._run_calc(
                 other, np.cross, "cross product of", maybe_vector=maybe_vector
             )
         else:  # self._data.size == 3:
             if isinstance(other, Vector):
                 other = other._data
-            return self._run_calc(
+            result = self._run_calc(
                 other, np.cross, "cross product of", maybe_vector=True
             )
+        if out is None:
+            return result
+        if isinstance(result, float):
+            raise RuntimeError(
+                "The cross product of two 2D vectors is a number and cannot be stored in out"
+            )
+        _out_data(out)[...] = result
+        return out
 
     def _get_mag(self) -> float:
         """The vector's magnitude.
@@ -885,13 +1017,13 @@ class Vector(Sequence):
         return self
 
     def _get_heading(self) -> float | tuple[float]:
-        """The vector's heading, measured in radians.
+        """The vector's heading, measured in the sketch's angle mode.
 
         Notes
         -----
 
-        The vector's heading, measured in radians. The heading will be measured with 1,
-        2, or 3 numbers for 2D, 3D, or 4D vectors, respectively.
+        The vector's heading, measured in the sketch's angle mode. The heading will be
+        measured with 1, 2, or 3 numbers for 2D, 3D, or 4D vectors, respectively.
 
         For 2D vectors, the heading angle is the counter clockwise rotation of the
         vector relative to the positive x axis.
@@ -910,7 +1042,19 @@ class Vector(Sequence):
         the rotation around the xw plane relative to the positive y axis. The third
         heading value is the rotation around the xy plane relative to the positive z
         axis.
+
+        Like p5.js, headings are measured in radians by default, or in degrees after
+        ``angle_mode(DEGREES)``. Vectors follow the angle mode of the sketch whose
+        ``setup()``, ``draw()``, or event function is running.
         """
+        heading = self._get_heading_radians()
+        if Vector._angle_mode != "degrees":
+            return heading
+        elif isinstance(heading, tuple):
+            return tuple(float(np.degrees(value)) for value in heading)
+        return float(np.degrees(heading))
+
+    def _get_heading_radians(self) -> float | tuple[float]:
         if self._data.size == 2:
             return float(np.arctan2(self._data[1], self._data[0]))
         elif self._data.size == 3:
@@ -938,7 +1082,7 @@ class Vector(Sequence):
         ----------
 
         heading
-            heading values in radians
+            heading values in the sketch's angle mode
 
         Notes
         -----
@@ -964,9 +1108,15 @@ class Vector(Sequence):
         the rotation around the xw plane relative to the positive y axis. The third
         heading value is the rotation around the xy plane relative to the positive z
         axis.
+
+        Like p5.js, headings are measured in radians by default, or in degrees after
+        ``angle_mode(DEGREES)``. Vectors follow the angle mode of the sketch whose
+        ``setup()``, ``draw()``, or event function is running.
         """
         if len(heading) == 1 and isinstance(heading[0], Iterable):
             heading = heading[0]
+        if Vector._angle_mode == "degrees":
+            heading = [np.radians(value) for value in heading]
 
         mag = self._get_mag()
         if len(heading) == 1 and self._data.size == 2:
@@ -1001,13 +1151,13 @@ class Vector(Sequence):
     heading: tuple[float] = property(
         _get_heading,
         set_heading,
-        doc="""The vector's heading, measured in radians.
+        doc="""The vector's heading, measured in the sketch's angle mode.
 
         Notes
         -----
 
-        The vector's heading, measured in radians. The heading will be measured with 1,
-        2, or 3 numbers for 2D, 3D, or 4D vectors, respectively.
+        The vector's heading, measured in the sketch's angle mode. The heading will be
+        measured with 1, 2, or 3 numbers for 2D, 3D, or 4D vectors, respectively.
 
         For 2D vectors, the heading angle is the counter clockwise rotation of the
         vector relative to the positive x axis.
@@ -1025,27 +1175,32 @@ class Vector(Sequence):
         around the zw plane relative to the positive x axis. The second heading value is
         the rotation around the xw plane relative to the positive y axis. The third
         heading value is the rotation around the xy plane relative to the positive z
-        axis.""",
+        axis.
+
+        Like p5.js, headings are measured in radians by default, or in degrees after
+        ``angle_mode(DEGREES)``. Vectors follow the angle mode of the sketch whose
+        ``setup()``, ``draw()``, or event function is running.""",
     )
 
     @classmethod
-    def from_heading(cls, *heading, dtype: int = np.float_) -> Vector:
-        """Class method to create a new vector with a given heading, measured in radians.
+    def from_heading(cls, *heading, dtype: type = None) -> Vector:
+        """Class method to create a new vector with a given heading.
 
         Parameters
         ----------
 
-        dtype: int = np.float_
-            dtype of new vector to create
+        dtype: type = None
+            dtype of new vector to create, or the default dtype if None
 
         heading
-            heading values in radians
+            heading values in the sketch's angle mode
 
         Notes
         -----
 
-        Class method to create a new vector with a given heading, measured in radians.
-        Use 1, 2, or 3 heading values for 2D, 3D, or 4D vectors, respectively.
+        Class method to create a new vector with a given heading, measured in the
+        sketch's angle mode. Use 1, 2, or 3 heading values for 2D, 3D, or 4D vectors,
+        respectively.
 
         For 2D vectors, the heading angle is the counter clockwise rotation of the
         vector relative to the positive x axis.
@@ -1064,6 +1219,10 @@ class Vector(Sequence):
         the rotation around the xw plane relative to the positive y axis. The third
         heading value is the rotation around the xy plane relative to the positive z
         axis.
+
+        Like p5.js, headings are measured in radians by default, or in degrees after
+        ``angle_mode(DEGREES)``. Vectors follow the angle mode of the sketch whose
+        ``setup()``, ``draw()``, or event function is running.
         """
         if len(heading) == 1 and isinstance(heading[0], Iterable):
             heading = heading[0]
@@ -1078,7 +1237,7 @@ class Vector(Sequence):
             raise RuntimeError(f"Cannot create a Vector from {len(heading)} arguments")
 
     @classmethod
-    def random(cls, dim: int, *, dtype: type = np.float_) -> Vector:
+    def random(cls, dim: int, *, dtype: type = None) -> Vector:
         """Create a new vector with random values.
 
         Parameters
@@ -1087,8 +1246,8 @@ class Vector(Sequence):
         dim: int
             dimension of the random vector to create
 
-        dtype: type = np.float_
-            dtype of the random vector to create
+        dtype: type = None
+            dtype of the random vector to create, or the default dtype if None
 
         Notes
         -----
@@ -1098,6 +1257,8 @@ class Vector(Sequence):
 
         The new vector will have a magnitude of 1 and a heading that is uniformly
         distributed across all possible headings for a vector with the given dimension.
+        The values come from the sketch's random number generator, so they're
+        reproducible after ``random_seed()``.
 
         When used as a ``Vector`` class method, the ``dim`` parameter is required to
         specify what the new vector's dimension should be. When used as a class method
@@ -1107,25 +1268,55 @@ class Vector(Sequence):
         parameter is also optional and will default to the vector instance's dimension.
         See the example code for examples of all of these use cases.
         """
+        dtype = dtype or Vector._default_dtype
         if dim == 2:
             return Vector(
-                np.cos(angle := np.random.rand() * 2 * np.pi),
+                np.cos(angle := Vector._rng.random() * 2 * np.pi),
                 np.sin(angle),
                 dtype=dtype,
             )
         elif dim == 3:
             return Vector(
-                (v := np.random.randn(3).astype(dtype)) / (v**2).sum() ** 0.5,
+                (v := Vector._rng.standard_normal(3).astype(dtype)) / (v**2).sum() ** 0.5,
                 copy=False,
             )
         elif dim == 4:
             return Vector(
-                (v := np.random.randn(4).astype(dtype)) / (v**2).sum() ** 0.5,
+                (v := Vector._rng.standard_normal(4).astype(dtype)) / (v**2).sum() ** 0.5,
                 copy=False,
             )
         else:
             raise RuntimeError(f"Cannot create a random Vector with dimension {dim}")
 
+    @classmethod
+    def arena(cls, capacity: int, dim: int, *, dtype: type = None):
+        """Create a pool of reusable vectors that share one numpy array.
+
+        Parameters
+        ----------
+
+        capacity: int
+            most vectors the arena can hand out before it's reset
+
+        dim: int
+            dimension of the vectors
+
+        dtype: type = None
+            dtype of the vectors, or the default dtype if None
+
+        Notes
+        -----
+
+        Create a pool of reusable vectors that share one numpy array. Get vectors from
+        the arena with its ``new()`` method instead of creating new ones, and call its
+        ``reset()`` method at the start of each frame. This avoids creating and
+        throwing away vectors every frame, which keeps Python's garbage collector from
+        interrupting the sketch. See ``VectorArena``.
+        """
+        from .vector_arena import VectorArena
+
+        return VectorArena(capacity, dim, dtype)
+
     # *** END METHODS ***
 
 
@@ -1160,10 +1351,11 @@ class Vector2D(Vector):
 
     Internally, Vector stores the vector values in a numpy array. By default, the
     data type (dtype) of that numpy array is the default float size for your
-    computer, which is typically a 64 bit float, or ``np.float64``. To create a
-    vector with a different float size, pass your desired numpy float dtype to the
-    ``dtype`` parameter, like ``v3 = py5.Vector(1 / 3, 1 / 7,
-    dtype=np.float16)``.
+    computer, which is typically a 64 bit float, or ``np.float64``. A sketch can
+    change the default for its vectors with the ``vector_dtype`` parameter of
+    ``Sketch``. To create a vector with a different float size, pass your desired
+    numpy float dtype to the ``dtype`` parameter, like ``v3 = py5.Vector(1 / 3,
+    1 / 7, dtype=np.float16)``.
 
     When creating a new Vector, the initial vector values need not be discrete
     values. You can provide a list of numbers, a numpy array, or another Vector.
@@ -1178,7 +1370,7 @@ class Vector2D(Vector):
     copy=False)``.
     """
 
-    def __new__(cls, *args, dtype: type = np.float_):
+    def __new__(cls, *args, dtype: type = None):
         return super().__new__(cls, *args, dim=2, dtype=dtype)
 
     # *** BEGIN METHODS ***
@@ -1219,16 +1411,15 @@ class Vector2D(Vector):
         point your thumb in the direction of the axis to rotate around. Your fingers
         will curl in the direction of rotation when the ``angle`` parameter is positive.
         """
-        sin_angle = np.sin(angle)
-        cos_angle = np.cos(angle)
-        rot = np.array([[cos_angle, -sin_angle], [sin_angle, cos_angle]])
-        self._data[:] = rot @ self._data
+        from .rotation import rotation_matrix
+
+        self._data[:] = rotation_matrix(angle) @ self._data
         return self
 
     # *** END METHODS ***
 
     @classmethod
-    def random(cls, dim: int = 2, *, dtype: type = np.float_) -> Vector2D:
+    def random(cls, dim: int = 2, *, dtype: type = None) -> Vector2D:
         """Create a new vector with random values.
 
         Parameters
@@ -1237,8 +1428,8 @@ class Vector2D(Vector):
         dim: int
             dimension of the random vector to create
 
-        dtype: type = np.float_
-            dtype of the random vector to create
+        dtype: type = None
+            dtype of the random vector to create, or the default dtype if None
 
         Notes
         -----
@@ -1248,6 +1439,8 @@ class Vector2D(Vector):
 
         The new vector will have a magnitude of 1 and a heading that is uniformly
         distributed across all possible headings for a vector with the given dimension.
+        The values come from the sketch's random number generator, so they're
+        reproducible after ``random_seed()``.
 
         When used as a ``Vector`` class method, the ``dim`` parameter is required to
         specify what the new vector's dimension should be. When used as a class method
@@ -1291,10 +1484,11 @@ class Vector3D(Vector):
 
     Internally, Vector stores the vector values in a numpy array. By default, the
     data type (dtype) of that numpy array is the default float size for your
-    computer, which is typically a 64 bit float, or ``np.float64``. To create a
-    vector with a different float size, pass your desired numpy float dtype to the
-    ``dtype`` parameter, like ``v3 = py5.Vector(1 / 3, 1 / 7,
-    dtype=np.float16)``.
+    computer, which is typically a 64 bit float, or ``np.float64``. A sketch can
+    change the default for its vectors with the ``vector_dtype`` parameter of
+    ``Sketch``. To create a vector with a different float size, pass your desired
+    numpy float dtype to the ``dtype`` parameter, like ``v3 = py5.Vector(1 / 3,
+    1 / 7, dtype=np.float16)``.
 
     When creating a new Vector, the initial vector values need not be discrete
     values. You can provide a list of numbers, a numpy array, or another Vector.
@@ -1309,7 +1503,7 @@ class Vector3D(Vector):
     copy=False)``.
     """
 
-    def __new__(cls, *args, dtype: type = np.float_):
+    def __new__(cls, *args, dtype: type = None):
         return super().__new__(cls, *args, dim=3, dtype=dtype)
 
     def _get_z(self) -> float:
@@ -1384,25 +1578,13 @@ class Vector3D(Vector):
         point your thumb in the direction of the axis to rotate around. Your fingers
         will curl in the direction of rotation when the ``angle`` parameter is positive.
         """
-        sin_angle = np.sin(angle)
-        cos_angle = np.cos(angle)
-        if dim in [1, "x"]:
-            rot = np.array(
-                [[1, 0, 0], [0, cos_angle, -sin_angle], [0, sin_angle, cos_angle]]
-            )
-        elif dim in [2, "y"]:
-            rot = np.array(
-                [[cos_angle, 0, sin_angle], [0, 1, 0], [-sin_angle, 0, cos_angle]]
-            )
-        elif dim in [3, "z"]:
-            rot = np.array(
-                [[cos_angle, -sin_angle, 0], [sin_angle, cos_angle, 0], [0, 0, 1]]
-            )
-        else:
+        from .rotation import rotation_matrix
+
+        if dim not in [1, 2, 3, "x", "y", "z"]:
             raise RuntimeError(
                 "dim parameter must be 1, 2, or 3, or one of 'x', 'y', and 'z'"
             )
-        self._data[:] = rot @ self._data
+        self._data[:] = rotation_matrix(angle, dim) @ self._data
         return self
 
     def rotate_around(self, angle: float, v: Vector3D) -> Vector3D:
@@ -1430,40 +1612,19 @@ class Vector3D(Vector):
         point your thumb in the direction of the vector to rotate around. Your fingers
         will curl in the direction of rotation when the ``angle`` parameter is positive.
         """
+        from .rotation import rotation_matrix
+
         if not isinstance(v, Vector3D):
             raise RuntimeError("Can only rotate around another 3D Vector")
         if not v:
             raise RuntimeError("Cannot rotate around a vector of zeros")
-        u = v.norm
-        ux, uy, uz = u.x, u.y, u.z
-        sin, cos = np.sin(angle), np.cos(angle)
-        ncosp1 = 1 - cos
-        rot = np.array(
-            [
-                [
-                    cos + ux * ux * ncosp1,
-                    ux * uy * ncosp1 - uz * sin,
-                    ux * uz * ncosp1 + uy * sin,
-                ],
-                [
-                    uy * ux * ncosp1 + uz * sin,
-                    cos + uy * uy * ncosp1,
-                    uy * uz * ncosp1 - ux * sin,
-                ],
-                [
-                    uz * ux * ncosp1 - uy * sin,
-                    uz * uy * ncosp1 + ux * sin,
-                    cos + uz * uz * ncosp1,
-                ],
-            ]
-        )
-        self._data[:] = rot @ self._data
+        self._data[:] = rotation_matrix(angle, v) @ self._data
         return self
 
     # *** END METHODS ***
 
     @classmethod
-    def random(cls, dim: int = 3, *, dtype: type = np.float_) -> Vector3D:
+    def random(cls, dim: int = 3, *, dtype: type = None) -> Vector3D:
         """Create a new vector with random values.
 
         Parameters
@@ -1472,8 +1633,8 @@ class Vector3D(Vector):
         dim: int
             dimension of the random vector to create
 
-        dtype: type = np.float_
-            dtype of the random vector to create
+        dtype: type = None
+            dtype of the random vector to create, or the default dtype if None
 
         Notes
         -----
@@ -1483,6 +1644,8 @@ class Vector3D(Vector):
 
         The new vector will have a magnitude of 1 and a heading that is uniformly
         distributed across all possible headings for a vector with the given dimension.
+        The values come from the sketch's random number generator, so they're
+        reproducible after ``random_seed()``.
 
         When used as a ``Vector`` class method, the ``dim`` parameter is required to
         specify what the new vector's dimension should be. When used as a class method
@@ -1526,10 +1689,11 @@ class Vector4D(Vector):
 
     Internally, Vector stores the vector values in a numpy array. By default, the
     data type (dtype) of that numpy array is the default float size for your
-    computer, which is typically a 64 bit float, or ``np.float64``. To create a
-    vector with a different float size, pass your desired numpy float dtype to the
-    ``dtype`` parameter, like ``v3 = py5.Vector(1 / 3, 1 / 7,
-    dtype=np.float16)``.
+    computer, which is typically a 64 bit float, or ``np.float64``. A sketch can
+    change the default for its vectors with the ``vector_dtype`` parameter of
+    ``Sketch``. To create a vector with a different float size, pass your desired
+    numpy float dtype to the ``dtype`` parameter, like ``v3 = py5.Vector(1 / 3,
+    1 / 7, dtype=np.float16)``.
 
     When creating a new Vector, the initial vector values need not be discrete
     values. You can provide a list of numbers, a numpy array, or another Vector.
@@ -1544,7 +1708,7 @@ class Vector4D(Vector):
     copy=False)``.
     """
 
-    def __new__(cls, *args, dtype: type = np.float_):
+    def __new__(cls, *args, dtype: type = None):
         return super().__new__(cls, *args, dim=4, dtype=dtype)
 
     def _get_z(self) -> float:
@@ -1615,7 +1779,7 @@ class Vector4D(Vector):
     )
 
     @classmethod
-    def random(cls, dim: int = 4, *, dtype: type = np.float_) -> Vector4D:
+    def random(cls, dim: int = 4, *, dtype: type = None) -> Vector4D:
         """Create a new vector with random values.
 
         Parameters
@@ -1624,8 +1788,8 @@ class Vector4D(Vector):
         dim: int
             dimension of the random vector to create
 
-        dtype: type = np.float_
-            dtype of the random vector to create
+        dtype: type = None
+            dtype of the random vector to create, or the default dtype if None
 
         Notes
         -----
@@ -1635,6 +1799,8 @@ class Vector4D(Vector):
 
         The new vector will have a magnitude of 1 and a heading that is uniformly
         distributed across all possible headings for a vector with the given dimension.
+        The values come from the sketch's random number generator, so they're
+        reproducible after ``random_seed()``.
 
         When used as a ``Vector`` class method, the ``dim`` parameter is required to
         specify what the new vector's dimension should be. When used as a class method
@@ -1645,3 +1811,90 @@ class Vector4D(Vector):
         See the example code for examples of all of these use cases.
         """
         return super().random(dim, dtype=dtype)
+
+
+_VECTOR_CLASSES = {2: Vector2D, 3: Vector3D, 4: Vector4D}
+
+
+def _float_dtype(dtype: type | str) -> type:
+    """Returns the numpy float type for a dtype such as "float32"."""
+    try:
+        dtype = np.dtype(dtype).type
+    except TypeError:
+        dtype = None
+    if dtype is None or not np.issubdtype(dtype, np.floating):
+        raise RuntimeError(
+            "dtype parameter is not a valid numpy float type (i.e., np.float32, np.float64, etc)"
+        )
+    return dtype
+
+
+def _js_buffer(data: np.ndarray) -> object:
+    """Returns a JavaScript typed array that shares memory with a float array."""
+    if data.dtype not in (np.float32, np.float64):
+        raise RuntimeError(
+            f"Only float32 and float64 vectors can be shared with JavaScript, not {data.dtype}"
+        )
+    return to_js_buffer(np.ascontiguousarray(data))
+
+
+def _out_data(out: Vector | np.ndarray) -> np.ndarray:
+    """Returns the numpy array to write into for a method's out parameter."""
+    if isinstance(out, Vector):
+        return out._data
+    elif isinstance(out, np.ndarray):
+        return out
+    raise RuntimeError(
+        f"out must be a Vector or a numpy array, not {type(out).__name__}"
+    )
+
+
+# Reusable arrays for _lerp_into(), keyed by shape and dtype
+_SCRATCH: dict[tuple[tuple[int, ...], np.dtype], np.ndarray] = {}
+
+
+def _scratch_like(data: np.ndarray) -> np.ndarray:
+    """Returns a reusable array with the same shape and dtype as data."""
+    key = (data.shape, data.dtype)
+    scratch = _SCRATCH.get(key)
+    if scratch is None:
+        scratch = _SCRATCH[key] = np.empty_like(data)
+    return scratch
+
+
+def _lerp_into(
+    s: np.ndarray,
+    o: np.ndarray,
+    amt: float | np.ndarray,
+    out: np.ndarray,
+    scratch: np.ndarray,
+) -> None:
+    """Writes s + (o - s) * amt into out, using scratch for the difference.
+
+    The operations are the same as the allocating path, so the results are
+    identical. out can be the same array as s or o, but not scratch.
+    """
+    np.subtract(o, s, out=scratch)
+    np.multiply(scratch, amt, out=scratch)
+    np.add(s, scratch, out=out)
+
+
+def _swizzle_table(dim: int) -> dict[str, int | tuple[list[int], bool]]:
+    """Precomputes the swizzles for vectors with dimension dim.
+
+    Single letters map to their index. Longer swizzles map to a list of
+    indices and whether the swizzle can be assigned to, which requires that
+    it has no repeated letters.
+    """
+    letters = "xyzw"[:dim]
+    table = {letter: i for i, letter in enumerate(letters)}
+    for size in range(2, 5):
+        for indices in itertools.product(range(dim), repeat=size):
+            name = "".join(letters[i] for i in indices)
+            table[name] = (list(indices), len(set(indices)) == size)
+    return table
+
+
+for _dim, _cls in _VECTOR_CLASSES.items():
+    _cls._swizzles = _swizzle_table(_dim)
+del _dim, _cls
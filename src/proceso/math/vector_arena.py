@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import numpy as np
+
+from .vector import Vector
+
+
+class VectorArena:
+    """Pool of reusable vectors that share one numpy array.
+
+    Parameters
+    ----------
+
+    capacity: int
+        most vectors the arena can hand out before it's reset
+
+    dim: int
+        dimension of the vectors
+
+    dtype: type = None
+        dtype of the vectors, or the default vector dtype if None
+
+    Notes
+    -----
+
+    Pool of reusable vectors that share one numpy array. Sketches that create and
+    throw away thousands of vectors every frame keep Python's garbage collector
+    busy, which shows up as stutters in the browser. An arena creates all of its
+    vectors once, as views into a single ``(capacity, dim)`` numpy array, and hands
+    them out again after every call to ``reset()``.
+
+    Call ``new()`` to get a vector from the arena and ``reset()`` at the start of
+    each frame to make every vector available again. Vectors from the arena are
+    reused after ``reset()``, so don't keep them between frames; copy the ones that
+    need to last with ``Vector.copy``. Arithmetic such as ``a + b`` still creates a
+    new vector, so combine arena vectors with in-place operations and the ``out``
+    parameter of methods such as ``lerp()``.
+
+    Create an arena with ``Vector.arena()``.
+    """
+
+    def __init__(self, capacity: int, dim: int, dtype: type = None):
+        if capacity < 1:
+            raise RuntimeError("capacity must be at least 1")
+        if not 2 <= dim <= 4:
+            raise RuntimeError(f"Cannot create an arena of {dim}D vectors")
+        self._data = np.zeros((capacity, dim), dtype=dtype or Vector._default_dtype)
+        self._vectors = [Vector(row, copy=False) for row in self._data]
+        self._used = 0
+
+    def __len__(self):
+        return self._used
+
+    def __str__(self):
+        return f"VectorArena{self.dim}D({self._used} of {self.capacity} vectors)"
+
+    def __repr__(self):
+        return str(self)
+
+    def _get_capacity(self) -> int:
+        return len(self._vectors)
+
+    def _get_data(self) -> np.ndarray[np.floating]:
+        return self._data[: self._used]
+
+    def _get_dim(self) -> int:
+        return self._data.shape[1]
+
+    capacity: int = property(
+        _get_capacity,
+        doc="""The most vectors the arena can hand out before it's reset.""",
+    )
+    data: np.ndarray[np.floating] = property(
+        _get_data,
+        doc="""The values of the vectors handed out since the last reset, as an
+        ``(N, dim)`` numpy array that shares memory with them.""",
+    )
+    dim: int = property(
+        _get_dim,
+        doc="""The dimension of the arena's vectors.""",
+    )
+
+    def new(self, *values) -> Vector:
+        """Get a vector from the arena.
+
+        Parameters
+        ----------
+
+        values
+            the vector's values, a vector to copy, or nothing for a vector of zeros
+
+        Notes
+        -----
+
+        Get a vector from the arena. The vector is set to the given values, which can
+        be numbers or another vector to copy, or to zeros if no values are given. An
+        error is raised if every vector has already been handed out since the last
+        call to ``reset()``.
+        """
+        if self._used == len(self._vectors):
+            raise RuntimeError(
+                f"All {len(self._vectors)} vectors in the arena are in use. Call reset() each frame or create the arena with a larger capacity."
+            )
+        row = self._data[self._used]
+        if len(values) == 0:
+            row.fill(0)
+        elif len(values) == 1:
+            value = values[0]
+            row[...] = value._data if isinstance(value, Vector) else value
+        else:
+            row[...] = values
+        v = self._vectors[self._used]
+        self._used += 1
+        return v
+
+    def reset(self):
+        """Make every vector in the arena available again.
+
+        Notes
+        -----
+
+        Make every vector in the arena available again. Call this at the start of
+        each frame. Vectors handed out before the reset will be handed out again, so
+        don't keep using them afterwards.
+        """
+        self._used = 0
@@ -0,0 +1,759 @@
+from __future__ import annotations
+import operator
+from collections.abc import Iterable
+
+import numpy as np
+
+from .vector import Vector, _js_buffer, _lerp_into
+
+
+class VectorArray:
+    """Class to describe many 2D, 3D, or 4D vectors at once.
+
+    Notes
+    -----
+
+    Class to describe many 2D, 3D, or 4D vectors at once. A ``VectorArray`` stores
+    ``N`` vectors with the same dimension in a single ``(N, dim)`` numpy array and
+    provides the same operations as ``Vector``, applied to every vector with one
+    numpy call. This is much faster than looping over a list of ``Vector`` objects
+    when a sketch has many particles, agents, or points.
+
+    To create a ``VectorArray``, pass an ``(N, dim)`` array, a list of lists, or a
+    list of ``Vector`` objects, like ``VectorArray([[1, 2], [3, 4]])``. To create
+    ``N`` vectors of zeros, use the ``count`` and ``dim`` parameters, such as
+    ``VectorArray(count=100, dim=2)``.
+
+    Indexing a ``VectorArray`` with an integer returns a ``Vector`` that shares
+    memory with the array, so changing the ``Vector`` changes the array and vice
+    versa. Indexing with a slice returns a ``VectorArray`` view of those rows.
+
+    The ``x``, ``y``, ``z``, and ``w`` properties are views of the columns of the
+    array. Methods that return one value per vector, such as ``dist()`` and
+    ``dot()``, return a numpy array of length ``N``. Per-vector values can also be
+    passed to methods such as ``set_mag()`` and ``set_limit()`` as arrays of length
+    ``N``. To multiply or divide each vector by its own number, pass an array with
+    shape ``(N, 1)``.
+    """
+
+    def __init__(
+        self,
+        data: Iterable | None = None,
+        *,
+        count: int | None = None,
+        dim: int | None = None,
+        dtype: type | None = None,
+        copy: bool = True,
+    ):
+        if dtype is not None and not np.issubdtype(dtype, np.floating):
+            raise RuntimeError(
+                "dtype parameter is not a valid numpy float type (i.e., np.float32, np.float64, etc)"
+            )
+        if data is None:
+            if count is None or dim is None:
+                raise RuntimeError(
+                    "Provide vector data or both the count and dim parameters to create a VectorArray"
+                )
+            data = np.zeros((count, dim), dtype=dtype or Vector._default_dtype)
+        elif isinstance(data, VectorArray):
+            data = data._data.astype(dtype or data._data.dtype, copy=copy)
+        elif isinstance(data, np.ndarray) and not copy:
+            if not np.issubdtype(data.dtype, np.floating):
+                raise RuntimeError(
+                    "When the copy parameter is False, please provide a numpy array with a floating dtype to store vector data"
+                )
+            if dtype is not None and data.dtype != dtype:
+                raise RuntimeError(
+                    "When the copy parameter is False, the dtype parameter cannot differ from the provided numpy array's dtype"
+                )
+        else:
+            if not isinstance(data, np.ndarray):
+                data = [v._data if isinstance(v, Vector) else v for v in data]
+            data = np.array(data, dtype=dtype or Vector._default_dtype)
+
+        if data.ndim != 2 or not 2 <= data.shape[1] <= 4:
+            raise RuntimeError(
+                f"Cannot create a VectorArray from an array of shape {data.shape}, expected (N, 2), (N, 3), or (N, 4)"
+            )
+        if count is not None and data.shape[0] != count:
+            raise RuntimeError(
+                f"count parameter is {count} but VectorArray values imply a count of {data.shape[0]}"
+            )
+        if dim is not None and data.shape[1] != dim:
+            raise RuntimeError(
+                f"dim parameter is {dim} but VectorArray values imply dimension of {data.shape[1]}"
+            )
+        self._data = data
+        self._scratch = None
+
+    def __len__(self):
+        return self._data.shape[0]
+
+    def __iter__(self):
+        for row in self._data:
+            yield Vector(row, copy=False)
+
+    def __getitem__(self, key):
+        if isinstance(key, (int, np.integer)):
+            return Vector(self._data[key], copy=False)
+        return VectorArray(self._data[key], copy=False)
+
+    def __setitem__(self, key, val):
+        if isinstance(val, (Vector, VectorArray)):
+            val = val._data
+        self._data[key] = val
+
+    def __array__(self, dtype=None, copy=None):
+        if dtype is None:
+            return self._data
+        return self._data.astype(dtype)
+
+    def __str__(self):
+        return f"VectorArray{self.dim}D({len(self)} vectors)"
+
+    def __repr__(self):
+        return f"VectorArray{self.dim}D{repr(self._data)[5:]}"
+
+    def _operand(self, other, opname: str, allow_vectors: bool):
+        if isinstance(other, (Vector, VectorArray)):
+            if not allow_vectors:
+                raise RuntimeError(
+                    f"Cannot perform {opname} operation on a VectorArray and a {type(other).__name__}. If you want to do {opname} on the data elementwise, use the `.data` attribute to access the data as a numpy array."
+                )
+            if other.dim != self.dim:
+                raise RuntimeError(
+                    f"Cannot perform {opname} operation on {self.dim}D and {other.dim}D vectors. The dimensions must be the same."
+                )
+            return other._data
+        return other
+
+    def _run_op(
+        self, op, other, opname, swap=False, inplace=False, allow_vectors=False
+    ):
+        other = self._operand(other, opname, allow_vectors)
+        try:
+            if inplace:
+                op(self._data, other)
+                return self
+            a, b = (other, self._data) if swap else (self._data, other)
+            result = op(a, b)
+        except ValueError as e:
+            raise RuntimeError(
+                f"Unable to perform {opname} on a VectorArray, probably because of a size mismatch. The error message is: "
+                + str(e)
+            ) from None
+        if result.ndim == 2 and result.shape[1] == self.dim:
+            return VectorArray(result, copy=False)
+        return result
+
+    def __add__(self, other):
+        return self._run_op(operator.add, other, "addition", allow_vectors=True)
+
+    def __iadd__(self, other):
+        return self._run_op(
+            operator.iadd, other, "addition", inplace=True, allow_vectors=True
+        )
+
+    def __radd__(self, other):
+        return self._run_op(
+            operator.add, other, "addition", swap=True, allow_vectors=True
+        )
+
+    def __sub__(self, other):
+        return self._run_op(operator.sub, other, "subtraction", allow_vectors=True)
+
+    def __isub__(self, other):
+        return self._run_op(
+            operator.isub, other, "subtraction", inplace=True, allow_vectors=True
+        )
+
+    def __rsub__(self, other):
+        return self._run_op(
+            operator.sub, other, "subtraction", swap=True, allow_vectors=True
+        )
+
+    def __mul__(self, other):
+        return self._run_op(operator.mul, other, "multiplication")
+
+    def __imul__(self, other):
+        return self._run_op(operator.imul, other, "multiplication", inplace=True)
+
+    def __rmul__(self, other):
+        return self._run_op(operator.mul, other, "multiplication", swap=True)
+
+    def __truediv__(self, other):
+        return self._run_op(operator.truediv, other, "division")
+
+    def __itruediv__(self, other):
+        return self._run_op(operator.itruediv, other, "division", inplace=True)
+
+    def __pos__(self):
+        return self
+
+    def __neg__(self):
+        return VectorArray(-self._data, copy=False)
+
+    # *** BEGIN METHODS ***
+
+    def _get_data(self) -> np.ndarray[np.floating]:
+        return self._data
+
+    def _get_copy(self) -> VectorArray:
+        return VectorArray(self._data.copy(), copy=False)
+
+    def _get_dim(self) -> int:
+        return self._data.shape[1]
+
+    def _get_dtype(self) -> type:
+        return self._data.dtype
+
+    def _column(i: int):
+        def get(self) -> np.ndarray[np.floating]:
+            return self._data[:, i]
+
+        def set(self, val):
+            self._data[:, i] = val
+
+        return get, set
+
+    data: np.ndarray[np.floating] = property(
+        _get_data,
+        doc="""Numpy array used to store the vectors' data values.
+
+        Notes
+        -----
+
+        Numpy array with shape ``(N, dim)`` used to store the vectors' data values.""",
+    )
+    copy: VectorArray = property(
+        _get_copy,
+        doc="""Create an identical copy of this VectorArray instance.""",
+    )
+    dim: int = property(
+        _get_dim,
+        doc="""The vectors' dimension. This will be either 2, 3, or 4.""",
+    )
+    dtype: type = property(_get_dtype, doc="""VectorArray data type.""")
+    x: np.ndarray[np.floating] = property(
+        *_column(0), doc="""The vectors' x dimension values."""
+    )
+    y: np.ndarray[np.floating] = property(
+        *_column(1), doc="""The vectors' y dimension values."""
+    )
+    z: np.ndarray[np.floating] = property(
+        *_column(2),
+        doc="""The vectors' z dimension values. Only applicable to 3D and 4D vectors.""",
+    )
+    w: np.ndarray[np.floating] = property(
+        *_column(3),
+        doc="""The vectors' w dimension values. Only applicable to 4D vectors.""",
+    )
+    del _column
+
+    def tolist(self) -> list[list[float]]:
+        """Return the vectors' values as a list of lists."""
+        return self._data.tolist()
+
+    def to_js_buffer(self) -> object:
+        """Share the vectors' values with JavaScript without copying them.
+
+        Notes
+        -----
+
+        Share the vectors' values with JavaScript without copying them. Returns a
+        flat ``Float32Array`` or ``Float64Array`` of ``N * dim`` values, with each
+        vector's values next to each other, that views the same memory as the
+        vectors. The typed array is only valid until the end of the current
+        ``setup()``, ``draw()``, or event function. Vectors that aren't stored
+        contiguously, such as every other row of another ``VectorArray``, are copied
+        first.
+        """
+        return _js_buffer(self._data)
+
+    def _get_scratch(self) -> np.ndarray:
+        """Returns a reusable array with the same shape and dtype as the data."""
+        if self._scratch is None or self._scratch.shape != self._data.shape:
+            self._scratch = np.empty_like(self._data)
+        return self._scratch
+
+    @staticmethod
+    def _out_data(out: Vector | VectorArray | np.ndarray) -> np.ndarray:
+        if isinstance(out, (Vector, VectorArray)):
+            return out._data
+        elif isinstance(out, np.ndarray):
+            return out
+        raise RuntimeError(
+            f"out must be a Vector, VectorArray, or numpy array, not {type(out).__name__}"
+        )
+
+    def _store(self, out, calc, name: str):
+        try:
+            calc(self._out_data(out))
+        except ValueError as e:
+            raise RuntimeError(
+                f"Unable to store the {name} in out, probably because of a size mismatch. The error message is: "
+                + str(e)
+            ) from None
+        return out
+
+    def _other_data(self, other, name: str) -> np.ndarray:
+        if isinstance(other, (Vector, VectorArray)):
+            if other.dim != self.dim:
+                raise RuntimeError(
+                    f"Vector dimensions must be the same to calculate the {name} {self.dim}D and {other.dim}D vectors."
+                )
+            return other._data
+        return np.asarray(other)
+
+    def lerp(
+        self,
+        other: Vector | VectorArray | np.ndarray,
+        amt: float | np.ndarray,
+        *,
+        out: VectorArray | np.ndarray | None = None,
+    ) -> VectorArray | np.ndarray[np.floating]:
+        """Calculates vectors between these vectors and others at a specific increment.
+
+        Parameters
+        ----------
+
+        amt: float | np.ndarray
+            float between 0.0 and 1.0, or one float per vector
+
+        other: Vector | VectorArray | np.ndarray
+            other vector or vectors to interpolate between
+
+        out: VectorArray | np.ndarray | None = None
+            vectors or numpy array to store the result in
+
+        Notes
+        -----
+
+        Calculates vectors between these vectors and others at a specific increment.
+        Works like ``Vector.lerp()`` for every vector at once. Use the ``out``
+        parameter to write the result into existing vectors, which can be these vectors
+        or ``other``, without allocating any memory.
+        """
+        other = self._other_data(other, "lerp of")
+        amt = np.asarray(amt)
+        if amt.ndim == 1:
+            amt = amt[:, np.newaxis]
+        if out is None:
+            return VectorArray(self._data + (other - self._data) * amt, copy=False)
+        return self._store(
+            out,
+            lambda data: _lerp_into(
+                self._data, other, amt, data, self._get_scratch()
+            ),
+            "lerp",
+        )
+
+    def add_scaled(
+        self, other: Vector | VectorArray | np.ndarray, k: float | np.ndarray
+    ) -> VectorArray:
+        """Add other vectors multiplied by a number to these vectors.
+
+        Parameters
+        ----------
+
+        k: float | np.ndarray
+            number to multiply the other vectors by, or one number per vector
+
+        other: Vector | VectorArray | np.ndarray
+            vector or vectors to add
+
+        Notes
+        -----
+
+        Add other vectors multiplied by a number to these vectors, in place.
+        ``a.add_scaled(b, k)`` gives the same result as ``a += b * k``, but reuses
+        memory between calls, so updating positions with ``positions.add_scaled(
+        velocities, dt)`` every frame doesn't allocate any new arrays.
+        """
+        other = self._operand(other, "addition", allow_vectors=True)
+        k = np.asarray(k)
+        if k.ndim == 1:
+            k = k[:, np.newaxis]
+        try:
+            scratch = self._get_scratch()
+            np.multiply(other, k, out=scratch)
+            self._data += scratch
+        except ValueError as e:
+            raise RuntimeError(
+                f"Unable to perform addition on a VectorArray and a {type(other).__name__} object, probably because of a size mismatch. The error message is: "
+                + str(e)
+            ) from None
+        return self
+
+    def dist(
+        self,
+        other: Vector | VectorArray | np.ndarray,
+        *,
+        out: np.ndarray | None = None,
+    ) -> np.ndarray[np.floating]:
+        """Calculate the distance between these vectors and others.
+
+        Parameters
+        ----------
+
+        other: Vector | VectorArray | np.ndarray
+            vector or vectors to calculate the distance from
+
+        out: np.ndarray | None = None
+            array of length N to store the distances in
+
+        Notes
+        -----
+
+        Calculate the distance between these vectors and others. Returns one distance
+        per vector. Use the ``out`` parameter to write the distances into an existing
+        array without allocating any memory.
+        """
+        other = self._other_data(other, "distance between")
+        if out is None:
+            return np.sqrt(np.sum((self._data - other) ** 2, axis=-1))
+
+        def calc(data):
+            scratch = self._get_scratch()
+            np.subtract(self._data, other, out=scratch)
+            np.square(scratch, out=scratch)
+            np.sum(scratch, axis=-1, out=data)
+            np.sqrt(data, out=data)
+
+        return self._store(out, calc, "distances")
+
+    def dot(
+        self,
+        other: Vector | VectorArray | np.ndarray,
+        *,
+        out: np.ndarray | None = None,
+    ) -> np.ndarray[np.floating]:
+        """Calculate the dot product between these vectors and others.
+
+        Parameters
+        ----------
+
+        other: Vector | VectorArray | np.ndarray
+            vector or vectors to calculate the dot product with
+
+        out: np.ndarray | None = None
+            array of length N to store the dot products in
+
+        Notes
+        -----
+
+        Calculate the dot product between these vectors and others. Returns one dot
+        product per vector. Use the ``out`` parameter to write the dot products into an
+        existing array without allocating any memory.
+        """
+        other = self._other_data(other, "dot product for")
+        if out is None:
+            return np.sum(self._data * other, axis=-1)
+
+        def calc(data):
+            scratch = self._get_scratch()
+            np.multiply(self._data, other, out=scratch)
+            np.sum(scratch, axis=-1, out=data)
+
+        return self._store(out, calc, "dot products")
+
+    def cross(
+        self,
+        other: Vector | VectorArray | np.ndarray,
+        *,
+        out: VectorArray | np.ndarray | None = None,
+    ) -> VectorArray | np.ndarray[np.floating]:
+        """Calculate the vector cross product of these vectors and others.
+
+        Parameters
+        ----------
+
+        other: Vector | VectorArray | np.ndarray
+            2D or 3D vector or vectors to calculate the cross product with
+
+        out: VectorArray | np.ndarray | None = None
+            vectors or numpy array to store the result in
+
+        Notes
+        -----
+
+        Calculate the vector cross product of these vectors and others. Works like
+        ``Vector.cross()`` for every vector at once. If both are 2D, the returned value
+        is an array with the wedge product for each vector. Use the ``out`` parameter
+        to write the result into existing vectors or an existing array.
+        """
+        if self.dim == 4 or getattr(other, "dim", None) == 4:
+            raise RuntimeError("Cannot calculate the cross product with a 4D Vector")
+        if isinstance(other, (Vector, VectorArray)):
+            other = other._data
+        result = np.cross(self._data, other)
+        if out is not None:
+
+            def calc(data):
+                data[...] = result
+
+            return self._store(out, calc, "cross product")
+        if result.ndim == 2:
+            return VectorArray(result, copy=False)
+        return result
+
+    def _get_mag(self) -> np.ndarray[np.floating]:
+        return np.sqrt(self._get_mag_sq())
+
+    def _get_mag_sq(self) -> np.ndarray[np.floating]:
+        return np.sum(self._data**2, axis=1)
+
+    def set_mag(self, mag: float | np.ndarray) -> VectorArray:
+        """Set the vectors' magnitudes.
+
+        Parameters
+        ----------
+
+        mag: float | np.ndarray
+            new magnitude, or one magnitude per vector
+
+        Notes
+        -----
+
+        Set the vectors' magnitudes. Vectors of zeros are left unchanged.
+        """
+        self.normalize()
+        mag = np.asarray(mag)
+        self._data *= mag[:, np.newaxis] if mag.ndim == 1 else mag
+        return self
+
+    def set_mag_sq(self, mag_sq: float | np.ndarray) -> VectorArray:
+        """Set the squares of the vectors' magnitudes.
+
+        Parameters
+        ----------
+
+        mag_sq: float | np.ndarray
+            new squared magnitude, or one squared magnitude per vector
+
+        Notes
+        -----
+
+        Set the squares of the vectors' magnitudes. Negative values will result in an
+        error.
+        """
+        if np.any(np.asarray(mag_sq) < 0):
+            raise RuntimeError("Cannot set squared magnitude to a negative number")
+        return self.set_mag(np.sqrt(mag_sq))
+
+    def normalize(self) -> VectorArray:
+        """Normalize the vectors by setting each vector's magnitude to 1.0.
+
+        Notes
+        -----
+
+        Normalize the vectors by setting each vector's magnitude to 1.0. Unlike
+        ``Vector.normalize()``, vectors of zeros are silently left unchanged.
+        """
+        mag = self._get_mag()
+        np.divide(
+            self._data,
+            mag[:, np.newaxis],
+            out=self._data,
+            where=mag[:, np.newaxis] > 0,
+        )
+        return self
+
+    def _get_norm(self) -> VectorArray:
+        return self.copy.normalize()
+
+    mag: np.ndarray[np.floating] = property(
+        _get_mag,
+        set_mag,
+        doc="""The vectors' magnitudes, as an array with one value per vector.""",
+    )
+    mag_sq: np.ndarray[np.floating] = property(
+        _get_mag_sq,
+        set_mag_sq,
+        doc="""The squares of the vectors' magnitudes, as an array with one value per
+        vector.""",
+    )
+    norm: VectorArray = property(
+        _get_norm,
+        doc="""Normalized copy of the vectors. Vectors of zeros stay zeros.""",
+    )
+
+    def set_limit(self, max_mag: float | np.ndarray) -> VectorArray:
+        """Constrain the vectors' magnitudes to a specified value.
+
+        Parameters
+        ----------
+
+        max_mag: float | np.ndarray
+            maximum vector magnitude, or one maximum per vector
+
+        Notes
+        -----
+
+        Constrain the vectors' magnitudes to a specified value. Vectors whose magnitude
+        is already less than or equal to ``max_mag`` are unchanged. The ``max_mag``
+        parameter cannot be negative.
+        """
+        max_mag = np.asarray(max_mag, dtype=self._data.dtype)
+        if np.any(max_mag < 0):
+            raise RuntimeError("Cannot set limit to a negative number")
+        mag = self._get_mag()
+        scale = np.ones_like(mag)
+        np.divide(max_mag, mag, out=scale, where=mag > max_mag)
+        self._data *= scale[:, np.newaxis]
+        return self
+
+    def _get_heading(self) -> np.ndarray[np.floating]:
+        heading = self._get_heading_radians()
+        if Vector._angle_mode == "degrees":
+            return np.degrees(heading)
+        return heading
+
+    def _get_heading_radians(self) -> np.ndarray[np.floating]:
+        data = self._data
+        if self.dim == 2:
+            return np.arctan2(data[:, 1], data[:, 0])
+        elif self.dim == 3:
+            return np.column_stack(
+                (
+                    np.arctan2(np.sqrt(np.sum(data[:, :2] ** 2, axis=1)), data[:, 2]),
+                    np.arctan2(data[:, 1], data[:, 0]),
+                )
+            )
+        else:
+            return np.column_stack(
+                (
+                    np.arctan2(np.sqrt(np.sum(data[:, 1:] ** 2, axis=1)), data[:, 0]),
+                    np.arctan2(np.sqrt(np.sum(data[:, 2:] ** 2, axis=1)), data[:, 1]),
+                    2
+                    * np.arctan2(
+                        data[:, 3],
+                        data[:, 2] + np.sqrt(np.sum(data[:, 2:] ** 2, axis=1)),
+                    ),
+                )
+            )
+
+    heading: np.ndarray[np.floating] = property(
+        _get_heading,
+        doc="""The vectors' headings, measured in the sketch's angle mode.
+
+        Notes
+        -----
+
+        The vectors' headings, measured in the sketch's angle mode, following the same
+        conventions as ``Vector.heading``. For 2D vectors this is an array with one
+        angle per vector. For 3D and 4D vectors it's an array with shape ``(N, 2)`` or
+        ``(N, 3)``. Like ``Vector.heading``, it's measured in degrees after
+        ``angle_mode(DEGREES)``.""",
+    )
+
+    def rotate(
+        self, angle: float | np.ndarray, dim: int | str | None = None
+    ) -> VectorArray:
+        """Rotate the vectors by a specified angle.
+
+        Parameters
+        ----------
+
+        angle: float | np.ndarray
+            angle of rotation, measured in radians, or one angle per vector
+
+        dim: int | str | None
+            dimension to rotate 3D vectors around
+
+        Notes
+        -----
+
+        Rotate the vectors by a specified angle. Works like ``Vector2D.rotate()`` and
+        ``Vector3D.rotate()`` for every vector at once. Rotating every vector by the
+        same angle uses a cached rotation matrix and a single matrix multiplication.
+        """
+        from .rotation import rotate_vectors
+
+        if self.dim == 2:
+            if dim is not None:
+                raise RuntimeError("dim parameter is only used to rotate 3D vectors")
+            i, j = 0, 1
+        elif self.dim == 3:
+            if dim in [1, "x"]:
+                i, j = 1, 2
+            elif dim in [2, "y"]:
+                i, j = 2, 0
+            elif dim in [3, "z"]:
+                i, j = 0, 1
+            else:
+                raise RuntimeError(
+                    "dim parameter must be 1, 2, or 3, or one of 'x', 'y', and 'z'"
+                )
+        else:
+            raise RuntimeError("Cannot rotate 4D vectors")
+        if np.ndim(angle) == 0:
+            return rotate_vectors(self, angle, dim, out=self)
+        sin_angle = np.sin(angle)
+        cos_angle = np.cos(angle)
+        a = self._data[:, i].copy()
+        b = self._data[:, j]
+        self._data[:, i] = a * cos_angle - b * sin_angle
+        self._data[:, j] = a * sin_angle + b * cos_angle
+        return self
+
+    def rotate_around(self, angle: float, v: Vector) -> VectorArray:
+        """Rotate the vectors around an arbitrary 3D vector.
+
+        Parameters
+        ----------
+
+        angle: float
+            angle of rotation, measured in radians
+
+        v: Vector
+            3D vector to rotate the vectors around
+
+        Notes
+        -----
+
+        Rotate the vectors around an arbitrary 3D vector. Works like
+        ``Vector3D.rotate_around()`` for every vector at once, using a cached rotation
+        matrix and a single matrix multiplication.
+        """
+        from .rotation import rotate_vectors
+
+        if self.dim != 3:
+            raise RuntimeError("Can only rotate 3D vectors around another 3D Vector")
+        return rotate_vectors(self, angle, v, out=self)
+
+    @classmethod
+    def random(cls, count: int, dim: int, *, dtype: type = None) -> VectorArray:
+        """Create new vectors with random values.
+
+        Parameters
+        ----------
+
+        count: int
+            number of random vectors to create
+
+        dim: int
+            dimension of the random vectors to create
+
+        dtype: type = None
+            dtype of the random vectors to create, or the default dtype if None
+
+        Notes
+        -----
+
+        Create new vectors with random values. Like ``Vector.random()``, each vector
+        will have a magnitude of 1 and a heading that is uniformly distributed across
+        all possible headings for a vector with the given dimension.
+        """
+        dtype = dtype or Vector._default_dtype
+        if dim == 2:
+            angle = Vector._rng.random(count) * 2 * np.pi
+            data = np.column_stack((np.cos(angle), np.sin(angle))).astype(dtype)
+        elif dim in (3, 4):
+            data = Vector._rng.standard_normal((count, dim)).astype(dtype)
+            data /= np.sqrt(np.sum(data**2, axis=1))[:, np.newaxis]
+        else:
+            raise RuntimeError(f"Cannot create a random Vector with dimension {dim}")
+        return cls(data, copy=False)
+
+    # *** END METHODS ***
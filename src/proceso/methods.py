@@ -0,0 +1,41 @@
+from .buffer import COMMANDS
+
+# p5 methods resolved as soon as a sketch is created. Other methods are
+# resolved the first time they're used.
+METHODS = COMMANDS + (
+    "image",
+    "text",
+    "_procesoBulk",
+    "_procesoReplay",
+    "_procesoSnapshot",
+    "_procesoVertices",
+)
+
+
+class MethodTable:
+    """Stands in for a p5 instance and caches its bound methods.
+
+    Looking up a method on a JsProxy fetches a string-keyed property from
+    JavaScript every time. The table does that once per method and keeps the
+    bound method as a plain Python attribute. Members that aren't functions,
+    such as system variables, are always read from the p5 instance.
+    """
+
+    def __init__(self, p5js: object):
+        object.__setattr__(self, "_p5js", p5js)
+        for name in METHODS:
+            object.__setattr__(self, name, getattr(p5js, name))
+
+    def __getattr__(self, name: str):
+        value = getattr(self._p5js, name)
+        if callable(value):
+            object.__setattr__(self, name, value)
+        return value
+
+    def __setattr__(self, name: str, value):
+        self.__dict__.pop(name, None)
+        setattr(self._p5js, name, value)
+
+    def __delattr__(self, name: str):
+        self.__dict__.pop(name, None)
+        delattr(self._p5js, name)
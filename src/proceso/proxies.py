@@ -0,0 +1,54 @@
+from typing import Callable
+
+from .backend import create_proxy
+
+
+class ProxyRegistry:
+    """Keeps track of the JavaScript proxies a sketch creates.
+
+    Pyodide keeps a Python function alive for as long as the proxy that wraps
+    it exists, so proxies must be destroyed explicitly once p5 no longer calls
+    them. Proxies are stored in named groups so that the ones created by
+    run_sketch() can be replaced without destroying callbacks that are still
+    attached to DOM elements.
+    """
+
+    def __init__(self):
+        self._groups: dict[str, list] = {}
+
+    def __len__(self) -> int:
+        """Returns the number of live proxies."""
+        return sum(len(proxies) for proxies in self._groups.values())
+
+    def create(self, func: Callable, group: str = "dom") -> object:
+        """Creates a proxy for func and adds it to group."""
+        proxy = create_proxy(func)
+        self._groups.setdefault(group, []).append(proxy)
+        return proxy
+
+    def destroy(self, group: str | None = None):
+        """Destroys the proxies in group, or every proxy if group is None."""
+        if group is None:
+            groups = list(self._groups)
+        else:
+            groups = [group]
+        for name in groups:
+            for proxy in self._groups.pop(name, []):
+                proxy.destroy()
+
+
+_registries: dict[str, ProxyRegistry] = {}
+
+
+def get_registry(id: str) -> ProxyRegistry:
+    """Returns the proxy registry for the sketch with the given id."""
+    if id not in _registries:
+        _registries[id] = ProxyRegistry()
+    return _registries[id]
+
+
+def destroy_registry(id: str):
+    """Destroys every proxy created by the sketch with the given id."""
+    registry = _registries.pop(id, None)
+    if registry is not None:
+        registry.destroy()
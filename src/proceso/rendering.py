@@ -1,5 +1,6 @@
 from typing import Any
 
+from .backend import set_canvas_id
 from .binding import BaseSketch
 
 
@@ -24,13 +25,10 @@ class Rendering(BaseSketch):
         this function. If create_canvas() is not used, the window will be given a
         default size of 100×100 pixels.
         """
-        from pyodide.code import run_js
-
         self.width = width
         self.height = height
         canvas = self._p5js.createCanvas(width, height, renderer)
-        set_canvas_id = f"{self.id}.canvas.setAttribute('id', '{self.id}');"
-        run_js(set_canvas_id)
+        set_canvas_id(self.id)
         return canvas
 
     def size(self, width: int, height: int, renderer: str | None = None) -> object:
@@ -1,6 +1,9 @@
-from pyodide.ffi import to_js
+import numpy as np
+
+from .backend import to_js, to_js_buffer
 
 from .binding import BaseSketch
+from .utils import vector_args
 
 
 class Shape(BaseSketch):
@@ -70,13 +73,16 @@ class Shape(BaseSketch):
         """
         self._p5js.line(x1, y1, x2, y2, *args)
 
-    def point(self, x: float, y: float, z: float | None = None):
+    def point(self, x: float, y: float | None = None, z: float | None = None):
         """Draws a point, a coordinate in space at the dimension of one pixel.
         The first parameter is the horizontal value for the point, the second
         param is the vertical value for the point. The color of the point is
         changed with the stroke() function. The size of the point can be changed
-        with the stroke_weight() function.
+        with the stroke_weight() function. The first parameter can also be a 2D
+        or 3D vector, in which case the others are left out.
         """
+        if y is None:
+            x, y, z = vector_args(x)
         self._p5js.point(x, y, z)
 
     def quad(
@@ -164,6 +170,120 @@ class Shape(BaseSketch):
         """
         self._p5js.triangle(x1, y1, x2, y2, x3, y3)
 
+    # ===============
+    # Bulk Primitives
+    # ===============
+    def _draw_many(self, name: str, widths: tuple[int, ...], columns: tuple):
+        first, *rest = columns
+        if all(column is None for column in rest):
+            data = np.asarray(first, dtype=np.float64)
+        else:
+            given = list(columns)
+            while given[-1] is None:
+                given.pop()
+            if any(column is None for column in given):
+                raise RuntimeError(
+                    f"Cannot draw {name}s with missing coordinates in between given ones"
+                )
+            data = np.column_stack(np.broadcast_arrays(*given)).astype(np.float64)
+        if data.ndim != 2 or data.shape[1] not in widths:
+            expected = " or ".join(f"(N, {width})" for width in widths)
+            raise RuntimeError(
+                f"Cannot draw {name}s from an array of shape {data.shape}, expected {expected}"
+            )
+        if data.shape[0] == 0:
+            return
+        stride = data.shape[1]
+        data = np.ascontiguousarray(data).ravel()
+        self._p5js._procesoBulk(name, stride, to_js_buffer(data))
+
+    def ellipses(
+        self,
+        x: np.ndarray,
+        y: np.ndarray | None = None,
+        w: np.ndarray | None = None,
+        h: np.ndarray | None = None,
+    ):
+        """Draws many ellipses to the screen with a single call.
+        Takes either one array of shape (N, 3) or (N, 4) with a row of x, y, w, and
+        optionally h values per ellipse, or separate arrays (or numbers) for each
+        column. If no height is given, the width is used for both. See ellipse()
+        for details.
+        """
+        self._draw_many("ellipse", (3, 4), (x, y, w, h))
+
+    def circles(
+        self,
+        x: np.ndarray,
+        y: np.ndarray | None = None,
+        d: np.ndarray | None = None,
+    ):
+        """Draws many circles to the screen with a single call.
+        Takes either one array of shape (N, 3) with a row of x, y, d values per
+        circle, or separate arrays (or numbers) for each column. For example,
+        circles(xs, ys, 10) draws a circle with diameter 10 at each position. See
+        circle() for details.
+        """
+        self._draw_many("circle", (3,), (x, y, d))
+
+    def lines(
+        self,
+        x1: np.ndarray,
+        y1: np.ndarray | None = None,
+        x2: np.ndarray | None = None,
+        y2: np.ndarray | None = None,
+    ):
+        """Draws many lines to the screen with a single call.
+        Takes either one array of shape (N, 4) with a row of x1, y1, x2, y2 values
+        per line, or separate arrays (or numbers) for each column. In WEBGL mode,
+        an array of shape (N, 6) with rows of x1, y1, z1, x2, y2, z2 values draws
+        lines in 3D. See line() for details.
+        """
+        self._draw_many("line", (4, 6), (x1, y1, x2, y2))
+
+    def points(
+        self,
+        x: np.ndarray,
+        y: np.ndarray | None = None,
+        z: np.ndarray | None = None,
+    ):
+        """Draws many points with a single call.
+        Takes either one array of shape (N, 2) or (N, 3) with a row of x, y, and
+        optionally z values per point, or separate arrays (or numbers) for each
+        column. See point() for details.
+        """
+        self._draw_many("point", (2, 3), (x, y, z))
+
+    def rects(
+        self,
+        x: np.ndarray,
+        y: np.ndarray | None = None,
+        w: np.ndarray | None = None,
+        h: np.ndarray | None = None,
+    ):
+        """Draws many rectangles on the canvas with a single call.
+        Takes either one array of shape (N, 4) with a row of x, y, w, h values per
+        rectangle, or separate arrays (or numbers) for each column. See rect() for
+        details.
+        """
+        self._draw_many("rect", (4,), (x, y, w, h))
+
+    def triangles(
+        self,
+        x1: np.ndarray,
+        y1: np.ndarray | None = None,
+        x2: np.ndarray | None = None,
+        y2: np.ndarray | None = None,
+        x3: np.ndarray | None = None,
+        y3: np.ndarray | None = None,
+    ):
+        """Draws many triangles to the canvas with a single call.
+        Takes either one array of shape (N, 6) with a row of x1, y1, x2, y2, x3,
+        y3 values per triangle, or separate arrays (or numbers) for each column.
+        See triangle() for details.
+        """
+        self._draw_many("triangle", (6,), (x1, y1, x2, y2, x3, y3))
+
     # ==========
     # Attributes
     # ==========
@@ -536,7 +656,7 @@ class Shape(BaseSketch):
     def vertex(
         self,
         x: float,
-        y: float,
+        y: float | None = None,
         z: float | None = None,
         u: float | None = None,
         v: float | None = None,
@@ -544,10 +664,100 @@ class Shape(BaseSketch):
         """All shapes are constructed by connecting a series of vertices.
         vertex() is used to specify the vertex coordinates for points, lines,
         triangles, quads, and polygons. It is used exclusively within the
-        begin_shape() and end_shape() functions.
+        begin_shape() and end_shape() functions. The first parameter can also be
+        a 2D or 3D vector, in which case y and z are left out and texture
+        coordinates can be passed as u and v.
         """
+        if y is None:
+            x, y, z = vector_args(x)
         self._p5js.vertex(x, y, z, u, v)
 
+    def _submit_vertices(
+        self,
+        name: str,
+        group: int,
+        points: np.ndarray,
+        uvs: np.ndarray | None,
+        contours: list[int] | None,
+    ):
+        data = np.asarray(points, dtype=np.float64)
+        if data.ndim != 2 or data.shape[1] not in (2, 3):
+            raise RuntimeError(
+                f"Cannot use an array of shape {data.shape} as vertices, expected (N, 2) or (N, 3)"
+            )
+        count = data.shape[0]
+        if count % group:
+            raise RuntimeError(
+                f"Number of vertices must be a multiple of {group}, not {count}"
+            )
+        if uvs is not None:
+            uvs = np.asarray(uvs, dtype=np.float64)
+            if uvs.shape != (count, 2):
+                raise RuntimeError(
+                    f"Cannot use an array of shape {uvs.shape} as texture coordinates for {count} vertices, expected ({count}, 2)"
+                )
+            data = np.hstack((data, uvs))
+        starts = []
+        for start in sorted(set(contours or [])):
+            if start % group or not 0 < start < count:
+                raise RuntimeError(f"Invalid contour start index {start}")
+            starts.append(int(start))
+        if count == 0:
+            return
+        stride = data.shape[1]
+        data = np.ascontiguousarray(data).ravel()
+        self._p5js._procesoVertices(
+            name, stride, group, to_js_buffer(data), to_js(starts)
+        )
+
+    def vertices(
+        self,
+        points: np.ndarray,
+        uvs: np.ndarray | None = None,
+        contours: list[int] | None = None,
+    ):
+        """Adds many vertices to a shape with a single call.
+        points is an array of shape (N, 2) or (N, 3) with one vertex per row. The
+        optional uvs array of shape (N, 2) sets the texture coordinates of each
+        vertex.
+
+        contours is an optional list of row indices where negative shapes begin.
+        Each contour runs until the next index or the end of the array, so
+        vertices(points, contours=[4]) is the same as calling vertex() for the
+        first four rows, then begin_contour(), vertex() for the remaining rows,
+        and end_contour().
+
+        Like vertex(), this function must be used between begin_shape() and
+        end_shape().
+        """
+        self._submit_vertices("vertex", 1, points, uvs, contours)
+
+    def curve_vertices(self, points: np.ndarray, contours: list[int] | None = None):
+        """Adds many curve vertices to a shape with a single call.
+        points is an array of shape (N, 2) or (N, 3) with one vertex per row,
+        equivalent to calling curve_vertex() for each row. contours works the same
+        way as in vertices().
+        """
+        self._submit_vertices("curveVertex", 1, points, None, contours)
+
+    def bezier_vertices(self, points: np.ndarray, contours: list[int] | None = None):
+        """Adds many Bezier segments to a shape with a single call.
+        points is an array of shape (N, 2) or (N, 3) where every three rows hold
+        the two control points and the anchor point of one segment, equivalent to
+        calling bezier_vertex() once per group of three rows. As with
+        bezier_vertex(), the first segment must be prefaced with a call to
+        vertex().
+
+        contours isn't supported and raises a ValueError, because p5 needs each
+        contour to start with a call to vertex(). Use begin_contour(), vertex(),
+        and another call to bezier_vertices() instead.
+        """
+        if contours:
+            raise ValueError(
+                "bezier_vertices() doesn't support contours, since each contour must start with vertex()"
+            )
+        self._submit_vertices("bezierVertex", 3, points, None, None)
+
     def normal(self, x: float, y: float, z: float):
         """Sets the 3d vertex normal to use for subsequent vertices drawn with
         vertex().
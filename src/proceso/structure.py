@@ -13,6 +13,7 @@ class Structure(BaseSketch):
         remain.
         """
         self._p5js.remove()
+        self._proxies.destroy()
 
     def no_loop(self):
         """Stops p5.js from continuously executing the code within draw().
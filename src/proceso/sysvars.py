@@ -1,7 +1,39 @@
-from typing import Annotated
+import math
+import struct
+from typing import Annotated, get_args
+
+
+class SystemVariable:
+    """Reads a p5 system variable the first time it's used in a frame.
+
+    The value is cached until the sketch starts its next frame. Assigning to
+    the variable overrides the cached value for the rest of the frame.
+    """
+
+    def __init__(self, js_name: str):
+        self.js_name = js_name
+
+    def __set_name__(self, owner: type, name: str):
+        self.name = name
+
+    def __get__(self, sketch, owner: type | None = None):
+        if sketch is None:
+            return self
+        cache = sketch._system_variables
+        try:
+            return cache[self.name]
+        except KeyError:
+            value = cache[self.name] = getattr(sketch._p5js, self.js_name)
+            return value
+
+    def __set__(self, sketch, value):
+        sketch._system_variables[self.name] = value
 
 
 class SystemVariables:
+    _system_variables: dict[str, object]
+    _packed_system_variables: bool = False
+
     # Environment
     frame_count: Annotated[
         int,
@@ -9,44 +41,44 @@ class SystemVariables:
         have been displayed since the program started. Inside setup() the value is
         0, after the first iteration of draw() it is 1, etc.
         """,
-    ]
+    ] = SystemVariable("frameCount")
     delta_time: Annotated[
         float,
         """The system variable delta_time contains the time difference between the beginning of the previous frame and the beginning of the current frame in milliseconds.
         This variable is useful for creating time sensitive animation or physics calculation that should stay constant regardless of frame rate.
         """,
-    ]
+    ] = SystemVariable("deltaTime")
     focused: Annotated[
         bool,
         """Confirms if the window a p5 program is in is "focused," meaning that
         the sketch will accept mouse or keyboard input. This variable is True if
         the window is focused and False if not.
         """,
-    ]
+    ] = SystemVariable("focused")
     display_width: Annotated[
         int,
         """System variable that stores the width of the screen display according to the default pixel_density. This is used to run a full-screen program on any display size.
         To return actual screen size, multiply this by pixel_density.
         """,
-    ]
+    ] = SystemVariable("displayWidth")
     display_height: Annotated[
         int,
         """System variable that stores the height of the screen display according to The default pixel_density. This is used to run a full-screen program on any display size.
         To return actual screen size, multiply this by pixel_density.
         """,
-    ]
+    ] = SystemVariable("displayHeight")
     window_width: Annotated[
         int,
         """System variable that stores the width of the inner window, it maps to
         window.innerWidth.
         """,
-    ]
+    ] = SystemVariable("windowWidth")
     window_height: Annotated[
         int,
         """System variable that stores the height of the inner window, it maps to
         window.innerHeight.
         """,
-    ]
+    ] = SystemVariable("windowHeight")
     width: Annotated[
         int,
         """System variable that stores the width of the drawing canvas. This value
@@ -55,7 +87,7 @@ class SystemVariables:
         to the value 320. The value of width defaults to 100 if create_canvas() is
         not used in a program.
         """,
-    ] = 100
+    ] = SystemVariable("width")
     height: Annotated[
         int,
         """System variable that stores the height of the drawing canvas. This
@@ -64,7 +96,7 @@ class SystemVariables:
         variable to the value 240. The value of height defaults to 100 if
         create_canvas() is not used in a program.
         """,
-    ] = 100
+    ] = SystemVariable("height")
 
     # Events
     device_orientation: Annotated[
@@ -74,49 +106,49 @@ class SystemVariables:
         or 'portrait'. If no data is available it will be set to 'undefined'.
         Either LANDSCAPE or PORTRAIT.
         """,
-    ]
+    ] = SystemVariable("deviceOrientation")
     acceleration_x: Annotated[
         float,
         """The system variable acceleration_x always contains the acceleration of
         the device along the x axis. Value is represented as meters per second
         squared.
         """,
-    ]
+    ] = SystemVariable("accelerationX")
     acceleration_y: Annotated[
         float,
         """The system variable acceleration_y always contains the acceleration of
         the device along the y axis. Value is represented as meters per second
         squared.
         """,
-    ]
+    ] = SystemVariable("accelerationY")
     acceleration_z: Annotated[
         float,
         """The system variable acceleration_z always contains the acceleration of
         the device along the z axis. Value is represented as meters per second
         squared.
         """,
-    ]
+    ] = SystemVariable("accelerationZ")
     pacceleration_x: Annotated[
         float,
         """The system variable pacceleration_ always contains the acceleration of
         the device along the x axis in the frame previous to the current frame.
         Value is represented as meters per second squared.
         """,
-    ]
+    ] = SystemVariable("pAccelerationX")
     pacceleration_y: Annotated[
         float,
         """The system variable pacceleration_y always contains the acceleration of
         the device along the y axis in the frame previous to the current frame.
         Value is represented as meters per second squared.
         """,
-    ]
+    ] = SystemVariable("pAccelerationY")
     pacceleration_z: Annotated[
         float,
         """The system variable pacceleration_z always contains the acceleration of
         the device along the z axis in the frame previous to the current frame.
         Value is represented as meters per second squared.
         """,
-    ]
+    ] = SystemVariable("pAccelerationZ")
     rotation_x: Annotated[
         float,
         """The system variable rotation_x always contains the rotation of the
@@ -128,7 +160,7 @@ class SystemVariables:
         together, it must be called in the order Z-X-Y or there might be
         unexpected behaviour.
         """,
-    ]
+    ] = SystemVariable("rotationX")
     rotation_y: Annotated[
         float,
         """The system variable rotation_y always contains the rotation of the
@@ -140,7 +172,7 @@ class SystemVariables:
         together, it must be called in the order Z-X-Y or there might be
         unexpected behaviour.
         """,
-    ]
+    ] = SystemVariable("rotationY")
     rotation_z: Annotated[
         float,
         """The system variable rotation_z always contains the rotation of the
@@ -155,7 +187,7 @@ class SystemVariables:
         together, it must be called in the order Z-X-Y or there might be
         unexpected behaviour.
         """,
-    ]
+    ] = SystemVariable("rotationZ")
     protation_x: Annotated[
         float,
         """The system variable protation_x always contains the rotation of the
@@ -166,7 +198,7 @@ class SystemVariables:
         protation_x can also be used with rotation_x to determine the rotate
         direction of the device along the X-axis.
         """,
-    ]
+    ] = SystemVariable("pRotationX")
     protation_y: Annotated[
         float,
         """The system variable protation_y always contains the rotation of the
@@ -177,7 +209,7 @@ class SystemVariables:
         protation_y can also be used with rotation_y to determine the rotate
         direction of the device along the Y-axis.
         """,
-    ]
+    ] = SystemVariable("pRotationY")
     protation_z: Annotated[
         float,
         """The system variable protation_z always contains the rotation of the
@@ -188,7 +220,7 @@ class SystemVariables:
         protation_z can also be used with rotation_z to determine the rotate
         direction of the device along the Z-axis.
         """,
-    ]
+    ] = SystemVariable("pRotationZ")
     turn_axis: Annotated[
         str,
         """When a device is rotated, the axis that triggers the device_turned()
@@ -196,7 +228,7 @@ class SystemVariables:
         The turn_axis variable is only defined within the scope of
         device_turned().
         """,
-    ]
+    ] = SystemVariable("turnAxis")
     # device_moved
     # device_turned
     # device_shaken
@@ -205,7 +237,7 @@ class SystemVariables:
         """The boolean system variable is_key_pressed is True if any key is
         pressed and False if no keys are pressed.
         """,
-    ]
+    ] = SystemVariable("keyIsPressed")
     key: Annotated[
         str,
         """The system variable key always contains the value of the most recent
@@ -213,7 +245,7 @@ class SystemVariables:
         To get the proper capitalization, it is best to use it within key_typed().
         For non-ASCII keys, use the key_code variable.
         """,
-    ]
+    ] = SystemVariable("key")
     key_code: Annotated[
         int,
         """The variable key_code is used to detect special keys such as BACKSPACE,
@@ -223,19 +255,19 @@ class SystemVariables:
         You can also check for custom keys by looking up the key_code of any key
         on a site like this: keycode.info.
         """,
-    ]
+    ] = SystemVariable("keyCode")
     moved_x: Annotated[
         float,
         """The variable moved_x contains the horizontal movement of the mouse
         since the last frame.
         """,
-    ]
+    ] = SystemVariable("movedX")
     moved_y: Annotated[
         float,
         """The variable moved_y contains the vertical movement of the mouse since
         the last frame.
         """,
-    ]
+    ] = SystemVariable("movedY")
     mouse_x: Annotated[
         float,
         """The system variable mouse_x always contains the current horizontal
@@ -245,7 +277,7 @@ class SystemVariables:
         If touch is used instead of mouse input, mouse_x will hold the x value of
         the most recent touch point.
         """,
-    ]
+    ] = SystemVariable("mouseX")
     mouse_y: Annotated[
         float,
         """The system variable mouse_y always contains the current vertical
@@ -255,7 +287,7 @@ class SystemVariables:
         If touch is used instead of mouse input, mouse_y will hold the y value of
         the most recent touch point.
         """,
-    ]
+    ] = SystemVariable("mouseY")
     pmouse_x: Annotated[
         float,
         """The system variable pmouse_x always contains the horizontal position of
@@ -265,7 +297,7 @@ class SystemVariables:
         Note: pmouse_x will be reset to the current mouse_x value at the start of
         each touch event.
         """,
-    ]
+    ] = SystemVariable("pmouseX")
     pmouse_y: Annotated[
         float,
         """The system variable pmouse_y always contains the vertical position of
@@ -275,19 +307,19 @@ class SystemVariables:
         Note: pmouse_y will be reset to the current mouse_y value at the start of
         each touch event.
         """,
-    ]
+    ] = SystemVariable("pmouseY")
     winmouse_x: Annotated[
         float,
         """The system variable winmouse_x always contains the current horizontal
         position of the mouse, relative to (0, 0) of the window.
         """,
-    ]
+    ] = SystemVariable("winMouseX")
     winmouse_y: Annotated[
         float,
         """The system variable winmouse_y always contains the current vertical
         position of the mouse, relative to (0, 0) of the window.
         """,
-    ]
+    ] = SystemVariable("winMouseY")
     pwinmouse_x: Annotated[
         float,
         """The system variable pwinmouse_x always contains the horizontal position
@@ -295,7 +327,7 @@ class SystemVariables:
         (0, 0) of the window. Note: pwinmouse_x will be reset to the current
         winmouse_x value at the start of each touch event.
         """,
-    ]
+    ] = SystemVariable("pwinMouseX")
     pwinmouse_y: Annotated[
         float,
         """The system variable pwinmouse_y always contains the vertical position
@@ -303,7 +335,7 @@ class SystemVariables:
         (0, 0) of the window. Note: pwinmouse_y will be reset to the current
         winmouse_y value at the start of each touch event.
         """,
-    ]
+    ] = SystemVariable("pwinMouseY")
     mouse_button: Annotated[
         str,
         """p5 automatically tracks if the mouse button is pressed and which button
@@ -311,13 +343,13 @@ class SystemVariables:
         RIGHT, or CENTER depending on which button was pressed last. Warning:
         different browsers may track mouse_button differently.
         """,
-    ]
+    ] = SystemVariable("mouseButton")
     is_mouse_pressed: Annotated[
         bool,
         """The boolean system variable is_mouse_pressed is True if the mouse is
         pressed and False if not.
         """,
-    ]
+    ] = SystemVariable("mouseIsPressed")
     # touch_started
     # touch_moved
     # touch_ended
@@ -331,7 +363,7 @@ class SystemVariables:
         The touches[] list is not supported on Safari and IE on touch-based
         desktops (laptops).
         """,
-    ]
+    ] = SystemVariable("touches")
 
     pixels: Annotated[
         list[float],
@@ -348,48 +380,61 @@ class SystemVariables:
         values of the pixel at (0, 0). The second four values (indices 4-7) will
         contain the R, G, B, A values of the pixel at (1, 0).
         """,
-    ]
+    ] = SystemVariable("pixels")
 
     def _update_system_variables(self):
-        # Environment
-        self.frame_count = self._p5js.frameCount
-        self.delta_time = self._p5js.deltaTime
-        self.focused = self._p5js.focused
-        self.display_width = self._p5js.displayWidth
-        self.display_height = self._p5js.displayHeight
-        self.window_width = self._p5js.windowWidth
-        self.window_height = self._p5js.windowHeight
-        self.width = self._p5js.width
-        self.height = self._p5js.height
-        # Events
-        self.device_orientation = self._p5js.deviceOrientation
-        self.acceleration_x = self._p5js.accelerationX
-        self.acceleration_y = self._p5js.accelerationY
-        self.acceleration_z = self._p5js.accelerationZ
-        self.pacceleration_x = self._p5js.pAccelerationX
-        self.pacceleration_y = self._p5js.pAccelerationY
-        self.pacceleration_z = self._p5js.pAccelerationZ
-        self.rotation_x = self._p5js.rotationX
-        self.rotation_y = self._p5js.rotationY
-        self.rotation_z = self._p5js.rotationZ
-        self.protation_x = self._p5js.pRotationX
-        self.protation_y = self._p5js.pRotationY
-        self.protation_z = self._p5js.pRotationZ
-        self.turn_axis = self._p5js.turnAxis
-        self.is_key_pressed = self._p5js.keyIsPressed
-        self.key = self._p5js.key
-        self.key_code = self._p5js.keyCode
-        self.moved_x = self._p5js.movedX
-        self.moved_y = self._p5js.movedY
-        self.mouse_x = self._p5js.mouseX
-        self.mouse_y = self._p5js.mouseY
-        self.pmouse_x = self._p5js.pmouseX
-        self.pmouse_y = self._p5js.pmouseY
-        self.winmouse_x = self._p5js.winMouseX
-        self.winmouse_y = self._p5js.winMouseY
-        self.pwinmouse_x = self._p5js.pwinMouseX
-        self.pwinmouse_y = self._p5js.pwinMouseY
-        self.mouse_button = self._p5js.mouseButton
-        self.is_mouse_pressed = self._p5js.mouseIsPressed
-        self.touches = self._p5js.touches
-        self.pixels = self._p5js.pixels
+        if self._packed_system_variables:
+            # Copy every numeric variable out of p5 with a single call.
+            snapshot = self._p5js._procesoSnapshot().to_bytes()
+            cache = dict(zip(_PACKED_NAMES, _SNAPSHOT.unpack(snapshot)))
+            for name, kind in _PACKED_CONVERSIONS:
+                # Undefined values arrive as NaN, which int() can't convert.
+                value = cache[name]
+                cache[name] = kind(value) if math.isfinite(value) else kind()
+            self._system_variables = cache
+        else:
+            # Values are read from p5 on first use, so starting a new frame
+            # only needs to forget the previous frame's values.
+            self._system_variables = {}
+
+    def _update_input_variables(self):
+        # Called before each event function. Only the input variables are
+        # forgotten, and they're read again from p5 if the handler uses them.
+        cache = self._system_variables
+        for name in INPUT_SYSTEM_VARIABLES:
+            cache.pop(name, None)
+
+
+# System variables that can change between frames as input events arrive.
+INPUT_SYSTEM_VARIABLES = (
+    "is_key_pressed",
+    "key",
+    "key_code",
+    "moved_x",
+    "moved_y",
+    "mouse_x",
+    "mouse_y",
+    "pmouse_x",
+    "pmouse_y",
+    "winmouse_x",
+    "winmouse_y",
+    "pwinmouse_x",
+    "pwinmouse_y",
+    "mouse_button",
+    "is_mouse_pressed",
+    "touches",
+)
+
+# System variables with numeric values, in the order that
+# p5.prototype._procesoSnapshot() packs them into a Float64Array.
+PACKED_SYSTEM_VARIABLES = tuple(
+    (name, kind)
+    for name, hint in SystemVariables.__annotations__.items()
+    if isinstance(SystemVariables.__dict__.get(name), SystemVariable)
+    and (kind := get_args(hint)[0]) in (int, float, bool)
+)
+_PACKED_NAMES = tuple(name for name, _ in PACKED_SYSTEM_VARIABLES)
+_PACKED_CONVERSIONS = tuple(
+    (name, kind) for name, kind in PACKED_SYSTEM_VARIABLES if kind is not float
+)
+_SNAPSHOT = struct.Struct(f"={len(PACKED_SYSTEM_VARIABLES)}d")
@@ -1,7 +1,8 @@
 import collections
-from pyodide.ffi import to_js
+from .backend import to_js
 
 from .binding import BaseSketch
+from .utils import vector_args
 
 
 class Transform(BaseSketch):
@@ -152,7 +153,7 @@ class Transform(BaseSketch):
         """
         self._p5js.shearY(angle)
 
-    def translate(self, x: float, y: float, z: float | None = None):
+    def translate(self, x: float, y: float | None = None, z: float | None = None):
         """Specifies an amount to displace objects within the display window.
         The x parameter specifies left/right translation, the y parameter
         specifies up/down translation.
@@ -162,6 +163,9 @@ class Transform(BaseSketch):
         calling translate(50, 0) and then translate(20, 0) is the same as
         translate(70, 0). If translate() is called within draw(), the
         transformation is reset when the loop begins again. This function can be
-        further controlled by using push() and pop().
+        further controlled by using push() and pop(). The first parameter can also
+        be a 2D or 3D vector, in which case the others are left out.
         """
+        if y is None:
+            x, y, z = vector_args(x)
         self._p5js.translate(x, y, z)
@@ -1,10 +1,20 @@
-import js
+from .backend import remove_instance
+from .proxies import destroy_registry
 
 
 def remove_sketch(id: str):
-    """Removes an existing sketch from the DOM."""
-    try:
-        old_sketch = getattr(js.window, id)
-        old_sketch.remove()
-    except AttributeError:
-        pass
+    """Removes an existing sketch from the DOM and destroys its proxies."""
+    destroy_registry(id)
+    remove_instance(id)
+
+
+def vector_args(value) -> tuple[float, float, float | None]:
+    """Returns the x, y, and z arguments for a 2D or 3D vector, with None for z in 2D."""
+    values = value.tolist() if hasattr(value, "tolist") else list(value)
+    if len(values) == 2:
+        return values[0], values[1], None
+    elif len(values) == 3:
+        return values[0], values[1], values[2]
+    raise RuntimeError(
+        f"Cannot use {len(values)} values as coordinates, expected a 2D or 3D vector"
+    )
@@ -0,0 +1,28 @@
+import pytest
+
+from proceso.backend.headless import HeadlessP5
+
+
+class RecordingP5(HeadlessP5):
+    """Logs the p5 methods that are called, in order."""
+
+    def __init__(self):
+        super().__init__()
+        self.log = []
+
+    def __getattr__(self, name: str):
+        method = super().__getattr__(name)
+
+        def record(*args):
+            while args and args[-1] is None:
+                args = args[:-1]
+            self.log.append((name, args))
+            return method(*args)
+
+        return record
+
+
+@pytest.fixture
+def p5js():
+    """A headless p5 instance that logs its method calls."""
+    return RecordingP5()
@@ -0,0 +1,22 @@
+import math
+
+from proceso import Sketch
+
+
+def test_angle_mode_is_kept_per_sketch():
+    first = Sketch(id="first")
+    headings = []
+
+    def setup():
+        first.angle_mode(first.DEGREES)
+
+    def draw():
+        headings.append(first.Vector(0, 1).heading)
+
+    first.run_sketch(setup=setup, draw=draw)
+    second = Sketch(id="second")
+    second.run_sketch(draw=lambda: headings.append(second.Vector(0, 1).heading))
+    first.redraw()
+    second.redraw()
+    assert math.isclose(headings[-2], 90)
+    assert math.isclose(headings[-1], math.pi / 2)
@@ -0,0 +1,56 @@
+from proceso.buffer import CommandBuffer
+
+
+def test_commands_are_replayed_in_order_on_flush(p5js):
+    buffer = CommandBuffer(p5js)
+    buffer.fill("red")
+    buffer.rect(1, None, 3)
+    buffer.ellipse(4, 5, 6, None)
+    buffer.push()
+    assert p5js.log == []
+    assert len(buffer) > 0
+    buffer.flush()
+    assert p5js.log == [
+        ("fill", ("red",)),
+        ("rect", (1, None, 3)),
+        ("ellipse", (4, 5, 6)),
+        ("push", ()),
+    ]
+    assert p5js.calls["_procesoReplay"] == 1
+    assert len(buffer) == 0
+
+
+def test_other_members_flush_first(p5js):
+    buffer = CommandBuffer(p5js)
+    buffer.fill(1)
+    buffer.text("a", 2, 3)
+    assert [name for name, _ in p5js.log] == ["fill", "text"]
+
+
+def test_passthrough_members_do_not_flush(p5js):
+    buffer = CommandBuffer(p5js)
+    buffer.fill(1)
+    assert buffer.width == 100
+    assert p5js.log == []
+
+
+def test_unrecordable_arguments_keep_order(p5js):
+    buffer = CommandBuffer(p5js)
+    image = object()
+    buffer.stroke(1)
+    buffer.fill(image)
+    buffer.rect(0, 0, 1, 1)
+    buffer.flush()
+    assert p5js.log == [
+        ("stroke", (1,)),
+        ("fill", (image,)),
+        ("rect", (0, 0, 1, 1)),
+    ]
+
+
+def test_attributes_are_set_and_deleted_on_p5(p5js):
+    buffer = CommandBuffer(p5js)
+    buffer.custom = 5
+    assert p5js.custom == 5
+    del buffer.custom
+    assert "custom" not in vars(p5js)
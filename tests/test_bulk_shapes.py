@@ -0,0 +1,52 @@
+import numpy as np
+import pytest
+
+from proceso import Sketch
+
+
+@pytest.fixture
+def p5(p5js):
+    sketch = Sketch(id="bulk")
+    sketch._bind_p5js(p5js, buffered=False)
+    return sketch
+
+
+def calls_of(p5, draw) -> list:
+    p5._p5js.log.clear()
+    draw()
+    return list(p5._p5js.log)
+
+
+@pytest.mark.parametrize(
+    "bulk, single, width",
+    [
+        ("circles", "circle", 3),
+        ("rects", "rect", 4),
+        ("points", "point", 2),
+        ("points", "point", 3),
+        ("lines", "line", 4),
+        ("lines", "line", 6),
+    ],
+)
+def test_bulk_matches_single_calls(p5, bulk, single, width):
+    data = np.arange(5 * width, dtype=float).reshape(5, width) / 3
+    expected = calls_of(p5, lambda: [getattr(p5, single)(*row) for row in data])
+    assert calls_of(p5, lambda: getattr(p5, bulk)(data)) == expected
+    assert p5._p5js.calls["_procesoBulk"] == 1
+
+
+def test_bulk_broadcasts_columns(p5):
+    xs = np.array([1.0, 2.0, 3.0])
+    expected = calls_of(p5, lambda: [p5.circle(x, 5, 10) for x in xs])
+    assert calls_of(p5, lambda: p5.circles(xs, 5, 10)) == expected
+
+
+def test_bulk_with_no_rows_draws_nothing(p5):
+    assert calls_of(p5, lambda: p5.rects(np.zeros((0, 4)))) == []
+
+
+def test_bulk_rejects_wrong_shapes(p5):
+    with pytest.raises(RuntimeError):
+        p5.circles(np.zeros((4, 2)))
+    with pytest.raises(RuntimeError):
+        p5.lines(np.zeros(4), None, np.zeros(4))
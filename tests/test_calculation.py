@@ -0,0 +1,78 @@
+import math
+
+import pytest
+
+from proceso import Sketch
+
+
+@pytest.fixture(scope="module")
+def p5():
+    return Sketch(id="calculation")
+
+
+# Expected values are what p5.js 1.9 returns for the same arguments.
+@pytest.mark.parametrize(
+    "args, expected",
+    [
+        ((25, 0, 100, 0, 200), 50),
+        ((0.5, 0, 1, 10, 20), 15),
+        ((150, 0, 100, 0, 10), 15),
+        ((150, 0, 100, 0, 10, True), 10),
+        ((-5, 0, 10, 10, 0, True), 10),
+        ((15, 0, 10, 10, 0, True), 0),
+        ((5, 1, 1, 0, 10), math.inf),
+        ((-5, 1, 1, 0, 10), -math.inf),
+    ],
+)
+def test_remap(p5, args, expected):
+    assert p5.remap(*args) == expected
+
+
+def test_remap_of_an_empty_range_at_its_start_is_nan(p5):
+    assert math.isnan(p5.remap(1, 1, 1, 0, 10))
+
+
+@pytest.mark.parametrize(
+    "args, expected",
+    [
+        ((2.5,), 3),
+        ((-2.5,), -2),
+        ((0.5,), 1),
+        ((-0.5,), 0),
+        ((133.8,), 134),
+        ((1.25, 1), 1.3),
+        ((2.345, 1), 2.3),
+        ((1.005, 2), 1.0),
+    ],
+)
+def test_round_half_up(p5, args, expected):
+    assert p5.round(*args) == expected
+
+
+@pytest.mark.parametrize(
+    "n, expected",
+    [
+        (1.1, 0.1),
+        (3.75, 0.75),
+        (-1.25, 0.75),
+        (5, 0),
+        (-3, 0),
+        (0.3, 0.3),
+        (1e-7, 1e-7),
+        (1e21, 0),
+    ],
+)
+def test_fract(p5, n, expected):
+    assert p5.fract(n) == expected
+
+
+def test_fract_of_non_finite_values(p5):
+    assert p5.fract(math.inf) == math.inf
+    assert math.isnan(p5.fract(math.nan))
+
+
+def test_norm_and_lerp(p5):
+    assert p5.norm(20, 0, 50) == 0.4
+    assert p5.norm(5, 0, 0) == math.inf
+    assert p5.lerp(0, 10, 0.25) == 2.5
+    assert p5.constrain(12, 0, 10) == 10
@@ -0,0 +1,50 @@
+import numpy as np
+import pytest
+
+from proceso.math.slotted_vector import SlottedVector
+from proceso.math.vector import Vector
+from proceso.math.vector_array import VectorArray
+
+
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+def test_vectors_share_memory(dtype):
+    v = Vector(1, 2, 3, dtype=dtype)
+    buffer = v.to_js_buffer()
+    assert buffer.dtype == dtype
+    v.x = 10
+    assert buffer[0] == 10
+
+
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+def test_vector_arrays_share_memory(dtype):
+    array = VectorArray(count=4, dim=2, dtype=dtype)
+    buffer = array.to_js_buffer()
+    assert buffer.dtype == dtype
+    array.x = 5
+    assert np.shares_memory(buffer, array.data)
+    assert (np.asarray(buffer).reshape(4, 2)[:, 0] == 5).all()
+
+
+def test_non_contiguous_rows_are_copied():
+    array = VectorArray(np.arange(12, dtype=np.float64).reshape(6, 2))
+    every_other = array[::2]
+    buffer = every_other.to_js_buffer()
+    assert not np.shares_memory(buffer, array.data)
+    assert np.asarray(buffer).reshape(3, 2).tolist() == every_other.tolist()
+
+
+@pytest.mark.parametrize("dtype", [np.float16, np.longdouble])
+def test_other_dtypes_are_rejected(dtype):
+    if np.dtype(dtype) == np.float64:
+        pytest.skip("longdouble is float64 on this platform")
+    with pytest.raises(RuntimeError):
+        Vector(1, 2, dtype=dtype).to_js_buffer()
+    with pytest.raises(RuntimeError):
+        VectorArray(count=2, dim=2, dtype=dtype).to_js_buffer()
+
+
+def test_slotted_vectors_are_copied_as_float64():
+    v = SlottedVector(1.0, 2.0)
+    buffer = v.to_js_buffer()
+    assert buffer.dtype == np.float64
+    assert buffer.tolist() == [1, 2]
@@ -0,0 +1,34 @@
+import numpy as np
+import pytest
+
+from proceso.math.vector import Vector
+from proceso.math.vector_array import VectorArray
+
+
+@pytest.mark.parametrize("amt", [0.0, 0.3, 0.75, 1.0, 1.5])
+@pytest.mark.parametrize("target", ["new", "self", "other"])
+def test_vector_lerp_out_matches_allocating_path(amt, target):
+    a = Vector(0.1, 0.2, 0.7)
+    b = Vector(1.3, -4.1, 1e20)
+    expected = a.lerp(b, amt)
+    out = {"new": Vector(0, 0, 0), "self": a, "other": b}[target]
+    assert a.lerp(b, amt, out=out) is out
+    assert np.array_equal(out.data, expected.data)
+
+
+def test_vector_lerp_out_keeps_precision():
+    a = Vector(0.1, 0.2)
+    a.lerp(Vector(1e20, 1e20), 0.0, out=a)
+    assert a.data.tolist() == [0.1, 0.2]
+
+
+@pytest.mark.parametrize("target", ["new", "self", "other"])
+def test_vector_array_lerp_out_matches_allocating_path(target):
+    rng = np.random.default_rng(3)
+    a = VectorArray(rng.normal(size=(50, 3)))
+    b = VectorArray(rng.normal(size=(50, 3)) * 1e6)
+    amt = rng.random(50)
+    expected = a.lerp(b, amt)
+    out = {"new": VectorArray(np.zeros((50, 3))), "self": a, "other": b}[target]
+    assert a.lerp(b, amt, out=out) is out
+    assert np.array_equal(out.data, expected.data)
@@ -0,0 +1,97 @@
+import numpy as np
+import pytest
+
+from proceso import Sketch
+
+
+@pytest.fixture
+def p5():
+    return Sketch(id="random")
+
+
+def draws(p5) -> list:
+    return [
+        p5.random(),
+        p5.random(5, 10),
+        p5.random_gaussian(3, 2),
+        p5.random_choice(["a", "b", "c"]),
+        p5.shuffle(list(range(10))),
+        p5.random(size=4).tolist(),
+    ]
+
+
+def test_seed_makes_results_reproducible(p5):
+    p5.random_seed(99)
+    first = draws(p5)
+    p5.random_seed(99)
+    assert draws(p5) == first
+    p5.random_seed(100)
+    assert draws(p5) != first
+
+
+def test_float_seeds_are_distinct(p5):
+    p5.random_seed(0.5)
+    first = p5.random()
+    p5.random_seed(0.25)
+    assert p5.random() != first
+
+
+def test_sketches_have_separate_generators():
+    a, b = Sketch(id="a"), Sketch(id="b")
+    a.random_seed(1)
+    expected = [a.random() for _ in range(3)]
+    a.random_seed(1)
+    b.random_seed(2)
+    values = []
+    for _ in range(3):
+        values.append(a.random())
+        b.random()
+    assert values == expected
+
+
+@pytest.mark.parametrize(
+    "args, low, high",
+    [((), 0, 1), ((10,), 0, 10), ((5, 10), 5, 10), ((10, 0), 0, 10)],
+)
+def test_random_ranges(p5, args, low, high):
+    values = p5.random(*args, size=(200, 2))
+    assert values.shape == (200, 2)
+    assert ((values >= low) & (values <= high)).all()
+    assert low <= p5.random(*args) <= high
+
+
+def test_random_of_a_list_picks_an_element(p5):
+    assert p5.random([1, 2, 3]) in (1, 2, 3)
+    assert set(p5.random([1, 2, 3], size=50)) <= {1, 2, 3}
+
+
+def test_random_gaussian_size(p5):
+    p5.random_seed(4)
+    values = p5.random_gaussian(10, 0.1, size=5000)
+    assert values.shape == (5000,)
+    assert abs(values.mean() - 10) < 0.01
+    assert p5.random_gaussian() != p5.random_gaussian()
+
+
+def test_random_choice(p5):
+    choices = ["a", "b", "c", "d"]
+    assert p5.random_choice(choices) in choices
+    picked = p5.random_choice(choices, 4, replace=False)
+    assert isinstance(picked, list)
+    assert sorted(picked) == choices
+    array = np.arange(10)
+    assert isinstance(p5.random_choice(array, 3), np.ndarray)
+    with pytest.raises(RuntimeError):
+        p5.random_choice([])
+
+
+def test_shuffle(p5):
+    values = list(range(20))
+    shuffled = p5.shuffle(values)
+    assert shuffled is not values
+    assert sorted(shuffled) == values
+    assert values == list(range(20))
+    assert p5.shuffle(values, modify=True) is values
+    points = np.arange(20).reshape(10, 2)
+    rows = p5.shuffle(points)
+    assert sorted(rows.tolist()) == points.tolist()
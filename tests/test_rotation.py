@@ -0,0 +1,79 @@
+import numpy as np
+import pytest
+
+from proceso.math.rotation import rotate_vectors, rotation_matrix
+from proceso.math.vector import Vector
+from proceso.math.vector_array import VectorArray
+
+ANGLES = [0.0, 0.3, -1.2, np.pi, 7.5]
+
+
+def old_axis_matrix(angle, axis):
+    """The matrices Vector3D.rotate() built for every call before caching."""
+    s, c = np.sin(angle), np.cos(angle)
+    if axis in [1, "x"]:
+        return np.array([[1, 0, 0], [0, c, -s], [0, s, c]])
+    elif axis in [2, "y"]:
+        return np.array([[c, 0, s], [0, 1, 0], [-s, 0, c]])
+    return np.array([[c, -s, 0], [s, c, 0], [0, 0, 1]])
+
+
+def old_around_matrix(angle, v):
+    """The matrix Vector3D.rotate_around() built for every call before caching."""
+    ux, uy, uz = v / np.linalg.norm(v)
+    s, c = np.sin(angle), np.cos(angle)
+    t = 1 - c
+    return np.array(
+        [
+            [c + ux * ux * t, ux * uy * t - uz * s, ux * uz * t + uy * s],
+            [uy * ux * t + uz * s, c + uy * uy * t, uy * uz * t - ux * s],
+            [uz * ux * t - uy * s, uz * uy * t + ux * s, c + uz * uz * t],
+        ]
+    )
+
+
+@pytest.mark.parametrize("angle", ANGLES)
+def test_2d_rotation_matches_old_path(angle):
+    s, c = np.sin(angle), np.cos(angle)
+    expected = np.array([[c, -s], [s, c]]) @ np.array([1.5, -2.0])
+    assert np.allclose(Vector(1.5, -2.0).rotate(angle).data, expected)
+
+
+@pytest.mark.parametrize("angle", ANGLES)
+@pytest.mark.parametrize("axis", [1, 2, 3, "x", "y", "z"])
+def test_axis_rotation_matches_old_path(angle, axis):
+    data = np.array([1.5, -2.0, 0.5])
+    expected = old_axis_matrix(angle, axis) @ data
+    assert np.allclose(Vector(*data).rotate(angle, axis).data, expected)
+    assert np.allclose(rotation_matrix(angle, axis), old_axis_matrix(angle, axis))
+
+
+@pytest.mark.parametrize("angle", ANGLES)
+def test_rotate_around_matches_old_path(angle):
+    data, axis = np.array([1.5, -2.0, 0.5]), np.array([0.2, 1.0, -3.0])
+    expected = old_around_matrix(angle, axis) @ data
+    result = Vector(*data).rotate_around(angle, Vector(*axis))
+    assert np.allclose(result.data, expected)
+
+
+def test_matrices_are_cached_and_read_only():
+    first = rotation_matrix(0.25, "y")
+    assert rotation_matrix(0.25, 2) is first
+    with pytest.raises(ValueError):
+        first[0, 0] = 5
+
+
+def test_rotate_vectors_matches_single_vectors():
+    data = np.random.default_rng(5).normal(size=(8, 3))
+    expected = [Vector(*row).rotate(0.7, "z").tolist() for row in data]
+    assert np.allclose(rotate_vectors(data, 0.7, "z"), expected)
+    array = VectorArray(data)
+    assert rotate_vectors(array, 0.7, "z", out=array) is array
+    assert np.allclose(array.data, expected)
+
+
+def test_vector_array_rotate_per_vector_angles():
+    data = np.random.default_rng(6).normal(size=(5, 2))
+    angles = np.linspace(0, 3, 5)
+    expected = [Vector(*row).rotate(a).tolist() for row, a in zip(data, angles)]
+    assert np.allclose(VectorArray(data).rotate(angles).data, expected)
@@ -0,0 +1,22 @@
+from proceso import Sketch
+
+
+def test_rerun_without_draw_clears_old_callbacks():
+    p5 = Sketch(id="rerun")
+    frames = []
+    p5.run_sketch(setup=lambda: None, draw=lambda: frames.append(1))
+    p5.run_sketch(setup=lambda: None)
+    p5.redraw()
+    assert len(frames) == 1
+    assert p5.proxy_count == 1
+
+
+def test_rerun_replaces_callbacks():
+    p5 = Sketch(id="rerun")
+    calls = []
+    p5.run_sketch(draw=lambda: calls.append("old"), mouse_pressed=lambda: None)
+    p5.run_sketch(draw=lambda: calls.append("new"))
+    p5.redraw()
+    assert calls[-1] == "new"
+    assert "old" not in calls[1:]
+    assert p5.proxy_count == 1
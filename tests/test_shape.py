@@ -0,0 +1,28 @@
+import numpy as np
+import pytest
+
+from proceso import Sketch
+
+
+def test_vertices_ignores_duplicate_contours():
+    p5 = Sketch(id="shape")
+    points = np.arange(16, dtype=float).reshape(8, 2)
+    p5.begin_shape()
+    p5.vertices(points, contours=[4, 4, 6, 4])
+    p5.end_shape()
+    assert p5._p5js.replayed["beginContour"] == 2
+    assert p5._p5js.replayed["vertex"] == 8
+
+
+@pytest.mark.parametrize("start", [0, 8, -1])
+def test_vertices_rejects_out_of_range_contours(start):
+    p5 = Sketch(id="shape")
+    points = np.zeros((8, 2))
+    with pytest.raises(RuntimeError):
+        p5.vertices(points, contours=[start])
+
+
+def test_bezier_vertices_rejects_contours():
+    p5 = Sketch(id="shape")
+    with pytest.raises(ValueError):
+        p5.bezier_vertices(np.zeros((6, 2)), contours=[3])
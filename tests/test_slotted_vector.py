@@ -0,0 +1,89 @@
+import numpy as np
+import pytest
+
+from proceso.math.slotted_vector import (
+    SlottedVector,
+    SlottedVector2D,
+    SlottedVector3D,
+)
+from proceso.math.vector import Vector
+
+OPERATIONS = {
+    "add": lambda a, b: a + b,
+    "sub": lambda a, b: a - b,
+    "mul": lambda a, b: a * 2.5,
+    "rmul": lambda a, b: 2.5 * a,
+    "div": lambda a, b: a / 4,
+    "neg": lambda a, b: -a,
+    "mag": lambda a, b: a.mag,
+    "mag_sq": lambda a, b: a.mag_sq,
+    "dist": lambda a, b: a.dist(b),
+    "dot": lambda a, b: a.dot(b),
+    "angle_between": lambda a, b: a.angle_between(b),
+    "lerp": lambda a, b: a.lerp(b, 0.3),
+    "add_scaled": lambda a, b: a.copy.add_scaled(b, 0.5),
+    "normalize": lambda a, b: a.copy.normalize(),
+    "set_mag": lambda a, b: a.copy.set_mag(7),
+    "set_limit": lambda a, b: a.copy.set_limit(1),
+    "heading": lambda a, b: a.heading,
+    "swizzle": lambda a, b: a.yx,
+    "iadd": lambda a, b: _iadd(a.copy, b),
+}
+
+
+def _iadd(a, b):
+    a += b
+    return a
+
+
+def _values(result):
+    if isinstance(result, (SlottedVector, Vector)):
+        return result.tolist()
+    return result
+
+
+@pytest.mark.parametrize("name", OPERATIONS)
+@pytest.mark.parametrize("dim", [2, 3])
+def test_matches_numpy_vectors(name, dim):
+    a, b = [1.5, -2.0, 0.75][:dim], [-0.5, 3.0, 2.0][:dim]
+    op = OPERATIONS[name]
+    slotted = op(SlottedVector(*a), SlottedVector(*b))
+    expected = op(Vector(*a), Vector(*b))
+    assert np.allclose(_values(slotted), _values(expected))
+    if isinstance(expected, Vector):
+        assert isinstance(slotted, SlottedVector)
+
+
+def test_dimension_specific_methods_match():
+    a, b = SlottedVector(1.0, 2.0, 3.0), Vector(1.0, 2.0, 3.0)
+    assert np.allclose(
+        a.copy.rotate(0.5, "x").tolist(), b.copy.rotate(0.5, "x").tolist()
+    )
+    assert np.allclose(a.cross(SlottedVector(0.0, 1.0, 0.0)).tolist(), [-3, 0, 1])
+    c = SlottedVector(1.0, 0.0)
+    assert np.allclose(c.copy.rotate(np.pi / 2).tolist(), [0, 1])
+
+
+def test_constructor_picks_the_class():
+    assert type(SlottedVector(1, 2)) is SlottedVector2D
+    assert type(SlottedVector([1, 2, 3])) is SlottedVector3D
+    assert type(SlottedVector(1, 2, 3, 4)) is type(Vector(1, 2, 3, 4))
+
+
+def test_mixes_with_numpy_vectors_and_arrays():
+    a = SlottedVector(1.0, 2.0)
+    assert (a + Vector(1.0, 1.0)).tolist() == [2, 3]
+    assert (a + np.array([1.0, 1.0])).tolist() == [2, 3]
+    assert np.array_equal(np.asarray(a), [1, 2])
+    assert a == SlottedVector(1.0, 2.0)
+
+
+def test_data_is_a_copy():
+    a = SlottedVector(1.0, 2.0)
+    a.data[0] = 10
+    assert a.x == 1
+
+
+def test_division_by_zero_raises():
+    with pytest.raises(ZeroDivisionError):
+        SlottedVector(1.0, 2.0) / 0
@@ -0,0 +1,36 @@
+import numpy as np
+
+from proceso.math import HashGrid, KDTree
+
+
+def brute_knn(points, queries, k):
+    d2 = np.sum((queries[:, np.newaxis] - points[np.newaxis]) ** 2, axis=2)
+    return np.sort(d2, axis=1)[:, :k]
+
+
+def test_hash_grid_knn_sparse_2d():
+    rng = np.random.default_rng(0)
+    points = rng.random((12, 2)) * 1000
+    queries = rng.random((50, 2)) * 1200
+    grid = HashGrid(points, cell_size=0.01)
+    _, distances = grid.query_knn(queries, 3, return_distance=True)
+    np.testing.assert_allclose(distances**2, brute_knn(points, queries, 3))
+
+
+def test_hash_grid_knn_sparse_3d():
+    rng = np.random.default_rng(1)
+    points = rng.random((40, 3)) * 100
+    queries = rng.random((50, 3)) * 120
+    grid = HashGrid(points, cell_size=1)
+    indices = grid.query_knn(queries, 4)
+    np.testing.assert_array_equal(indices, KDTree(points).query_knn(queries, 4))
+
+
+def test_hash_grid_radius_matches_kd_tree():
+    rng = np.random.default_rng(2)
+    points = rng.random((500, 2)) * 720
+    queries = rng.random((20, 2)) * 720
+    grid = HashGrid(points, cell_size=25)
+    tree = KDTree(points)
+    for a, b in zip(grid.query_radius(queries, 40), tree.query_radius(queries, 40)):
+        np.testing.assert_array_equal(a, b)
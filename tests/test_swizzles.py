@@ -0,0 +1,58 @@
+import itertools
+
+import numpy as np
+import pytest
+
+from proceso.math.vector import Vector
+
+
+@pytest.mark.parametrize("dim", [2, 3, 4])
+def test_every_swizzle_reads_its_components(dim):
+    v = Vector(*range(1, dim + 1))
+    letters = "xyzw"[:dim]
+    for size in range(1, 5):
+        for combo in itertools.product(range(dim), repeat=size):
+            name = "".join(letters[i] for i in combo)
+            value = getattr(v, name)
+            expected = [v.data[i] for i in combo]
+            if size == 1:
+                assert value == expected[0]
+            else:
+                assert isinstance(value, Vector)
+                assert value.tolist() == expected
+
+
+def test_swizzle_assignment():
+    v = Vector(1, 2, 3)
+    v.zx = (30, 10)
+    assert v.tolist() == [10, 2, 30]
+    v.xy = 0
+    assert v.tolist() == [0, 0, 30]
+    v.y = 5
+    assert v.tolist() == [0, 5, 30]
+
+
+def test_swizzle_reads_are_copies():
+    v = Vector(1, 2, 3)
+    v.xy.x = 100
+    assert v.x == 1
+
+
+def test_invalid_swizzles():
+    v = Vector(1, 2, 3)
+    with pytest.raises(RuntimeError):
+        v.xx = (1, 2)
+    with pytest.raises(RuntimeError):
+        v.xy = (1, 2, 3)
+    with pytest.raises(RuntimeError):
+        v.xyzxy
+    with pytest.raises(AttributeError):
+        Vector(1, 2).z
+    with pytest.raises(AttributeError):
+        v.xq
+
+
+def test_non_swizzle_attributes_are_unaffected():
+    v = Vector(1, 2, 3)
+    assert np.array_equal(v.data, [1, 2, 3])
+    assert v.dim == 3
@@ -0,0 +1,12 @@
+import math
+
+from proceso import Sketch
+
+
+def test_packed_undefined_values_fall_back_to_zero():
+    p5 = Sketch(id="packed", system_variables="packed")
+    p5._p5js.keyCode = math.nan
+    p5._p5js.keyIsPressed = math.nan
+    p5._update_system_variables()
+    assert p5.key_code == 0
+    assert p5.is_key_pressed is False
@@ -0,0 +1,15 @@
+import math
+
+import pytest
+
+from proceso import Sketch
+
+
+@pytest.mark.parametrize("mode", ["RADIANS", "DEGREES"])
+@pytest.mark.parametrize("angle", [math.inf, -math.inf, math.nan])
+def test_non_finite_angles_return_nan(mode, angle):
+    p5 = Sketch(id="trig")
+    p5.angle_mode(getattr(p5, mode))
+    assert math.isnan(p5.sin(angle))
+    assert math.isnan(p5.cos(angle))
+    assert math.isnan(p5.tan(angle))
@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+
+from proceso.math.vector import Vector
+from proceso.math.vector_arena import VectorArena
+
+
+def test_new_sets_values():
+    arena = Vector.arena(4, 3)
+    assert isinstance(arena, VectorArena)
+    assert arena.new().tolist() == [0, 0, 0]
+    assert arena.new(1, 2, 3).tolist() == [1, 2, 3]
+    assert arena.new(Vector(4, 5, 6)).tolist() == [4, 5, 6]
+    assert len(arena) == 3
+    assert arena.data.tolist() == [[0, 0, 0], [1, 2, 3], [4, 5, 6]]
+
+
+def test_reset_hands_out_the_same_vectors():
+    arena = Vector.arena(3, 2)
+    first = [arena.new(i, i) for i in range(3)]
+    arena.reset()
+    assert len(arena) == 0
+    second = [arena.new() for _ in range(3)]
+    assert all(a is b for a, b in zip(first, second))
+    assert first[2].tolist() == [0, 0]
+
+
+def test_vectors_share_the_arena_memory():
+    arena = Vector.arena(2, 2)
+    v = arena.new(1, 2)
+    v += Vector(1.0, 1.0)
+    v.lerp(Vector(10.0, 10.0), 0.5, out=v)
+    assert arena.data.tolist() == [v.tolist()]
+    assert np.shares_memory(v.data, arena.data)
+
+
+def test_running_out_of_vectors_is_an_error():
+    arena = Vector.arena(1, 2)
+    arena.new()
+    with pytest.raises(RuntimeError):
+        arena.new()
+
+
+def test_dtype_and_validation():
+    assert Vector.arena(2, 2, dtype=np.float32).new(1, 2).data.dtype == np.float32
+    with pytest.raises(RuntimeError):
+        Vector.arena(0, 2)
+    with pytest.raises(RuntimeError):
+        Vector.arena(2, 5)
@@ -0,0 +1,85 @@
+import numpy as np
+import pytest
+
+from proceso.math.vector import Vector
+from proceso.math.vector_array import VectorArray
+
+
+@pytest.fixture
+def rows():
+    return np.random.default_rng(11).normal(size=(6, 3))
+
+
+def test_arithmetic_matches_vectors(rows):
+    array = VectorArray(rows)
+    other = Vector(1.5, -2.0, 0.25)
+    for result, op in [
+        (array + other, lambda v: v + other),
+        (array - other, lambda v: v - other),
+        (array * 3, lambda v: v * 3),
+        (array / 4, lambda v: v / 4),
+        (2 * array, lambda v: 2 * v),
+        (-array, lambda v: -v),
+    ]:
+        assert isinstance(result, VectorArray)
+        expected = [op(Vector(row)).tolist() for row in rows]
+        assert np.allclose(result.data, expected)
+
+
+def test_per_vector_scaling(rows):
+    array = VectorArray(rows)
+    factors = np.arange(1, 7)[:, np.newaxis]
+    assert np.allclose((array * factors).data, rows * factors)
+
+
+def test_in_place_operations_keep_the_array(rows):
+    array = VectorArray(rows)
+    data = array.data
+    array += VectorArray(rows)
+    array *= 0.5
+    assert array.data is data
+    assert np.allclose(data, rows)
+
+
+def test_vector_times_vector_array_is_an_error(rows):
+    with pytest.raises(RuntimeError):
+        VectorArray(rows) * Vector(1, 2, 3)
+    with pytest.raises(RuntimeError):
+        VectorArray(rows) + Vector(1, 2)
+
+
+def test_indexing_returns_views(rows):
+    array = VectorArray(rows)
+    vector = array[2]
+    vector.x = 100
+    assert array.data[2, 0] == 100
+    part = array[1:3]
+    part *= 0
+    assert not array.data[1:3].any()
+    array.y = 7
+    assert (array.data[:, 1] == 7).all()
+    array.z[0] = -1
+    assert array.data[0, 2] == -1
+
+
+def test_per_vector_methods_match_vectors(rows):
+    array = VectorArray(rows)
+    other = VectorArray(rows[::-1].copy())
+    vectors = [Vector(row) for row in rows]
+    others = [Vector(row) for row in rows[::-1]]
+    assert np.allclose(array.mag, [v.mag for v in vectors])
+    assert np.allclose(array.dist(other), [a.dist(b) for a, b in zip(vectors, others)])
+    assert np.allclose(array.dot(other), [a.dot(b) for a, b in zip(vectors, others)])
+    assert np.allclose(
+        array.cross(other).data, [a.cross(b).tolist() for a, b in zip(vectors, others)]
+    )
+    assert np.allclose(array.copy.normalize().mag, 1)
+    limited = array.copy.set_limit(0.5)
+    assert np.allclose(limited.data, [v.copy.set_limit(0.5).tolist() for v in vectors])
+
+
+def test_per_vector_methods_write_into_out(rows):
+    array = VectorArray(rows)
+    out = np.empty(len(rows))
+    assert array.dist(VectorArray(rows * 2), out=out) is out
+    assert np.allclose(out, np.linalg.norm(rows, axis=1))
@@ -0,0 +1,42 @@
+import numpy as np
+import pytest
+
+from proceso.math.vector import Vector, Vector2D, Vector3D, Vector4D
+
+
+@pytest.mark.parametrize(
+    "args, cls",
+    [((1, 2.5), Vector2D), ((1, 2, 3), Vector3D), ((1, 2, 3, 4.5), Vector4D)],
+)
+def test_fast_path_matches_general_path(args, cls):
+    fast = Vector(*args)
+    general = Vector(list(args))
+    assert type(fast) is cls
+    assert fast.data.dtype == general.data.dtype == Vector._default_dtype
+    assert np.array_equal(fast.data, general.data)
+    assert fast == general
+
+
+def test_fast_path_result_behaves_like_any_vector():
+    v = Vector(3, 4)
+    v.x = 6
+    v += Vector(1.0, 1.0)
+    assert v.tolist() == [7, 5]
+    assert Vector(3, 4).mag == 5
+
+
+def test_other_arguments_take_the_general_path():
+    assert Vector(1, 2, dtype=np.float32).data.dtype == np.float32
+    assert Vector(np.float32(1), 2).data.dtype == Vector._default_dtype
+    assert type(Vector(1, 2, dim=2)) is Vector2D
+    with pytest.raises(RuntimeError):
+        Vector(1, 2, dim=3)
+
+
+def test_from_data_shares_memory():
+    data = np.array([1.0, 2.0, 3.0])
+    v = Vector._from_data(data)
+    assert type(v) is Vector3D
+    assert v.data is data
+    v.z = 9
+    assert data[2] == 9
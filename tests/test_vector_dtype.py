@@ -0,0 +1,15 @@
+import numpy as np
+
+from proceso import Sketch
+
+
+def test_vector_dtype_is_kept_per_sketch():
+    first = Sketch(id="first", vector_dtype="float32")
+    dtypes = []
+    first.run_sketch(draw=lambda: dtypes.append(first.Vector(1, 2).data.dtype))
+    second = Sketch(id="second")
+    second.run_sketch(draw=lambda: dtypes.append(second.Vector(1, 2).data.dtype))
+    first.redraw()
+    second.redraw()
+    assert dtypes[-2] == np.float32
+    assert dtypes[-1] == np.float64
@@ -0,0 +1,33 @@
+import numpy as np
+
+from proceso import Sketch
+
+
+def _random_vectors(p5):
+    return p5.Vector.random(2).tolist() + p5.Vector.random(3).tolist()
+
+
+def test_vector_random_follows_sketch_seed():
+    for vectors in ("numpy", "python"):
+        p5 = Sketch(id="seeded", vectors=vectors)
+        p5.random_seed(42)
+        first = _random_vectors(p5)
+        p5.random_seed(42)
+        assert _random_vectors(p5) == first
+
+
+def test_vector_random_uses_running_sketch_generator():
+    seeded = Sketch(id="seeded", vectors="python")
+    results = []
+
+    def setup():
+        seeded.random_seed(7)
+
+    seeded.run_sketch(setup=setup, draw=lambda: results.append(_random_vectors(seeded)))
+    other = Sketch(id="other", vectors="python")
+    other.random_seed(1)
+    seeded.redraw()
+    seeded.random_seed(7)
+    expected = [_random_vectors(seeded) for _ in results]
+    assert len(results) >= 2
+    assert np.allclose(results, expected)